@@ -0,0 +1,87 @@
+"""
+Benchmark for block location lookups in FileParser.
+
+Writes one synthetic file with ``--blocks`` resource blocks and locates
+every block, comparing the one-pass block index against the former
+``FileParser.find_line_number`` line scan, which is quadratic in the block
+count.
+
+Usage:
+    python benchmarks/bench_block_index.py [--blocks N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from tfkit.analyzer.terraform_analyzer import FileParser
+
+
+def write_file(path, blocks):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(blocks):
+            f.write(
+                f'resource "aws_r{i % 50}_thing" "r{i}" {{\n'
+                f'  name = "r{i}"\n'
+                f"  tags = {{\n"
+                f'    Name = "r{i}"\n'
+                f"  }}\n"
+                f"}}\n\n"
+            )
+
+
+def find_line_number(lines, search_pattern, object_name):
+    """The former FileParser.find_line_number line scan."""
+    for i, line in enumerate(lines, 1):
+        if search_pattern in line and f'"{object_name}"' in line:
+            return i
+
+    for i, line in enumerate(lines, 1):
+        if search_pattern in line:
+            return i
+
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "main.tf")
+        write_file(path, args.blocks)
+        labels = [(f"aws_r{i % 50}_thing", f"r{i}") for i in range(args.blocks)]
+
+        file_parser = FileParser()
+        start = time.perf_counter()
+        file_parser.cache_file(path)
+        cache_time = time.perf_counter() - start
+
+        lines = file_parser.source.read(path).lines
+        start = time.perf_counter()
+        scanned = [
+            find_line_number(lines, f'resource "{res_type}"', name)
+            for res_type, name in labels
+        ]
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [
+            file_parser.locate_block(path, "resource", res_type, name)
+            for res_type, name in labels
+        ]
+        index_time = time.perf_counter() - start
+
+    assert indexed == scanned
+
+    print(f"blocks: {args.blocks}")
+    print(f"cache + index build:     {cache_time * 1000:10.1f} ms")
+    print(f"line scan lookups:       {scan_time * 1000:10.1f} ms")
+    print(f"block index lookups:     {index_time * 1000:10.1f} ms")
+    print(f"speedup:                 {scan_time / index_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
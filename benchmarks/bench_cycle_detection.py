@@ -0,0 +1,142 @@
+"""
+Benchmark for cycle detection.
+
+Builds a random dependency graph with ``--nodes`` nodes, a few planted
+cycles and one ``--depth`` deep reference chain, then compares the
+iterative strongly connected components search in tfkit.core.graph with
+the former recursive DFS, which copied its path at every edge. The
+recursive version runs with the default recursion limit, as the CLI does.
+
+It also times the SCC search on a hub-and-spoke cycle with ``--spokes``
+spokes (``h -> i -> h`` for every spoke ``i``), one component that needs a
+separate cycle per spoke.
+
+Usage:
+    python benchmarks/bench_cycle_detection.py [--nodes N] [--depth N] [--spokes N]
+"""
+
+import argparse
+import random
+import time
+
+from tfkit.core.graph import cycle_cover, cyclic_components
+
+
+def build_graph(nodes, depth, seed=0):
+    rng = random.Random(seed)
+    graph = {}
+
+    # Random edges pointing to earlier nodes only: no cycles by themselves
+    for i in range(nodes - depth):
+        graph[f"n{i}"] = [f"n{rng.randrange(i)}" for _ in range(min(i, 3))]
+
+    # Plant small cycles
+    for i in range(0, nodes - depth, 1000):
+        graph[f"n{i}"].append(f"n{min(i + 5, nodes - depth - 1)}")
+
+    # One deep chain hanging off the first node
+    previous = "n0"
+    for i in range(depth):
+        name = f"chain{i}"
+        graph[name] = [previous]
+        previous = name
+
+    return graph
+
+
+def build_hub(spokes):
+    graph = {"hub": [f"spoke{i}" for i in range(spokes)]}
+    for i in range(spokes):
+        graph[f"spoke{i}"] = ["hub"]
+    return graph
+
+
+def legacy_detect(graph):
+    """The former recursive DFS, stopping at the first cycle per root."""
+    circular_deps = {}
+    visited = set()
+    rec_stack = set()
+
+    def visit(name, path):
+        if name in rec_stack:
+            cycle_start = path.index(name)
+            return path[cycle_start:] + [name]
+        if name in visited:
+            return None
+
+        visited.add(name)
+        rec_stack.add(name)
+        path.append(name)
+
+        for dep in graph.get(name, ()):
+            cycle = visit(dep, path.copy())
+            if cycle:
+                return cycle
+
+        rec_stack.remove(name)
+        return None
+
+    for name in graph:
+        if name not in visited:
+            cycle = visit(name, [])
+            if cycle:
+                for member in cycle[:-1]:
+                    circular_deps.setdefault(member, cycle)
+
+    return circular_deps
+
+
+def detect(graph):
+    def successors(name):
+        return graph.get(name, ())
+
+    circular_deps = {}
+    for component in cyclic_components(graph, successors):
+        circular_deps.update(cycle_cover(component, successors))
+    return circular_deps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=5_000)
+    parser.add_argument("--spokes", type=int, default=32_000)
+    args = parser.parse_args()
+
+    graph = build_graph(args.nodes, args.depth)
+    # Visit the deep chain from its far end so the DFS has to go all the way
+    graph = dict(reversed(list(graph.items())))
+
+    start = time.perf_counter()
+    found = detect(graph)
+    scc_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        legacy = legacy_detect(graph)
+    except (RecursionError, ValueError) as e:
+        # ValueError: the early return left stale entries on rec_stack
+        legacy = type(e).__name__
+    legacy_time = time.perf_counter() - start
+
+    print(f"nodes: {len(graph)}  chain depth: {args.depth}")
+    print(f"SCC search:        {scc_time * 1000:10.1f} ms  ({len(found)} on cycles)")
+    if isinstance(legacy, str):
+        print(f"recursive DFS:     {legacy} after {legacy_time * 1000:.1f} ms")
+    else:
+        print(
+            f"recursive DFS:     {legacy_time * 1000:10.1f} ms  "
+            f"({len(legacy)} on cycles)"
+        )
+
+    hub = build_hub(args.spokes)
+    start = time.perf_counter()
+    found = detect(hub)
+    hub_time = time.perf_counter() - start
+
+    print(f"hub spokes: {args.spokes}")
+    print(f"SCC search:        {hub_time * 1000:10.1f} ms  ({len(found)} on cycles)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark for dependency-chain queries on diamond-heavy graphs.
+
+Builds a ladder of ``--rungs`` pairs of locals where each pair depends on
+both locals below it, so a resource on top has 2**rungs dependency chains.
+It times full enumeration with ``get_dependency_chain`` up to
+``--depth``, which walks 2**depth branches even when none of them reaches
+the bottom within the depth limit, bounded enumeration with
+``iter_dependency_chains(max_chains=...)`` and the linear-time count,
+shortest and longest chain queries over the whole ladder.
+
+Usage:
+    python benchmarks/bench_dependency_chains.py [--rungs N] [--depth N]
+"""
+
+import argparse
+import time
+
+from tfkit.analyzer.models import LocationInfo, ResourceType, TerraformObject
+from tfkit.analyzer.project import TerraformProject
+
+
+def make_object(resource_type, name, depends_on=()):
+    obj = TerraformObject(
+        type=resource_type,
+        name=name,
+        full_name=f"{resource_type.value}.{name}",
+        location=LocationInfo("main.tf", 1),
+    )
+    obj.dependency_info.explicit_dependencies = list(depends_on)
+    return obj
+
+
+def build_ladder(rungs):
+    project = TerraformProject("synthetic")
+    project.add_object(make_object(ResourceType.LOCAL, "bottom"))
+    below = ["local.bottom"]
+    for rung in range(rungs):
+        level = []
+        for side in ("a", "b"):
+            obj = make_object(ResourceType.LOCAL, f"r{rung}{side}", below)
+            project.add_object(obj)
+            level.append(obj.full_name)
+        below = level
+    project.add_object(make_object(ResourceType.RESOURCE, "top", below))
+    return project
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rungs", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=18)
+    parser.add_argument("--max-chains", type=int, default=1000)
+    args = parser.parse_args()
+
+    project = build_ladder(args.rungs)
+    top = "resource.top"
+
+    chains, full_time = timed(
+        lambda: project.get_dependency_chain(top, max_depth=args.depth)
+    )
+    bounded, bounded_time = timed(
+        lambda: list(
+            project.iter_dependency_chains(
+                top, max_depth=args.rungs + 1, max_chains=args.max_chains
+            )
+        )
+    )
+    counts, count_time = timed(project.count_dependency_chains)
+    shortest, shortest_time = timed(lambda: project.shortest_dependency_chain(top))
+    longest, longest_time = timed(lambda: project.longest_dependency_chain(top))
+
+    print(f"objects: {len(project.all_objects)}  chains from top: {counts[top]}")
+    print(
+        f"get_dependency_chain depth {args.depth}: {len(chains):9d} chains "
+        f"{full_time * 1000:10.1f} ms"
+    )
+    print(
+        f"iter_dependency_chains max_chains:  {len(bounded):9d} chains "
+        f"{bounded_time * 1000:10.1f} ms"
+    )
+    print(f"count_dependency_chains (all objects):     {count_time * 1000:10.1f} ms")
+    print(
+        f"shortest_dependency_chain ({len(shortest)} names):"
+        f"     {shortest_time * 1000:10.1f} ms"
+    )
+    print(
+        f"longest_dependency_chain ({len(longest)} names):"
+        f"      {longest_time * 1000:10.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark for the ordered-set dependency collections.
+
+Builds ``--resources`` resources that all use one provider, the hub case
+where every reverse edge lands on the same object. It times:
+
+* building the hub's dependents with the former ``if x not in list``
+  guard against ``OrderedSet.add``
+* reading ``all_dependencies`` for every object, concatenating the two
+  lists on each read as before, against the cached tuple
+* dependency building in TerraformAnalyzer on the in-memory project
+
+Usage:
+    python benchmarks/bench_dependency_sets.py [--resources N]
+"""
+
+import argparse
+import time
+
+from tfkit.analyzer.models import LocationInfo, ResourceType, TerraformObject
+from tfkit.analyzer.project import TerraformProject
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+from tfkit.core.ordered_set import OrderedSet
+
+READS_PER_OBJECT = 20
+
+
+def build_project(resources):
+    project = TerraformProject("synthetic")
+    project.add_object(
+        TerraformObject(
+            type=ResourceType.PROVIDER,
+            name="aws",
+            full_name="provider.aws",
+            location=LocationInfo("providers.tf", 1),
+        )
+    )
+    project.add_object(
+        TerraformObject(
+            type=ResourceType.VARIABLE,
+            name="prefix",
+            full_name="var.prefix",
+            location=LocationInfo("variables.tf", 1),
+        )
+    )
+    for i in range(resources):
+        project.add_object(
+            TerraformObject(
+                type=ResourceType.RESOURCE,
+                name=f"r{i}",
+                full_name=f"aws_s3_bucket.r{i}",
+                location=LocationInfo("main.tf", i + 1),
+                resource_type="aws_s3_bucket",
+                attributes={"bucket": f"${{var.prefix}}-r{i}"},
+            )
+        )
+    return project
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resources", type=int, default=20_000)
+    args = parser.parse_args()
+
+    names = [f"aws_s3_bucket.r{i}" for i in range(args.resources)]
+
+    def list_guard():
+        dependents = []
+        for name in names:
+            if name not in dependents:
+                dependents.append(name)
+
+    def ordered_set():
+        dependents = OrderedSet()
+        for name in names:
+            dependents.add(name)
+
+    list_time = timed(list_guard)
+    set_time = timed(ordered_set)
+
+    analyzer = TerraformAnalyzer()
+    analyzer.project = build_project(args.resources)
+    build_time = timed(analyzer._build_all_dependencies)
+
+    infos = [obj.dependency_info for obj in analyzer.project.all_objects.values()]
+
+    def concatenated():
+        for info in infos:
+            for _ in range(READS_PER_OBJECT):
+                list(info.explicit_dependencies) + list(info.implicit_dependencies)
+
+    def cached():
+        for info in infos:
+            for _ in range(READS_PER_OBJECT):
+                _ = info.all_dependencies
+
+    concat_time = timed(concatenated)
+    cached_time = timed(cached)
+
+    hub = analyzer.project.get_object("provider.aws").dependency_info
+    assert hub.dependent_count == args.resources
+
+    print(f"resources on one provider: {args.resources}")
+    print(f"hub dependents, list guard:    {list_time * 1000:10.1f} ms")
+    print(f"hub dependents, ordered set:   {set_time * 1000:10.1f} ms")
+    print(
+        f"all_dependencies x{READS_PER_OBJECT}, concat: {concat_time * 1000:10.1f} ms"
+    )
+    print(
+        f"all_dependencies x{READS_PER_OBJECT}, cached: {cached_time * 1000:10.1f} ms"
+    )
+    print(f"analyzer dependency build:     {build_time * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark for Terraform file discovery.
+
+Builds ``--modules`` module directories, each holding a few ``.tf`` and
+``.tfvars`` files, plus a ``.terraform`` provider and module cache and a
+``node_modules`` tree with ``--cache-files`` files each. It times the
+previous discovery (four recursive ``glob`` calls for Terraform files and
+two more for tfvars) against one ``FileWalker`` traversal.
+
+Usage:
+    python benchmarks/bench_file_discovery.py [--modules N] [--cache-files N]
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from tfkit.core.walker import FileWalker
+
+
+def build_tree(root, modules, cache_files):
+    for i in range(modules):
+        module = os.path.join(root, "modules", f"m{i}")
+        os.makedirs(module)
+        for name in ("main.tf", "variables.tf", "outputs.tf", "dev.tfvars"):
+            with open(os.path.join(module, name), "w") as f:
+                f.write("")
+    for cache in (".terraform/modules", "node_modules"):
+        for i in range(cache_files):
+            directory = os.path.join(root, cache, f"d{i // 20}")
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"f{i}.tf"), "w") as f:
+                f.write("")
+
+
+def glob_discovery(root):
+    files = set()
+    for pattern in ("*.tf", "*.tf.json"):
+        files.update(glob.glob(os.path.join(root, pattern)))
+        files.update(glob.glob(os.path.join(root, "**", pattern), recursive=True))
+    files = [f for f in files if ".terraform" not in f and "node_modules" not in f]
+    tfvars = []
+    for pattern in ("*.tfvars", "*.tfvars.json"):
+        tfvars.extend(glob.glob(os.path.join(root, "**", pattern), recursive=True))
+    return sorted(files), sorted(tfvars)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", type=int, default=500)
+    parser.add_argument("--cache-files", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root, args.modules, args.cache_files)
+
+        (files, tfvars), glob_time = timed(lambda: glob_discovery(root))
+        found, walk_time = timed(lambda: FileWalker().walk(root))
+
+        assert files == found.terraform
+        print(f"terraform files: {len(files)}  tfvars files: {len(tfvars)}")
+        print(f"glob:       {glob_time * 1000:10.1f} ms")
+        print(f"FileWalker: {walk_time * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark for writing a project as JSON.
+
+Writes a synthetic project with ``--objects`` resources spread over
+``--files`` files and analyzes it. The project is then saved twice: by
+building ``to_dict()`` and passing it to ``json.dump``, and with
+``TerraformProject.write_json``, which streams one object at a time. The
+two are compared by peak memory allocated while writing (tracemalloc) and
+wall time, and their output is checked to be identical.
+
+Usage:
+    python benchmarks/bench_json_export.py [--objects N] [--files N] [--compact]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+
+def write_project(root, objects, files):
+    per_file = max(objects // files, 1)
+    with open(os.path.join(root, "variables.tf"), "w", encoding="utf-8") as f:
+        f.write('variable "prefix" {}\n')
+        f.write('provider "aws" {\n  region = "eu-west-1"\n}\n')
+    for file_index in range(files):
+        with open(os.path.join(root, f"r{file_index}.tf"), "w") as f:
+            for i in range(per_file):
+                name = f"r{file_index}_{i}"
+                previous = f"aws_s3_bucket.r{file_index}_{i - 1}.id" if i else '""'
+                f.write(
+                    f'resource "aws_s3_bucket" "{name}" {{\n'
+                    f'  bucket = "${{var.prefix}}-{name}"\n'
+                    f"  policy = {previous}\n"
+                    f'  tags = {{\n    Name = "{name}"\n    Team = "platform"\n  }}\n'
+                    f"}}\n\n"
+                )
+
+
+def measure(path, write):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(path, "w", encoding="utf-8") as f:
+        write(f)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=20_000)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--compact", action="store_true")
+    args = parser.parse_args()
+
+    indent = None if args.compact else 2
+    separators = (",", ":") if args.compact else None
+
+    with tempfile.TemporaryDirectory() as root:
+        write_project(root, args.objects, args.files)
+        project = TerraformAnalyzer().analyze_project(root)
+
+        def dump(f):
+            # Fresh dict, as on the first save after an analysis
+            project.invalidate_caches()
+            json.dump(
+                project.to_dict(), f, indent=indent, separators=separators, default=str
+            )
+
+        def stream(f):
+            project.invalidate_caches()
+            project.write_json(f, indent)
+
+        dumped = os.path.join(root, "dump.json")
+        streamed = os.path.join(root, "stream.json")
+        dump_time, dump_peak = measure(dumped, dump)
+        stream_time, stream_peak = measure(streamed, stream)
+
+        with open(dumped, encoding="utf-8") as a, open(streamed, encoding="utf-8") as b:
+            identical = a.read() == b.read()
+        size = os.path.getsize(streamed)
+
+    print(f"objects: {args.objects}  files: {args.files}  output: {size / 1e6:.1f} MB")
+    print(f"identical output:          {identical!s:>12}")
+    print(f"peak traced, to_dict+dump: {dump_peak / 1e6:12.1f} MB")
+    print(f"peak traced, write_json:   {stream_peak / 1e6:12.1f} MB")
+    print(f"time, to_dict+dump:        {dump_time:12.2f} s")
+    print(f"time, write_json:          {stream_time:12.2f} s")
+
+
+if __name__ == "__main__":
+    main()
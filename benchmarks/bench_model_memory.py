@@ -0,0 +1,97 @@
+"""
+Memory benchmark for the analyzer models.
+
+Creates ``--objects`` objects through ObjectFactory the way an analysis
+does (mostly resources, plus variables, locals and outputs that reference
+them), builds their dependencies and states, drops the analyzer and
+reports the bytes still allocated (tracemalloc) per object. The parsed
+configurations are built before measuring and are not counted.
+
+Usage:
+    python benchmarks/bench_model_memory.py [--objects N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from tfkit.analyzer.project import TerraformProject
+from tfkit.analyzer.terraform_analyzer import (
+    FileParser,
+    ObjectFactory,
+    TerraformAnalyzer,
+)
+
+RESOURCE_TYPES = ("aws_s3_bucket", "aws_instance", "aws_iam_role", "aws_subnet")
+
+
+def build_configs(objects):
+    configs = []
+    for i in range(objects):
+        kind = i % 10
+        if kind == 0:
+            configs.append(("variable", f"v{i}", {"default": "x"}))
+        elif kind == 1:
+            configs.append(("local", f"l{i}", f"${{var.v{i - 1}}}-suffix"))
+        elif kind == 2:
+            configs.append(("output", f"o{i}", {"value": f"${{local.l{i - 1}}}"}))
+        else:
+            resource_type = RESOURCE_TYPES[i % len(RESOURCE_TYPES)]
+            configs.append(
+                (
+                    resource_type,
+                    f"r{i}",
+                    {"name": f"${{local.l{i - i % 10 + 1}}}", "count": 1},
+                )
+            )
+    return configs
+
+
+def create_objects(factory, configs, file_path):
+    for kind, name, config in configs:
+        if kind == "variable":
+            yield factory.create_variable(name, config, file_path)
+        elif kind == "local":
+            yield factory.create_local(name, config, file_path)
+        elif kind == "output":
+            yield factory.create_output(name, config, file_path)
+        else:
+            yield factory.create_resource(kind, name, config, file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50_000)
+    args = parser.parse_args()
+
+    file_path = "/synthetic/main.tf"
+    configs = build_configs(args.objects)
+    gc.collect()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    analyzer = TerraformAnalyzer()
+    factory = ObjectFactory(FileParser())
+    project = TerraformProject("/synthetic")
+    for obj in create_objects(factory, configs, file_path):
+        project.add_object(obj)
+    created = tracemalloc.get_traced_memory()[0] - baseline
+
+    analyzer.project = project
+    analyzer._build_all_dependencies()
+    analyzer._detect_all_circular_dependencies()
+    analyzer._compute_all_states()
+    del analyzer, factory
+    gc.collect()
+    analyzed = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    count = len(project.all_objects)
+    print(f"objects: {count}")
+    print(f"bytes per object, created:  {created / count:10.0f}")
+    print(f"bytes per object, analyzed: {analyzed / count:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
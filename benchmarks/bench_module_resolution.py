@@ -0,0 +1,81 @@
+"""
+Benchmark for resolving local child modules.
+
+Builds one shared module of ``--objects`` variables and resources and a
+root that calls it from ``--calls`` module blocks. It times analyzing the
+module once per call site, as a naive descent would, against
+``ModuleResolver``, which analyzes it once and only expands the graph per
+call site.
+
+Usage:
+    python benchmarks/bench_module_resolution.py [--calls N] [--objects N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from tfkit.analyzer.modules import ModuleResolver
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+
+def build(base, calls, objects):
+    module = os.path.join(base, "modules", "shared")
+    root = os.path.join(base, "live")
+    os.makedirs(module)
+    os.makedirs(root)
+
+    with open(os.path.join(module, "main.tf"), "w") as f:
+        f.write('variable "prefix" {}\n')
+        for i in range(objects):
+            f.write(
+                f'resource "aws_s3_bucket" "b{i}" {{\n'
+                f'  bucket = "${{var.prefix}}-{i}"\n}}\n'
+                f'output "b{i}" {{\n  value = aws_s3_bucket.b{i}.id\n}}\n'
+            )
+
+    with open(os.path.join(root, "main.tf"), "w") as f:
+        for i in range(calls):
+            f.write(
+                f'module "m{i}" {{\n  source = "../modules/shared"\n'
+                f'  prefix = "env{i}"\n}}\n'
+            )
+    return root, module
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--objects", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base:
+        root, module = build(base, args.calls, args.objects)
+        project = TerraformAnalyzer().analyze_project(root)
+
+        _, naive_time = timed(
+            lambda: [
+                TerraformAnalyzer().analyze_project(module, recursive=False)
+                for _ in range(args.calls)
+            ]
+        )
+        resolver = ModuleResolver()
+        tree, resolve_time = timed(lambda: resolver.resolve(project))
+
+        print(f"call sites: {args.calls}  graph nodes: {len(tree.graph)}")
+        print(f"module analyzed per call site: {naive_time * 1000:10.1f} ms")
+        print(
+            f"ModuleResolver ({resolver.analyzed} analysis): "
+            f"{resolve_time * 1000:10.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
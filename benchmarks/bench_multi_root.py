@@ -0,0 +1,84 @@
+"""
+Benchmark for analyzing many root modules in one run.
+
+Builds ``--roots`` root modules that each hold a few files of their own
+plus copies of ``--shared`` common files (backend, providers, shared
+locals), as repositories with one root per environment or service do.
+It times one ``analyze_project`` call per root with a fresh analyzer,
+as separate ``tfkit scan`` runs would (interpreter startup not
+included), against a single ``analyze_many`` call.
+
+Usage:
+    python benchmarks/bench_multi_root.py [--roots N] [--shared N] [--jobs N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+
+def shared_file(index):
+    return "".join(
+        f'locals {{\n  common_{index}_{i} = "value-{i}"\n}}\n'
+        f'variable "shared_{index}_{i}" {{\n  default = local.common_{index}_{i}\n}}\n'
+        for i in range(40)
+    )
+
+
+def build_roots(base, roots, shared):
+    shared_files = [shared_file(i) for i in range(shared)]
+    paths = []
+    for r in range(roots):
+        root = os.path.join(base, f"root{r}")
+        os.makedirs(root)
+        for i, text in enumerate(shared_files):
+            with open(os.path.join(root, f"shared_{i}.tf"), "w") as f:
+                f.write(text)
+        with open(os.path.join(root, "main.tf"), "w") as f:
+            f.write(
+                f'resource "aws_s3_bucket" "b{r}" {{\n'
+                f"  bucket = var.shared_0_0\n}}\n"
+                f'output "bucket" {{\n  value = aws_s3_bucket.b{r}.id\n}}\n'
+            )
+        paths.append(root)
+    return paths
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--roots", type=int, default=100)
+    parser.add_argument("--shared", type=int, default=4)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base:
+        roots = build_roots(base, args.roots, args.shared)
+
+        def one_by_one():
+            return [
+                TerraformAnalyzer(workers=args.jobs).analyze_project(root)
+                for root in roots
+            ]
+
+        projects, single_time = timed(one_by_one)
+        workspace, many_time = timed(
+            lambda: TerraformAnalyzer(workers=args.jobs).analyze_many(roots)
+        )
+
+        assert len(workspace.projects) == len(projects)
+        print(f"roots: {len(roots)}  files per root: {args.shared + 1}")
+        print(f"analyze_project per root: {single_time * 1000:10.1f} ms")
+        print(f"analyze_many:             {many_time * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
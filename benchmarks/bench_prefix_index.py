@@ -0,0 +1,111 @@
+"""
+Benchmark for partial reference matching in DependencyExtractor.
+
+Builds a synthetic project with ``--objects`` objects in memory. The
+resources reference data sources and undefined variables, so every object
+triggers partial and missing lookups. The benchmark then compares the
+sorted-name prefix index against the former linear ``startswith`` scan.
+The linear scan is quadratic, so it is timed on a ``--sample`` of the
+objects and extrapolated to the full project.
+
+Usage:
+    python benchmarks/bench_prefix_index.py [--objects N] [--sample N]
+"""
+
+import argparse
+import time
+
+from tfkit.analyzer.models import LocationInfo, ResourceType, TerraformObject
+from tfkit.analyzer.terraform_analyzer import DependencyExtractor
+
+DATA_TYPES = 1000
+DATA_PER_TYPE = 5
+
+
+class LinearScanDependencyExtractor(DependencyExtractor):
+    """DependencyExtractor with the former linear partial matching."""
+
+    def _find_matching_objects(self, partial_ref):
+        return [name for name in self.defined_names if name.startswith(partial_ref)]
+
+
+def make_object(resource_type, full_name, name, attributes):
+    return TerraformObject(
+        type=resource_type,
+        name=name,
+        full_name=full_name,
+        location=LocationInfo(file_path="synthetic.tf", line_number=1),
+        attributes=attributes,
+    )
+
+
+def build_project(total):
+    objects = {}
+
+    for type_index in range(DATA_TYPES):
+        for i in range(DATA_PER_TYPE):
+            full_name = f"data.aws_t{type_index}_info.d{i}"
+            objects[full_name] = make_object(
+                ResourceType.DATA, full_name, f"d{i}", {"name": f"d{i}"}
+            )
+
+    for i in range(total - len(objects)):
+        data_ref = f"data.aws_t{i % DATA_TYPES}_info.d{i % DATA_PER_TYPE}"
+        full_name = f"aws_r{i % 50}_thing.r{i}"
+        attributes = {
+            "ami": f"${{{data_ref}.id}}",
+            "name": f"${{var.undefined_{i}}}",
+            "tags": {"Name": f"r{i}"},
+        }
+        objects[full_name] = make_object(
+            ResourceType.RESOURCE, full_name, f"r{i}", attributes
+        )
+
+    return objects
+
+
+def time_extract(extractor, items):
+    start = time.perf_counter()
+    for name, obj in items:
+        extractor.extract(obj.attributes, name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50_000)
+    parser.add_argument("--sample", type=int, default=200)
+    args = parser.parse_args()
+
+    objects = build_project(args.objects)
+    items = list(objects.items())
+    sample = items[-args.sample :]
+
+    start = time.perf_counter()
+    indexed = DependencyExtractor(objects)
+    build_time = time.perf_counter() - start
+    linear = LinearScanDependencyExtractor(objects)
+
+    for name, obj in sample:
+        expected = linear.extract(obj.attributes, name)
+        actual = indexed.extract(obj.attributes, name)
+        assert sorted(actual.implicit_dependencies) == sorted(
+            expected.implicit_dependencies
+        ), name
+
+    linear_sample = time_extract(linear, sample)
+    indexed_sample = time_extract(indexed, sample)
+    indexed_full = time_extract(indexed, items)
+    linear_full = linear_sample / len(sample) * len(items)
+
+    print(f"objects: {len(items)}  (sample of {len(sample)})")
+    print(f"index build:                 {build_time * 1000:10.1f} ms")
+    print(f"linear scan, sample:         {linear_sample * 1000:10.1f} ms")
+    print(f"prefix index, sample:        {indexed_sample * 1000:10.1f} ms")
+    print(f"linear scan, full (est.):    {linear_full:10.1f} s")
+    print(f"prefix index, full:          {indexed_full:10.1f} s")
+    print(f"speedup:                     {linear_sample / indexed_sample:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark for TerraformProject lookups by provider, resource type, state
+and file.
+
+Builds a project of ``--objects`` resources spread over ``--files`` files,
+``--providers`` providers and ten resource types per provider, without
+parsing anything. Every provider, every resource type, every state and
+every file is then looked up once, as a per-group report does, first by
+scanning all objects and then through ``get_objects_by_*`` and ``query``.
+
+Usage:
+    python benchmarks/bench_project_queries.py [--objects N] [--files N]
+        [--providers N]
+"""
+
+import argparse
+import os
+import time
+
+from tfkit.analyzer.models import (
+    LocationInfo,
+    ObjectState,
+    ProviderInfo,
+    ResourceType,
+    TerraformObject,
+)
+from tfkit.analyzer.project import TerraformProject
+
+
+def build_project(objects, files, providers):
+    project = TerraformProject("/bench")
+    for i in range(objects):
+        provider = f"p{i % providers}"
+        resource_type = f"{provider}_type{i % 10}"
+        name = f"r{i}"
+        project.add_object(
+            TerraformObject(
+                type=ResourceType.RESOURCE,
+                name=name,
+                full_name=f"{resource_type}.{name}",
+                location=LocationInfo(f"/bench/f{i % files}.tf", 1),
+                attributes={"name": name},
+                resource_type=resource_type,
+                provider_info=ProviderInfo(provider),
+            )
+        )
+    for obj in project.all_objects.values():
+        obj.refresh_state()
+    project.invalidate_caches()
+    return project
+
+
+def scan_lookups(project, providers, resource_types, files):
+    objects = list(project.all_objects.values())
+    found = 0
+    for provider in providers:
+        found += len([o for o in objects if o.provider_info.provider_name == provider])
+    for resource_type in resource_types:
+        found += len([o for o in objects if o.resource_type == resource_type])
+    for state in ObjectState:
+        found += len([o for o in objects if o.state == state])
+    for file_path in files:
+        found += len([o for o in objects if o.location.file_path == file_path])
+    return found
+
+
+def index_lookups(project, providers, resource_types, files):
+    found = 0
+    for provider in providers:
+        found += len(project.get_objects_by_provider(provider))
+    for resource_type in resource_types:
+        found += len(project.get_objects_by_resource_type(resource_type))
+    for state in ObjectState:
+        found += len(project.get_objects_by_state(state))
+    for file_path in files:
+        found += len(project.query(file_glob=os.path.relpath(file_path, "/bench")))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=20_000)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--providers", type=int, default=5)
+    args = parser.parse_args()
+
+    project = build_project(args.objects, args.files, args.providers)
+    providers = [f"p{i}" for i in range(args.providers)]
+    resource_types = [f"{p}_type{i}" for p in providers for i in range(10)]
+    files = list(project.files)
+
+    start = time.perf_counter()
+    scanned = scan_lookups(project, providers, resource_types, files)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = index_lookups(project, providers, resource_types, files)
+    index_time = time.perf_counter() - start
+
+    lookups = len(providers) + len(resource_types) + len(ObjectState) + len(files)
+    print(f"objects: {args.objects}  lookups: {lookups}")
+    print(f"same results:              {scanned == indexed!s:>12}")
+    print(f"time, scanning:            {scan_time:12.2f} s")
+    print(f"time, indexes:             {index_time:12.2f} s")
+
+
+if __name__ == "__main__":
+    main()
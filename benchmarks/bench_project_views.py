@@ -0,0 +1,120 @@
+"""
+Benchmark for TerraformProject collection access.
+
+Writes a synthetic project with ``--objects`` resources spread over
+``--files`` files, analyzes it and builds the visualizer graph. The run is
+repeated with a project whose collection properties copy their dict on
+every access, as they used to, and the two runs are compared by the
+number of collection accesses, the dict entries copied, the bytes
+allocated (tracemalloc) and the wall time.
+
+Usage:
+    python benchmarks/bench_project_views.py [--objects N] [--files N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from tfkit.analyzer import terraform_analyzer
+from tfkit.analyzer.project import TerraformProject
+from tfkit.visualizer.graph_builder import TerraformGraphBuilder
+
+COLLECTIONS = (
+    "all_objects",
+    "resources",
+    "data_sources",
+    "modules",
+    "variables",
+    "outputs",
+    "providers",
+    "locals",
+    "terraform_blocks",
+)
+
+
+class CopyingProject(TerraformProject):
+    """TerraformProject whose collection properties copy on every access."""
+
+    accesses = 0
+    copied = 0
+
+
+def _copying_property(name):
+    view = getattr(TerraformProject, name)
+
+    def getter(self):
+        objects = view.fget(self)
+        CopyingProject.accesses += 1
+        CopyingProject.copied += len(objects)
+        return dict(objects)
+
+    return property(getter)
+
+
+for _name in COLLECTIONS:
+    setattr(CopyingProject, _name, _copying_property(_name))
+
+
+def write_project(root, objects, files):
+    per_file = max(objects // files, 1)
+    with open(os.path.join(root, "variables.tf"), "w", encoding="utf-8") as f:
+        f.write('variable "prefix" {}\n')
+        f.write('provider "aws" {\n  region = "eu-west-1"\n}\n')
+    for file_index in range(files):
+        with open(os.path.join(root, f"r{file_index}.tf"), "w") as f:
+            for i in range(per_file):
+                name = f"r{file_index}_{i}"
+                previous = f"aws_s3_bucket.r{file_index}_{i - 1}.id" if i else '""'
+                f.write(
+                    f'resource "aws_s3_bucket" "{name}" {{\n'
+                    f'  bucket = "${{var.prefix}}-{name}"\n'
+                    f"  policy = {previous}\n"
+                    f"}}\n\n"
+                )
+
+
+def run(root, project_class):
+    with mock.patch.object(terraform_analyzer, "TerraformProject", project_class):
+        tracemalloc.start()
+        start = time.perf_counter()
+        project = terraform_analyzer.TerraformAnalyzer().analyze_project(root)
+        TerraformGraphBuilder().build_graph(project)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--files", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        # Warm up: load the HCL grammar outside the measured runs
+        write_project(root, 10, 1)
+        run(root, TerraformProject)
+        CopyingProject.accesses = CopyingProject.copied = 0
+
+        write_project(root, args.objects, args.files)
+
+        view_time, view_peak = run(root, TerraformProject)
+        copy_time, copy_peak = run(root, CopyingProject)
+
+    print(f"objects: {args.objects}  files: {args.files}")
+    print(f"collection accesses:       {CopyingProject.accesses:12d}")
+    print(f"entries copied (copying):  {CopyingProject.copied:12d}")
+    print("entries copied (views):               0")
+    print(f"peak traced, copying:      {copy_peak / 1e6:12.1f} MB")
+    print(f"peak traced, views:        {view_peak / 1e6:12.1f} MB")
+    print(f"time, copying:             {copy_time:12.2f} s")
+    print(f"time, views:               {view_time:12.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Microbenchmark for DependencyExtractor reference scanning.
+
+Compares the single-pass scanner against the former approach, which
+serialized every configuration with ``json.dumps`` and ran one regex pass
+per reference kind. The workload is the ``examples/main`` fixture repeated
+``--scale`` times.
+
+Usage:
+    python benchmarks/bench_reference_scanner.py [--scale N] [--repeat N]
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from tfkit.analyzer.models import ResourceType
+from tfkit.analyzer.terraform_analyzer import DependencyExtractor, TerraformAnalyzer
+
+FIXTURE = Path(__file__).resolve().parent.parent / "examples" / "main"
+
+
+class LegacyDependencyExtractor(DependencyExtractor):
+    """DependencyExtractor with the JSON round-trip and per-kind patterns."""
+
+    PATTERNS = [
+        (r"\bvar\.([a-zA-Z_][a-zA-Z0-9_-]*)\b", "var.{}", 1),
+        (r"\blocal\.([a-zA-Z_][a-zA-Z0-9_-]*)\b", "local.{}", 1),
+        (r"\bmodule\.([a-zA-Z_][a-zA-Z0-9_-]*)\.", "module.{}", 1),
+        (
+            r"\bdata\.([a-zA-Z_][a-zA-Z0-9_-]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)\b",
+            "data.{}.{}",
+            2,
+        ),
+        (r"\b([a-z][a-z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)\.", "{}.{}", 2),
+    ]
+
+    def _extract_references(self, config, current_object_name):
+        if isinstance(config, (dict, list)):
+            config_str = json.dumps(config, default=str, indent=None)
+        else:
+            config_str = str(config)
+
+        found_references = set()
+        for pattern, template, group_count in self.PATTERNS:
+            for match in re.finditer(pattern, config_str):
+                dep_name = template.format(*match.groups()[:group_count])
+                dep_name = self._normalize_reference(dep_name)
+                if dep_name == current_object_name:
+                    continue
+                if not self._is_valid_reference(dep_name):
+                    continue
+                found_references.add(dep_name)
+
+        return found_references
+
+
+def load_workload(scale: int):
+    project = TerraformAnalyzer().analyze_project(str(FIXTURE))
+    objects = project.all_objects
+    configs = [
+        (name, obj.attributes)
+        for name, obj in objects.items()
+        if obj.type not in (ResourceType.VARIABLE, ResourceType.TERRAFORM)
+    ]
+    return objects, configs * scale
+
+
+def run(extractor, configs):
+    for name, attributes in configs:
+        extractor.extract(attributes, name)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    objects, configs = load_workload(args.scale)
+    legacy = LegacyDependencyExtractor(objects)
+    current = DependencyExtractor(objects)
+
+    for name, attributes in configs[: len(configs) // args.scale]:
+        expected = legacy._extract_references(attributes, name)
+        assert set(current._extract_references(attributes, name)) == expected, name
+
+    legacy_time = best_of(args.repeat, run, legacy, configs)
+    current_time = best_of(args.repeat, run, current, configs)
+
+    print(f"objects extracted: {len(configs)}")
+    print(f"legacy (json.dumps + 5 passes): {legacy_time * 1000:9.1f} ms")
+    print(f"single-pass scanner:            {current_time * 1000:9.1f} ms")
+    print(f"speedup:                        {legacy_time / current_time:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
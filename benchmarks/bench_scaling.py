@@ -0,0 +1,134 @@
+"""
+Benchmark of how the main pipeline steps scale with project size.
+
+For each of ``--sizes`` a synthetic project of about that many objects is
+written with ``synthetic.generate_project``, then these steps are run on
+it in order:
+
+- ``analyze``: ``TerraformAnalyzer.analyze_project``
+- ``parse module``: ``TerraformParser.parse_module``
+- ``resolve``: ``ReferenceResolver.resolve_module`` on the parsed module
+- ``dependencies``: ``DependencyAnalyzer.analyze`` on the parsed module
+- ``validate``: ``TerraformValidator.validate`` on the analyzed project
+- ``graph``: ``TerraformGraphBuilder.build_graph`` on the analyzed project
+
+Times come from a run without memory tracing. Unless ``--no-memory`` is
+given, the steps run a second time under ``tracemalloc`` for the peak
+traced memory of each step, which includes what earlier steps still hold.
+The scaling exponent ``k`` of each step fits ``time ~ objects ** k``
+over all sizes: about 1 is linear, 2 quadratic.
+
+Usage:
+    python benchmarks/bench_scaling.py [--sizes N [N ...]] [--no-memory]
+        [--reference-density P] [--locals-depth N] [--modules N] [--seed N]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import math
+import os
+import tempfile
+
+from synthetic import generate_project, spec_for_objects
+
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+from tfkit.core.profiling import Profiler
+from tfkit.inspector.analyzer import DependencyAnalyzer
+from tfkit.inspector.parser import TerraformParser
+from tfkit.inspector.resolver import ReferenceResolver
+from tfkit.validator.validator import TerraformValidator
+from tfkit.visualizer.graph_builder import TerraformGraphBuilder
+
+STEPS = ("analyze", "parse module", "resolve", "dependencies", "validate", "graph")
+
+
+def run_steps(root, profiler, validator):
+    with profiler.phase("analyze"):
+        project = TerraformAnalyzer().analyze_project(root)
+    with profiler.phase("parse module"):
+        module = TerraformParser().parse_module(root, recursive=True)
+    with profiler.phase("resolve"):
+        ReferenceResolver(module).resolve_module()
+    with profiler.phase("dependencies"):
+        DependencyAnalyzer(module).analyze()
+    with profiler.phase("validate"):
+        validator.validate(project)
+    with profiler.phase("graph"):
+        TerraformGraphBuilder().build_graph(project)
+
+
+def measure(root, trace_memory, validator):
+    gc.collect()
+    profiler = Profiler(trace_memory=trace_memory)
+    profiler.start()
+    try:
+        # The validator and parsers print progress and warnings
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_steps(root, profiler, validator)
+    finally:
+        profiler.stop()
+    return {record.name: record for record in profiler.records}
+
+
+def scaling_exponent(points):
+    """Least-squares slope of log(time) over log(objects)."""
+    points = [(math.log(n), math.log(max(t, 1e-9))) for n, t in points]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--reference-density", type=float, default=0.5)
+    parser.add_argument("--locals-depth", type=int, default=3)
+    parser.add_argument("--modules", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    validator = TerraformValidator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        validator.initialize()
+
+    print(f"{'objects':>8}  {'step':<14}{'time (s)':>12}{'peak (MB)':>12}")
+    timings = {step: [] for step in STEPS}
+    for size in args.sizes:
+        spec = spec_for_objects(
+            size,
+            locals_depth=args.locals_depth,
+            modules=args.modules,
+            reference_density=args.reference_density,
+            seed=args.seed,
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "project")
+            objects = generate_project(root, spec)
+            times = measure(root, False, validator)
+            peaks = {} if args.no_memory else measure(root, True, validator)
+
+        for step in STEPS:
+            seconds = times[step].wall_time
+            timings[step].append((objects, seconds))
+            peak = f"{peaks[step].peak_memory / 1e6:12.1f}" if peaks else f"{'-':>12}"
+            print(f"{objects:>8}  {step:<14}{seconds:12.2f}{peak}")
+
+    print("\nscaling exponent (time ~ objects ** k):")
+    for step in STEPS:
+        exponent = scaling_exponent(timings[step])
+        value = f"{exponent:12.2f}" if exponent is not None else f"{'-':>12}"
+        print(f"{step + ':':<24}{value}")
+
+
+if __name__ == "__main__":
+    main()
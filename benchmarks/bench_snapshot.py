@@ -0,0 +1,84 @@
+"""
+Benchmark for reloading an analyzed project from a binary snapshot.
+
+Writes a synthetic project with ``--objects`` resources spread over
+``--files`` files and analyzes it, then saves it with
+``TerraformProject.write_snapshot`` and loads it back with
+``TerraformProject.load_snapshot``. Analysis, snapshot writing and
+loading (with and without the source hash check) are timed, and the
+loaded project is checked to serialize like the analyzed one.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--objects N] [--files N]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from tfkit.analyzer.project import TerraformProject
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+
+def write_project(root, objects, files):
+    per_file = max(objects // files, 1)
+    with open(os.path.join(root, "variables.tf"), "w", encoding="utf-8") as f:
+        f.write('variable "prefix" {}\n')
+        f.write('provider "aws" {\n  region = "eu-west-1"\n}\n')
+    for file_index in range(files):
+        with open(os.path.join(root, f"r{file_index}.tf"), "w") as f:
+            for i in range(per_file):
+                name = f"r{file_index}_{i}"
+                previous = f"aws_s3_bucket.r{file_index}_{i - 1}.id" if i else '""'
+                f.write(
+                    f'resource "aws_s3_bucket" "{name}" {{\n'
+                    f'  bucket = "${{var.prefix}}-{name}"\n'
+                    f"  policy = {previous}\n"
+                    f'  tags = {{\n    Name = "{name}"\n  }}\n'
+                    f"}}\n\n"
+                )
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--files", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "project")
+        os.mkdir(root)
+        write_project(root, args.objects, args.files)
+        snapshot = os.path.join(tmp, "project.tfks")
+
+        project, analyze_time = timed(lambda: TerraformAnalyzer().analyze_project(root))
+        _, write_time = timed(lambda: project.write_snapshot(snapshot))
+        loaded, load_time = timed(lambda: TerraformProject.load_snapshot(snapshot))
+        _, unverified_time = timed(
+            lambda: TerraformProject.load_snapshot(snapshot, verify=False)
+        )
+
+        identical = json.dumps(loaded.to_dict(), default=str) == json.dumps(
+            project.to_dict(), default=str
+        )
+        size = os.path.getsize(snapshot)
+
+    print(f"objects: {args.objects}  files: {args.files}")
+    print(f"snapshot size:             {size / 1e6:12.1f} MB")
+    print(f"identical project:         {identical!s:>12}")
+    print(f"time, analyze:             {analyze_time:12.2f} s")
+    print(f"time, write snapshot:      {write_time:12.2f} s")
+    print(f"time, load (verified):     {load_time:12.2f} s")
+    print(f"time, load (no check):     {unverified_time:12.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark for project-wide state computation.
+
+Builds ``--chains`` chains of ``--length`` locals, each fed by a variable.
+Half of the chains end in a resource and half end nowhere, so every local
+in an unused chain walks the rest of its chain when its state is computed
+lazily. States are read for every object once with the lazy per-object
+computation and once after ``ProjectStateEngine.assign_states``; both runs
+must agree.
+
+Usage:
+    python benchmarks/bench_state_engine.py [--chains N] [--length N]
+"""
+
+import argparse
+import time
+
+from tfkit.analyzer.models import LocationInfo, ResourceType, TerraformObject
+from tfkit.analyzer.state import ProjectStateEngine
+
+
+def make_object(resource_type, name, depends_on=()):
+    obj = TerraformObject(
+        type=resource_type,
+        name=name,
+        full_name=f"{resource_type.value}.{name}",
+        location=LocationInfo("main.tf", 1),
+        attributes={"value": name},
+    )
+    obj.dependency_info.explicit_dependencies = list(depends_on)
+    return obj
+
+
+def build_objects(chains, length):
+    objects = {}
+    for chain in range(chains):
+        previous = make_object(ResourceType.VARIABLE, f"v{chain}")
+        objects[previous.full_name] = previous
+        for i in range(length):
+            local = make_object(
+                ResourceType.LOCAL, f"c{chain}_{i}", [previous.full_name]
+            )
+            objects[local.full_name] = local
+            previous = local
+        if chain % 2 == 0:
+            resource = make_object(
+                ResourceType.RESOURCE, f"r{chain}", [previous.full_name]
+            )
+            objects[resource.full_name] = resource
+
+    for obj in objects.values():
+        obj.set_all_objects_cache(objects)
+        for dep in obj.dependency_info.all_dependencies:
+            objects[dep].dependency_info.dependent_objects.add(obj.full_name)
+    return objects
+
+
+def read_states(objects):
+    return {name: (obj.state, obj.state_reason) for name, obj in objects.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chains", type=int, default=50)
+    parser.add_argument("--length", type=int, default=400)
+    args = parser.parse_args()
+
+    objects = build_objects(args.chains, args.length)
+
+    start = time.perf_counter()
+    lazy = read_states(objects)
+    lazy_time = time.perf_counter() - start
+
+    for obj in objects.values():
+        obj.invalidate_state()
+
+    start = time.perf_counter()
+    ProjectStateEngine(objects).assign_states()
+    bulk = read_states(objects)
+    bulk_time = time.perf_counter() - start
+
+    assert bulk == lazy
+
+    print(f"objects: {len(objects)}  chains: {args.chains}  length: {args.length}")
+    print(f"lazy per-object states:  {lazy_time * 1000:10.1f} ms")
+    print(f"engine bulk states:      {bulk_time * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
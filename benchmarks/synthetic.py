@@ -0,0 +1,257 @@
+"""
+Deterministic generator of synthetic Terraform projects for the benchmarks.
+
+``generate_project`` writes a root module of ``files`` files with
+``resources_per_file`` resources each, spread over the aws, azurerm and
+google providers using resource types the bundled validation rules check.
+Each file also declares a chain of ``locals_depth`` locals feeding its
+resources and an output; ``modules`` module calls fan out to a shared
+child module under ``modules/app``. With probability
+``reference_density`` a resource refers to an earlier resource. The same
+``SyntheticSpec`` always writes the same files.
+
+Usage:
+    python benchmarks/synthetic.py OUTPUT_DIR [--objects N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
+
+# (resource type, attribute lines, attribute that may hold a reference)
+_TEMPLATES: Dict[str, List[Tuple[str, List[str], str]]] = {
+    "aws": [
+        (
+            "aws_instance",
+            ['ami = "ami-12345678"', 'instance_type = "t2.micro"'],
+            "subnet_id",
+        ),
+        ("aws_s3_bucket", ['bucket = "{name}"'], "policy"),
+        (
+            "aws_security_group",
+            [
+                'name = "{name}"',
+                "ingress {{\n    from_port   = 22\n    to_port     = 22\n"
+                '    protocol    = "tcp"\n    cidr_blocks = ["0.0.0.0/0"]\n  }}',
+            ],
+            "vpc_id",
+        ),
+        (
+            "aws_ebs_volume",
+            ['availability_zone = "eu-west-1a"', "size = 40"],
+            "kms_key_id",
+        ),
+    ],
+    "azurerm": [
+        (
+            "azurerm_resource_group",
+            ['name = "{name}"', 'location = "westeurope"'],
+            "managed_by",
+        ),
+        (
+            "azurerm_network_security_group",
+            ['name = "{name}"', 'location = "westeurope"'],
+            "resource_group_name",
+        ),
+        (
+            "azurerm_key_vault",
+            ['name = "{name}"', 'sku_name = "standard"'],
+            "tenant_id",
+        ),
+        (
+            "azurerm_sql_server",
+            ['name = "{name}"', 'version = "12.0"'],
+            "resource_group_name",
+        ),
+    ],
+    "google": [
+        (
+            "google_compute_instance",
+            [
+                'name = "{name}"',
+                'machine_type = "n1-standard-1"',
+                'zone = "europe-west1-b"',
+            ],
+            "description",
+        ),
+        ("google_compute_network", ['name = "{name}"'], "description"),
+        (
+            "google_compute_subnetwork",
+            ['name = "{name}"', 'ip_cidr_range = "10.0.0.0/24"'],
+            "network",
+        ),
+    ],
+}
+
+_REGIONS = {"aws": "eu-west-1", "azurerm": "westeurope", "google": "europe-west1"}
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """
+    Shape of a synthetic project.
+
+    Attributes:
+        files: Resource files in the root module
+        resources_per_file: Resources declared in each file
+        providers: Providers to spread resources over, round robin
+        locals_depth: Length of the locals chain declared in each file
+        modules: Module calls in the root module, all to ``modules/app``
+        reference_density: Chance that a resource refers to an earlier one
+        seed: Seed for choosing references
+    """
+
+    files: int = 10
+    resources_per_file: int = 10
+    providers: Tuple[str, ...] = ("aws", "azurerm", "google")
+    locals_depth: int = 3
+    modules: int = 2
+    reference_density: float = 0.5
+    seed: int = 0
+
+    @property
+    def object_count(self) -> int:
+        """Objects the analyzer finds in the generated project."""
+        # Per file: resources, locals and an output. Root: three variables,
+        # the providers, the terraform block and one call and output per
+        # module. Child module: a variable, a resource and an output.
+        per_file = self.resources_per_file + self.locals_depth + 1
+        root = 3 + len(self.providers) + 1 + 2 * self.modules
+        child = 3 if self.modules else 0
+        return self.files * per_file + root + child
+
+
+def spec_for_objects(objects: int, **options) -> SyntheticSpec:
+    """A spec of 20 resources per file with about ``objects`` objects."""
+    spec = SyntheticSpec(resources_per_file=20, **options)
+    per_file = spec.resources_per_file + spec.locals_depth + 1
+    return replace(spec, files=max(1, round(objects / per_file)))
+
+
+def generate_project(root: str, spec: SyntheticSpec) -> int:
+    """
+    Write the project described by ``spec`` under ``root``.
+
+    Returns:
+        The number of objects the analyzer finds in the project
+    """
+    rng = random.Random(spec.seed)
+    os.makedirs(root, exist_ok=True)
+
+    with open(os.path.join(root, "main.tf"), "w", encoding="utf-8") as f:
+        f.write('variable "prefix" {\n  type    = string\n  default = "bench"\n}\n\n')
+        f.write('variable "environment" {\n  default = "dev"\n}\n\n')
+        f.write('variable "owner" {\n  default = "platform"\n}\n\n')
+        f.write("terraform {\n  required_providers {\n")
+        for provider in spec.providers:
+            f.write(
+                f'    {provider} = {{\n      source = "hashicorp/{provider}"\n    }}\n'
+            )
+        f.write("  }\n}\n\n")
+        for provider in spec.providers:
+            if provider == "azurerm":
+                f.write('provider "azurerm" {\n  features {}\n}\n\n')
+            else:
+                f.write(
+                    f'provider "{provider}" {{\n  region = "{_REGIONS[provider]}"\n}}\n\n'
+                )
+        for index in range(spec.modules):
+            f.write(
+                f'module "app_{index}" {{\n  source = "./modules/app"\n'
+                f'  name   = "${{var.prefix}}-app-{index}"\n}}\n\n'
+                f'output "app_{index}_id" {{\n  value = module.app_{index}.id\n}}\n\n'
+            )
+
+    if spec.modules:
+        child = os.path.join(root, "modules", "app")
+        os.makedirs(child, exist_ok=True)
+        with open(os.path.join(child, "main.tf"), "w", encoding="utf-8") as f:
+            f.write('variable "name" {\n  type = string\n}\n\n')
+            f.write(
+                'resource "aws_s3_bucket" "app" {\n  bucket = var.name\n}\n\n'
+                'output "id" {\n  value = aws_s3_bucket.app.id\n}\n'
+            )
+
+    declared: List[str] = []
+    sequence = 0
+    for file_index in range(spec.files):
+        lines: List[str] = []
+        prefix = f"f{file_index}"
+
+        lines.append("locals {")
+        for depth in range(spec.locals_depth):
+            value = (
+                f'"${{local.{prefix}_l{depth - 1}}}-{depth}"'
+                if depth
+                else '"${var.prefix}-${var.environment}"'
+            )
+            lines.append(f"  {prefix}_l{depth} = {value}")
+        lines.append("}\n")
+        name_expr = (
+            f"local.{prefix}_l{spec.locals_depth - 1}"
+            if spec.locals_depth
+            else "var.prefix"
+        )
+
+        first = None
+        for index in range(spec.resources_per_file):
+            provider = spec.providers[sequence % len(spec.providers)]
+            templates = _TEMPLATES[provider]
+            resource_type, attributes, ref_attribute = templates[
+                (sequence // len(spec.providers)) % len(templates)
+            ]
+            sequence += 1
+
+            name = f"{prefix}_r{index}"
+            address = f"{resource_type}.{name}"
+            first = first or address
+            lines.append(f'resource "{resource_type}" "{name}" {{')
+            for attribute in attributes:
+                lines.append("  " + attribute.format(name=name.replace("_", "-")))
+            if declared and rng.random() < spec.reference_density:
+                target = declared[rng.randrange(len(declared))]
+                lines.append(f"  {ref_attribute} = {target}.id")
+            lines.append("  tags = {")
+            lines.append(f"    Name        = {name_expr}")
+            lines.append("    Environment = var.environment")
+            lines.append("  }")
+            lines.append("}\n")
+            declared.append(address)
+
+        if first is not None:
+            lines.append(f'output "{prefix}_first" {{\n  value = {first}.id\n}}\n')
+        else:
+            lines.append(f'output "{prefix}_first" {{\n  value = {name_expr}\n}}\n')
+
+        path = os.path.join(root, f"{prefix}.tf")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+    return spec.object_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output_dir")
+    parser.add_argument("--objects", type=int, default=1_000)
+    parser.add_argument("--locals-depth", type=int, default=3)
+    parser.add_argument("--modules", type=int, default=2)
+    parser.add_argument("--reference-density", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = spec_for_objects(
+        args.objects,
+        locals_depth=args.locals_depth,
+        modules=args.modules,
+        reference_density=args.reference_density,
+        seed=args.seed,
+    )
+    objects = generate_project(args.output_dir, spec)
+    print(f"files: {spec.files}  objects: {objects}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,20 @@ __description__ = "Advanced Terraform Intelligence & Analysis Suite"
 __url__ = "https://github.com/ivasik-k7/tfkit"
 __license__ = "MIT"
 
-from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
-from tfkit.validator.validator import TerraformValidator
-from tfkit.visualizer.generator import ReportGenerator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+    from tfkit.validator.validator import TerraformValidator
+    from tfkit.visualizer.generator import ReportGenerator
+
+# Public classes are imported on first access (PEP 562), so that importing
+# tfkit, e.g. for the CLI, does not load the parser, rules and templates
+_LAZY_ATTRIBUTES = {
+    "TerraformAnalyzer": "tfkit.analyzer.terraform_analyzer",
+    "TerraformValidator": "tfkit.validator.validator",
+    "ReportGenerator": "tfkit.visualizer.generator",
+}
 
 __all__ = [
     "__version__",
@@ -20,3 +31,19 @@ __all__ = [
     "TerraformValidator",
     "ReportGenerator",
 ]
+
+
+def __getattr__(name):
+    """Import the public classes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
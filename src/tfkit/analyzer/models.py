@@ -1,7 +1,10 @@
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from tfkit.core.ordered_set import OrderedSet
+from tfkit.core.slots import lazy_field, slotted
 
 
 class ResourceType(Enum):
@@ -52,25 +55,80 @@ class ObjectState(Enum):
     EXTERNAL_DATA = "external_data"
 
 
+@dataclass(frozen=True)
+class StateFacts:
+    """
+    Graph facts that state computation needs beyond an object's own fields.
+
+    ``ProjectStateEngine`` works these out for a whole project in one pass.
+    A field left as None is worked out from the object's neighbours instead.
+    """
+
+    reaches_infrastructure: Optional[bool] = None
+    resource_dependents: Optional[int] = None
+    references_infrastructure: Optional[bool] = None
+
+
+_NO_FACTS = StateFacts()
+
+
+_ORDERED_DEPENDENCY_FIELDS = frozenset(
+    {"explicit_dependencies", "implicit_dependencies", "dependent_objects"}
+)
+
+
+@slotted
 @dataclass
 class DependencyInfo:
-    """Enhanced dependency information with comprehensive tracking."""
+    """
+    Enhanced dependency information with comprehensive tracking.
+
+    The core dependency fields are ``OrderedSet``s: assigning a list to one
+    converts it, and adding a name that is already present is a no-op. The
+    advanced lists are allocated when first read.
+    """
 
     # Core dependencies
-    explicit_dependencies: List[str] = field(default_factory=list)
-    implicit_dependencies: List[str] = field(default_factory=list)
-    dependent_objects: List[str] = field(default_factory=list)
+    explicit_dependencies: OrderedSet[str] = field(default_factory=OrderedSet)
+    implicit_dependencies: OrderedSet[str] = field(default_factory=OrderedSet)
+    dependent_objects: OrderedSet[str] = field(default_factory=OrderedSet)
 
     # Advanced dependency tracking
-    circular_dependencies: List[str] = field(default_factory=list)
-    missing_dependencies: List[str] = field(default_factory=list)
-    optional_dependencies: List[str] = field(default_factory=list)
-    conditional_dependencies: List[str] = field(default_factory=list)
+    circular_dependencies: List[str] = lazy_field(list)
+    missing_dependencies: List[str] = lazy_field(list)
+    optional_dependencies: List[str] = lazy_field(list)
+    conditional_dependencies: List[str] = lazy_field(list)
+
+    # (explicit version, implicit version, all dependencies)
+    _all_dependencies: Optional[Tuple[int, int, Tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _ORDERED_DEPENDENCY_FIELDS:
+            if not isinstance(value, OrderedSet):
+                value = OrderedSet(value)
+            object.__setattr__(self, "_all_dependencies", None)
+        object.__setattr__(self, name, value)
 
     @property
-    def all_dependencies(self) -> List[str]:
-        """All dependencies (explicit + implicit)."""
-        return self.explicit_dependencies + self.implicit_dependencies
+    def all_dependencies(self) -> Tuple[str, ...]:
+        """
+        All dependencies (explicit + implicit).
+
+        Cached until either set changes.
+        """
+        explicit = self.explicit_dependencies
+        implicit = self.implicit_dependencies
+        cached = self._all_dependencies
+        if (
+            cached is None
+            or cached[0] != explicit.version
+            or cached[1] != implicit.version
+        ):
+            cached = (explicit.version, implicit.version, (*explicit, *implicit))
+            self._all_dependencies = cached
+        return cached[2]
 
     @property
     def dependency_count(self) -> int:
@@ -100,12 +158,12 @@ class DependencyInfo:
     @property
     def has_circular_deps(self) -> bool:
         """True if circular dependencies detected."""
-        return len(self.circular_dependencies) > 0
+        return bool(self._lazy_circular_dependencies)
 
     @property
     def has_missing_deps(self) -> bool:
         """True if has missing/undefined dependencies."""
-        return len(self.missing_dependencies) > 0
+        return bool(self._lazy_missing_dependencies)
 
     @property
     def complexity_score(self) -> float:
@@ -137,6 +195,7 @@ class DependencyInfo:
         return self.dependent_count
 
 
+@slotted
 @dataclass
 class ResourceMetrics:
     """Enhanced metrics for resource analysis."""
@@ -160,6 +219,7 @@ class ResourceMetrics:
     naming_consistency: float = 0.0
 
 
+@slotted
 @dataclass
 class ProviderInfo:
     """Provider-specific information."""
@@ -167,7 +227,7 @@ class ProviderInfo:
     provider_name: str
     provider_alias: Optional[str] = None
     provider_version: Optional[str] = None
-    provider_config: Dict[str, Any] = field(default_factory=dict)
+    provider_config: Dict[str, Any] = lazy_field(dict)
 
     @property
     def full_provider_reference(self) -> str:
@@ -179,9 +239,10 @@ class ProviderInfo:
     @property
     def is_configured(self) -> bool:
         """True if provider has configuration."""
-        return len(self.provider_config) > 0
+        return bool(self._lazy_provider_config)
 
 
+@slotted
 @dataclass
 class LocationInfo:
     """Location information for an object."""
@@ -200,10 +261,13 @@ class LocationInfo:
         }
 
 
+@slotted
 @dataclass
 class TerraformObject:
     """
     Comprehensive Terraform object with state management and metrics.
+
+    Metrics, tags and lifecycle rules are allocated when first read.
     """
 
     type: ResourceType
@@ -215,7 +279,7 @@ class TerraformObject:
     dependency_info: DependencyInfo = field(default_factory=DependencyInfo)
 
     # Enhanced metrics
-    metrics: ResourceMetrics = field(default_factory=ResourceMetrics)
+    metrics: ResourceMetrics = lazy_field(ResourceMetrics)
 
     # Attributes (raw configuration)
     attributes: Dict[str, Any] = field(default_factory=dict)
@@ -239,15 +303,19 @@ class TerraformObject:
 
     # Common metadata
     description: Optional[str] = None
-    tags: Dict[str, str] = field(default_factory=dict)
-    lifecycle_rules: Dict[str, Any] = field(default_factory=dict)
+    tags: Dict[str, str] = lazy_field(dict)
+    lifecycle_rules: Dict[str, Any] = lazy_field(dict)
 
     # State (computed lazily)
     _state: Optional[ObjectState] = None
     _state_reason: Optional[str] = None
-    _all_objects_cache: Optional[Dict[str, "TerraformObject"]] = None
+    # Incompleteness reason recorded by record_completeness ("" if complete)
+    _incompleteness: Optional[str] = None
+    _all_objects_cache: Optional[Mapping[str, "TerraformObject"]] = None
 
-    def set_all_objects_cache(self, all_objects: Dict[str, "TerraformObject"]) -> None:
+    def set_all_objects_cache(
+        self, all_objects: Mapping[str, "TerraformObject"]
+    ) -> None:
         """Set reference to all objects for state computation."""
         self._all_objects_cache = all_objects
 
@@ -265,12 +333,38 @@ class TerraformObject:
             self._state, self._state_reason = self._compute_state()
         return self._state_reason
 
+    def record_completeness(self) -> None:
+        """
+        Remember whether the configuration is complete.
+
+        States recomputed later use this instead of ``attributes``, so they
+        stay the same after the raw attributes are dropped.
+        """
+        self._incompleteness = (
+            self._get_incompleteness_reason() if self._is_incomplete() else ""
+        )
+
     def invalidate_state(self) -> None:
         """Invalidate cached state to force recomputation."""
         self._state = None
         self._state_reason = None
 
-    def _compute_state(self) -> tuple[ObjectState, str]:
+    def refresh_state(self, facts: Optional[StateFacts] = None) -> ObjectState:
+        """
+        Compute and cache the state now.
+
+        Args:
+            facts: Precomputed graph facts; missing ones are looked up lazily
+
+        Returns:
+            The new state
+        """
+        self._state, self._state_reason = self._compute_state(facts)
+        return self._state
+
+    def _compute_state(
+        self, facts: Optional[StateFacts] = None
+    ) -> tuple[ObjectState, str]:
         """
         Compute semantic state using comprehensive criteria.
 
@@ -280,9 +374,15 @@ class TerraformObject:
         3. Structural patterns (isolated, leaf, hub)
         4. Quality assessment (healthy, integrated, active)
 
+        Args:
+            facts: Precomputed graph facts; missing ones are looked up lazily
+
         Returns:
             Tuple of (ObjectState, reason_string)
         """
+        if facts is None:
+            facts = _NO_FACTS
+
         dep_info = self.dependency_info
         dep_count = dep_info.dependency_count
         dependent_count = dep_info.dependent_count
@@ -317,16 +417,21 @@ class TerraformObject:
             )
 
         # Incomplete configuration
-        if self._is_incomplete():
-            reason = self._get_incompleteness_reason()
-            return ObjectState.INCOMPLETE, reason
+        incompleteness = self._incompleteness
+        if incompleteness is None and self._is_incomplete():
+            incompleteness = self._get_incompleteness_reason()
+        if incompleteness:
+            return ObjectState.INCOMPLETE, incompleteness
 
         # ==================== TYPE-SPECIFIC LOGIC ====================
 
         # VARIABLES - Input parameters
         if self.type == ResourceType.VARIABLE:
             # Check if variable is actually used (has real consumers down the chain)
-            if not self._has_downstream_infrastructure_usage():
+            reaches = facts.reaches_infrastructure
+            if reaches is None:
+                reaches = self._has_downstream_infrastructure_usage()
+            if not reaches:
                 if self.default_value is not None:
                     return (
                         ObjectState.UNUSED,
@@ -345,7 +450,9 @@ class TerraformObject:
         # PROVIDERS - Infrastructure configuration
         if self.type == ResourceType.PROVIDER:
             # Count only actual resources/data sources that use this provider
-            resource_dependents = self._count_resource_dependents()
+            resource_dependents = facts.resource_dependents
+            if resource_dependents is None:
+                resource_dependents = self._count_resource_dependents()
 
             if resource_dependents == 0:
                 # Check if provider is used indirectly (variables feeding into it)
@@ -374,7 +481,10 @@ class TerraformObject:
 
             # Outputs are MEANT to be external interfaces - they don't need internal consumers
             # Check if output references real infrastructure
-            if self._references_infrastructure():
+            references = facts.references_infrastructure
+            if references is None:
+                references = self._references_infrastructure()
+            if references:
                 if dependent_count == 0:
                     # This is NORMAL and GOOD for outputs!
                     return (
@@ -403,7 +513,10 @@ class TerraformObject:
         # LOCALS - Computed values
         if self.type == ResourceType.LOCAL:
             # Check if this local contributes to real infrastructure
-            if not self._has_downstream_infrastructure_usage():
+            reaches = facts.reaches_infrastructure
+            if reaches is None:
+                reaches = self._has_downstream_infrastructure_usage()
+            if not reaches:
                 if dep_count > 0:
                     return (
                         ObjectState.UNUSED,
@@ -834,7 +947,7 @@ class TerraformObject:
 
         # Has tags (at least 2 for resources)
         if self.type == ResourceType.RESOURCE:
-            has_tags = len(self.tags) >= 2
+            has_tags = len(self._lazy_tags or ()) >= 2
             checks.append(has_tags)
 
         # Consistent naming
@@ -890,13 +1003,15 @@ class TerraformObject:
             "default_value": self.default_value,
             "description": self.description,
             "sensitive": self.sensitive,
-            "tags": self.tags,
+            "tags": self._lazy_tags or {},
             "dependencies": {
-                "explicit": self.dependency_info.explicit_dependencies,
-                "implicit": self.dependency_info.implicit_dependencies,
-                "dependents": self.dependency_info.dependent_objects,
-                "circular": self.dependency_info.circular_dependencies,
-                "missing": self.dependency_info.missing_dependencies,
+                "explicit": list(self.dependency_info.explicit_dependencies),
+                "implicit": list(self.dependency_info.implicit_dependencies),
+                "dependents": list(self.dependency_info.dependent_objects),
+                "circular": list(
+                    self.dependency_info._lazy_circular_dependencies or ()
+                ),
+                "missing": list(self.dependency_info._lazy_missing_dependencies or ()),
                 "counts": {
                     "dependencies": self.dependency_info.dependency_count,
                     "dependents": self.dependency_info.dependent_count,
@@ -0,0 +1,383 @@
+"""
+Analysis of local child modules.
+
+A ``module`` block whose ``source`` is a local path (``./`` or ``../``)
+calls the Terraform configuration in that directory. ``ModuleResolver``
+analyzes each distinct module directory once, memoized by its resolved
+path and a hash of its files, however many blocks call it. It then links
+every call site to the child module: arguments feed the child's
+variables, and ``module.<name>.<output>`` references read the child's
+outputs.
+
+The result is a ``ModuleTree`` whose dependency graph covers every
+module instance at full depth, with Terraform-style addresses such as
+``module.network.aws_vpc.main``. Only the graph is expanded per call
+site; parsing and dependency extraction happen once per directory.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from tfkit.core.cache import MemoryParseCache, ParseCache
+from tfkit.core.walker import FileWalker
+
+from .models import TerraformObject
+from .project import TerraformProject
+from .terraform_analyzer import DependencyExtractor, TerraformAnalyzer
+
+# Module block arguments that are not input variables
+META_ARGUMENTS = frozenset(
+    {"source", "version", "providers", "count", "for_each", "depends_on"}
+)
+
+# module.<call>.<output>
+_OUTPUT_REFERENCE = re.compile(
+    r"\bmodule\.([a-zA-Z_][a-zA-Z0-9_-]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)"
+)
+
+
+def is_local_source(source: object) -> bool:
+    """Check whether a module source is a local directory."""
+    return isinstance(source, str) and source.startswith(("./", "../"))
+
+
+@dataclass
+class ModuleCall:
+    """
+    One module instance: a ``module`` block and the module it calls.
+
+    Attributes:
+        address: Full address of the instance, e.g. ``module.app.module.db``
+        source: The block's ``source`` argument
+        directory: Resolved directory of a local source
+        inputs: Child variable name to the caller's addresses it is set from
+        unknown_inputs: Arguments the child module declares no variable for
+        missing_inputs: Child variables without a default that are not set
+        error: Why a local module could not be analyzed
+    """
+
+    address: str
+    source: Optional[str]
+    directory: Optional[str] = None
+    inputs: Dict[str, List[str]] = field(default_factory=dict)
+    unknown_inputs: List[str] = field(default_factory=list)
+    missing_inputs: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def is_local(self) -> bool:
+        """Whether the source is a local directory."""
+        return is_local_source(self.source)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to dictionary."""
+        return {
+            "address": self.address,
+            "source": self.source,
+            "directory": self.directory,
+            "inputs": self.inputs,
+            "unknown_inputs": self.unknown_inputs,
+            "missing_inputs": self.missing_inputs,
+            "error": self.error,
+        }
+
+
+@dataclass
+class ModuleTree:
+    """
+    A root project with its local child modules resolved.
+
+    Attributes:
+        root: The root project
+        modules: Analyzed child modules by directory, one per directory
+        calls: Every module instance by address, local or not
+        graph: Dependencies of every object of every instance, by address
+    """
+
+    root: TerraformProject
+    modules: Dict[str, TerraformProject] = field(default_factory=dict)
+    calls: Dict[str, ModuleCall] = field(default_factory=dict)
+    graph: Dict[str, List[str]] = field(default_factory=dict)
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """Reverse of ``graph``: what depends on each address."""
+        reverse: Dict[str, List[str]] = {name: [] for name in self.graph}
+        for name, dependencies in self.graph.items():
+            for dependency in dependencies:
+                reverse.setdefault(dependency, []).append(name)
+        return reverse
+
+
+@dataclass
+class _LocalCall:
+    """A module block of one analyzed module, before it is expanded."""
+
+    name: str
+    source: Optional[str]
+    directory: Optional[str] = None
+    # Argument name to the caller's addresses it reads
+    arguments: Dict[str, List[str]] = field(default_factory=dict)
+    # Argument name to the (call, output) pairs it reads
+    argument_reads: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class _ModuleAnalysis:
+    """What expanding a module needs, worked out once per module."""
+
+    project: TerraformProject
+    calls: List[_LocalCall]
+    # Object name to the (call, output) pairs it reads
+    output_refs: Dict[str, List[Tuple[str, str]]]
+    # Variables without a default
+    required_inputs: List[str]
+    directory: Optional[str] = None
+
+
+class ModuleResolver:
+    """
+    Resolves local module calls and analyzes each module directory once.
+
+    Analyses are memoized across ``resolve`` calls, keyed by the module's
+    real path and a hash of its files, so a resolver can be reused for
+    several roots and picks up edited modules.
+
+    Args:
+        workers: Parse processes per module analysis, as for
+            ``TerraformAnalyzer``
+        cache: Optional parse cache shared by all module analyses
+        walker: File discovery settings for module directories
+
+    Attributes:
+        analyzed: Number of module directories analyzed so far
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = 1,
+        cache: Optional[ParseCache] = None,
+        walker: Optional[FileWalker] = None,
+    ):
+        self.workers = workers
+        if not isinstance(cache, MemoryParseCache):
+            cache = MemoryParseCache(cache)
+        self.cache = cache
+        self.walker = walker or FileWalker()
+        self.analyzed = 0
+        self._analyses: Dict[Tuple[str, str], _ModuleAnalysis] = {}
+
+    def resolve(self, project: TerraformProject) -> ModuleTree:
+        """
+        Resolve the module calls of an analyzed root project.
+
+        Args:
+            project: Result of ``TerraformAnalyzer.analyze_project``
+
+        Returns:
+            The root project, its child modules and the full-depth graph
+        """
+        tree = ModuleTree(root=project)
+        digests: Dict[str, Optional[str]] = {}
+        root = self._prepare(
+            project, os.path.realpath(project.metadata.project_path or ".")
+        )
+        self._expand(root, "", tree, [], digests)
+        return tree
+
+    def _expand(
+        self,
+        analysis: _ModuleAnalysis,
+        prefix: str,
+        tree: ModuleTree,
+        stack: List[str],
+        digests: Dict[str, Optional[str]],
+    ) -> None:
+        """Add one module instance, and the instances it calls, to the tree."""
+        graph = tree.graph
+        for name, obj in analysis.project.all_objects.items():
+            graph[prefix + name] = [
+                prefix + d for d in obj.dependency_info.all_dependencies
+            ]
+
+        if analysis.directory is not None:
+            stack = stack + [analysis.directory]
+
+        expanded: Dict[str, _ModuleAnalysis] = {}
+        linked: List[Tuple[_LocalCall, ModuleCall]] = []
+        for local in analysis.calls:
+            address = f"{prefix}module.{local.name}"
+            call = ModuleCall(
+                address=address,
+                source=local.source,
+                directory=local.directory,
+                error=local.error,
+            )
+            tree.calls[address] = call
+            if local.directory is None or local.error is not None:
+                continue
+            if local.directory in stack:
+                call.error = "Module calls itself recursively"
+                continue
+
+            child = self._analyze(local.directory, digests)
+            if isinstance(child, str):
+                call.error = child
+                continue
+
+            variables = child.project.variables
+            for argument, refs in local.arguments.items():
+                if f"var.{argument}" in variables:
+                    call.inputs[argument] = [prefix + ref for ref in refs]
+                else:
+                    call.unknown_inputs.append(argument)
+            call.missing_inputs = [
+                v for v in child.required_inputs if v not in local.arguments
+            ]
+
+            tree.modules[local.directory] = child.project
+            expanded[local.name] = child
+            linked.append((local, call))
+            self._expand(child, address + ".", tree, stack, digests)
+
+        def output_nodes(reads: List[Tuple[str, str]]) -> List[str]:
+            # Reads of a child's outputs point into the child instance
+            nodes = []
+            for call_name, output in reads:
+                child = expanded.get(call_name)
+                if child is not None and f"output.{output}" in child.project.outputs:
+                    nodes.append(f"{prefix}module.{call_name}.output.{output}")
+            return nodes
+
+        for name, reads in analysis.output_refs.items():
+            graph[prefix + name].extend(output_nodes(reads))
+
+        for local, call in linked:
+            for variable, refs in call.inputs.items():
+                refs.extend(output_nodes(local.argument_reads.get(variable, [])))
+                graph[f"{call.address}.var.{variable}"].extend(refs)
+
+    def _analyze(
+        self, directory: str, digests: Dict[str, Optional[str]]
+    ) -> Union[_ModuleAnalysis, str]:
+        """Return the memoized analysis of a module directory, or an error."""
+        if directory not in digests:
+            digests[directory] = self._digest(directory)
+        digest = digests[directory]
+        if digest is None:
+            return f"No Terraform files found in {directory}"
+
+        key = (directory, digest)
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analyzer = TerraformAnalyzer(
+                workers=self.workers, cache=self.cache, walker=self.walker
+            )
+            try:
+                project = analyzer.analyze_project(directory, recursive=False)
+            except (ValueError, OSError) as e:
+                return str(e)
+            self.analyzed += 1
+            analysis = self._prepare(project, directory)
+            self._analyses[key] = analysis
+        return analysis
+
+    def _prepare(
+        self, project: TerraformProject, directory: Optional[str] = None
+    ) -> _ModuleAnalysis:
+        """Work out the module calls, output reads and inputs of one module."""
+        objects = project.all_objects
+        module_names = {obj.name for obj in project.modules.values()}
+        calls = []
+        output_refs: Dict[str, List[Tuple[str, str]]] = {}
+
+        if module_names:
+            extractor = DependencyExtractor(objects, project.symbols)
+            calls = [
+                self._local_call(obj, extractor, module_names)
+                for obj in project.modules.values()
+            ]
+
+            for name, obj in objects.items():
+                if any(
+                    d.startswith("module.")
+                    for d in obj.dependency_info.all_dependencies
+                ):
+                    reads = _output_reads(obj.attributes, module_names)
+                    if reads:
+                        output_refs[name] = reads
+
+        required_inputs = [
+            variable.name
+            for variable in project.variables.values()
+            if "default" not in variable.attributes
+        ]
+
+        return _ModuleAnalysis(project, calls, output_refs, required_inputs, directory)
+
+    @staticmethod
+    def _local_call(
+        obj: TerraformObject, extractor: DependencyExtractor, module_names: Set[str]
+    ) -> _LocalCall:
+        """Read the directory and arguments of one module block."""
+        local = _LocalCall(obj.name, obj.source)
+        if not is_local_source(obj.source):
+            return local
+
+        base = os.path.dirname(obj.location.file_path)
+        local.directory = os.path.realpath(os.path.join(base, obj.source))
+        if not os.path.isdir(local.directory):
+            local.error = f"Module directory not found: {local.directory}"
+            return local
+
+        arguments = obj.attributes if isinstance(obj.attributes, dict) else {}
+        for argument, value in arguments.items():
+            if argument not in META_ARGUMENTS:
+                info = extractor.extract(value, obj.full_name)
+                local.arguments[argument] = list(info.all_dependencies)
+                local.argument_reads[argument] = _output_reads(value, module_names)
+        return local
+
+    def _digest(self, directory: str) -> Optional[str]:
+        """Hash a module directory's Terraform files, or None if it has none."""
+        files = self.walker.walk(directory, recursive=False).terraform
+        if not files:
+            return None
+
+        digest = hashlib.sha256()
+        for path in files:
+            digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                pass
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+
+def _output_reads(config: object, module_names: Set[str]) -> List[Tuple[str, str]]:
+    """Find the ``module.<call>.<output>`` reads in a configuration tree."""
+    reads: Dict[Tuple[str, str], None] = {}
+    for text in _strings(config):
+        for match in _OUTPUT_REFERENCE.finditer(text):
+            if match.group(1) in module_names:
+                reads[(match.group(1), match.group(2))] = None
+    return list(reads)
+
+
+def _strings(value: object) -> Iterator[str]:
+    """Yield the string leaves (and string keys) of a configuration tree."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+            stack.extend(k for k in item if isinstance(k, str))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
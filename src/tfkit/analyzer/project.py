@@ -1,10 +1,42 @@
+import fnmatch
+import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import (
+    IO,
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from tfkit.core.graph import find_cycles, strongly_connected_components
+from tfkit.core.jsonstream import JSONStreamWriter
+from tfkit.core.symbols import SymbolTable
 
 from .models import ObjectState, ResourceType, TerraformObject
 
 
+class _ChainFacts(NamedTuple):
+    """Dependency chains starting from one name; lengths count names."""
+
+    count: int
+    shortest: int
+    longest: int
+    shortest_next: Optional[str]
+    longest_next: Optional[str]
+
+
 @dataclass
 class ProjectMetadata:
     """Metadata about the Terraform project."""
@@ -13,6 +45,8 @@ class ProjectMetadata:
     total_files: int = 0
     analysis_timestamp: Optional[str] = None
     terraform_version: Optional[str] = None
+    files_opened: int = 0
+    bytes_read: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -21,6 +55,8 @@ class ProjectMetadata:
             "total_files": self.total_files,
             "analysis_timestamp": self.analysis_timestamp,
             "terraform_version": self.terraform_version,
+            "files_opened": self.files_opened,
+            "bytes_read": self.bytes_read,
         }
 
 
@@ -130,6 +166,20 @@ class ProjectStatistics:
         }
 
 
+def _index_keys(obj: TerraformObject) -> Tuple[Optional[str], Optional[str]]:
+    """The provider and resource type an object is indexed under."""
+    provider = obj.provider_info.provider_name if obj.provider_info else None
+    return provider, obj.resource_type
+
+
+def _unindex(index: Dict[str, Dict[str, None]], key: Optional[str], name: str) -> None:
+    bucket = index.get(key) if key is not None else None
+    if bucket is not None:
+        bucket.pop(name, None)
+        if not bucket:
+            del index[key]
+
+
 class TerraformProject:
     """
     Enhanced Terraform project container with comprehensive object management.
@@ -142,6 +192,11 @@ class TerraformProject:
         """Initialize an empty project."""
         self._objects: Dict[str, TerraformObject] = {}
 
+        # Shared copies of referenced addresses that are not object names
+        # (missing and partial references); object names are shared
+        # through their full_name
+        self.symbols = SymbolTable()
+
         # Type-specific indexes for fast access
         self._resources: Dict[str, TerraformObject] = {}
         self._data_sources: Dict[str, TerraformObject] = {}
@@ -151,6 +206,40 @@ class TerraformProject:
         self._providers: Dict[str, TerraformObject] = {}
         self._locals: Dict[str, TerraformObject] = {}
         self._terraform_blocks: Dict[str, TerraformObject] = {}
+        self._type_index: Dict[ResourceType, Dict[str, TerraformObject]] = {
+            ResourceType.RESOURCE: self._resources,
+            ResourceType.DATA: self._data_sources,
+            ResourceType.MODULE: self._modules,
+            ResourceType.VARIABLE: self._variables,
+            ResourceType.OUTPUT: self._outputs,
+            ResourceType.PROVIDER: self._providers,
+            ResourceType.LOCAL: self._locals,
+            ResourceType.TERRAFORM: self._terraform_blocks,
+        }
+
+        # Read-only views handed out by the collection properties. They
+        # follow the dicts above, which are only ever mutated in place.
+        self._all_view = MappingProxyType(self._objects)
+        self._type_views = {
+            resource_type: MappingProxyType(objects)
+            for resource_type, objects in self._type_index.items()
+        }
+        self._empty_view: Mapping[str, TerraformObject] = MappingProxyType({})
+
+        # Ownership index: file path -> names declared in that file, in
+        # declaration order. A name declared in several files is listed
+        # under each of them; the last declaration wins in ``_objects``.
+        self._objects_by_file: Dict[str, Dict[str, None]] = {}
+
+        # Secondary indexes: provider name and resource type -> names, in
+        # project order. A redeclaration that moves an object to another
+        # key marks them stale and they are rebuilt on next use.
+        self._by_provider: Dict[str, Dict[str, None]] = {}
+        self._by_resource_type: Dict[str, Dict[str, None]] = {}
+        self._indexes_stale = False
+
+        # Terraform and tfvars files the project was analyzed from
+        self.source_files: List[str] = []
 
         # Additional data
         self.tfvars_files: Dict[str, Dict[str, Any]] = {}
@@ -159,8 +248,14 @@ class TerraformProject:
         # Metadata
         self.metadata = ProjectMetadata(project_path=project_path or str(Path.cwd()))
 
-        # Cached statistics
+        # Cached results, cleared by invalidate_caches()
         self._statistics: Optional[ProjectStatistics] = None
+        self._validation: Optional[List[str]] = None
+        self._objects_dict: Optional[Dict[str, Dict[str, Any]]] = None
+        self._statistics_dict: Optional[Dict[str, Any]] = None
+        self._by_state: Optional[Dict[ObjectState, Dict[str, None]]] = None
+        self._positions: Optional[Dict[str, int]] = None
+        self._relative_paths: Optional[Dict[str, str]] = None
 
     # ============ Object Management ============
 
@@ -168,27 +263,43 @@ class TerraformProject:
         """
         Add a Terraform object to the project.
 
-        Automatically indexes by type and invalidates statistics cache.
+        Automatically indexes by type, file, provider and resource type,
+        and invalidates cached results.
         """
+        previous = self._objects.get(obj.full_name)
+        if previous is None:
+            self._index_secondary(obj)
+        elif _index_keys(previous) != _index_keys(obj):
+            self._indexes_stale = True
+
         self._objects[obj.full_name] = obj
 
         # Index by type
-        type_map = {
-            ResourceType.RESOURCE: self._resources,
-            ResourceType.DATA: self._data_sources,
-            ResourceType.MODULE: self._modules,
-            ResourceType.VARIABLE: self._variables,
-            ResourceType.OUTPUT: self._outputs,
-            ResourceType.PROVIDER: self._providers,
-            ResourceType.LOCAL: self._locals,
-            ResourceType.TERRAFORM: self._terraform_blocks,
-        }
+        if obj.type in self._type_index:
+            self._type_index[obj.type][obj.full_name] = obj
+
+        self._objects_by_file.setdefault(obj.location.file_path, {})[
+            obj.full_name
+        ] = None
 
-        if obj.type in type_map:
-            type_map[obj.type][obj.full_name] = obj
+        self.invalidate_caches()
 
-        # Invalidate cache
+    def invalidate_caches(self) -> None:
+        """
+        Drop cached statistics, validation, serialization and state index
+        results.
+
+        Adding, removing or reordering objects and rebuilding the graph do
+        this automatically. Code that changes objects in place (their
+        dependencies or states) calls it when done.
+        """
         self._statistics = None
+        self._validation = None
+        self._objects_dict = None
+        self._statistics_dict = None
+        self._by_state = None
+        self._positions = None
+        self._relative_paths = None
 
     def get_object(self, full_name: str) -> Optional[TerraformObject]:
         """Get an object by its full name."""
@@ -208,105 +319,305 @@ class TerraformProject:
         del self._objects[full_name]
 
         # Remove from type index
-        type_map = {
-            ResourceType.RESOURCE: self._resources,
-            ResourceType.DATA: self._data_sources,
-            ResourceType.MODULE: self._modules,
-            ResourceType.VARIABLE: self._variables,
-            ResourceType.OUTPUT: self._outputs,
-            ResourceType.PROVIDER: self._providers,
-            ResourceType.LOCAL: self._locals,
-            ResourceType.TERRAFORM: self._terraform_blocks,
-        }
+        self._type_index.get(obj.type, {}).pop(full_name, None)
 
-        if obj.type in type_map and full_name in type_map[obj.type]:
-            del type_map[obj.type][full_name]
+        provider, resource_type = _index_keys(obj)
+        _unindex(self._by_provider, provider, full_name)
+        _unindex(self._by_resource_type, resource_type, full_name)
 
-        # Invalidate cache
-        self._statistics = None
+        owned = self._objects_by_file.get(obj.location.file_path)
+        if owned is not None:
+            owned.pop(full_name, None)
+            if not owned:
+                del self._objects_by_file[obj.location.file_path]
+
+        self.invalidate_caches()
 
         return True
 
+    def remove_file(self, file_path: str) -> List[str]:
+        """
+        Remove every object defined in a file.
+
+        Returns:
+            Names of the removed objects
+        """
+        removed = []
+        for full_name in list(self._objects_by_file.get(file_path, ())):
+            obj = self._objects.get(full_name)
+            if obj is not None and obj.location.file_path == file_path:
+                self.remove_object(full_name)
+                removed.append(full_name)
+
+        self._objects_by_file.pop(file_path, None)
+        return removed
+
+    def get_names_by_file(self, file_path: str) -> List[str]:
+        """
+        Get every name declared in a file, including declarations that are
+        shadowed by a later file defining the same name.
+        """
+        return list(self._objects_by_file.get(file_path, ()))
+
+    @property
+    def files(self) -> List[str]:
+        """Get all files that declare at least one object."""
+        return list(self._objects_by_file)
+
+    def reorder_by_files(self, file_paths: List[str]) -> None:
+        """
+        Reorder objects as if the files had been added in the given order.
+
+        A name keeps the position of its first declaration, matching the
+        order a fresh analysis produces.
+        """
+        ordered: Dict[str, TerraformObject] = {}
+        for file_path in file_paths:
+            for full_name in self._objects_by_file.get(file_path, ()):
+                if full_name not in ordered and full_name in self._objects:
+                    ordered[full_name] = self._objects[full_name]
+
+        # Objects whose file was not listed keep their relative order
+        for full_name, obj in self._objects.items():
+            if full_name not in ordered:
+                ordered[full_name] = obj
+
+        # Rebuild in place so the views handed out stay valid
+        self._objects.clear()
+        self._objects.update(ordered)
+
+        for objects in self._type_index.values():
+            objects.clear()
+        for full_name, obj in ordered.items():
+            if obj.type in self._type_index:
+                self._type_index[obj.type][full_name] = obj
+
+        self._indexes_stale = True
+        self.invalidate_caches()
+
     # ============ Querying ============
 
     @property
-    def all_objects(self) -> Dict[str, TerraformObject]:
-        """Get all objects."""
-        return self._objects.copy()
+    def all_objects(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all objects."""
+        return self._all_view
 
     @property
-    def resources(self) -> Dict[str, TerraformObject]:
-        """Get all resources."""
-        return self._resources.copy()
+    def resources(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all resources."""
+        return self._type_views[ResourceType.RESOURCE]
 
     @property
-    def data_sources(self) -> Dict[str, TerraformObject]:
-        """Get all data sources."""
-        return self._data_sources.copy()
+    def data_sources(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all data sources."""
+        return self._type_views[ResourceType.DATA]
 
     @property
-    def modules(self) -> Dict[str, TerraformObject]:
-        """Get all modules."""
-        return self._modules.copy()
+    def modules(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all modules."""
+        return self._type_views[ResourceType.MODULE]
 
     @property
-    def variables(self) -> Dict[str, TerraformObject]:
-        """Get all variables."""
-        return self._variables.copy()
+    def variables(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all variables."""
+        return self._type_views[ResourceType.VARIABLE]
 
     @property
-    def outputs(self) -> Dict[str, TerraformObject]:
-        """Get all outputs."""
-        return self._outputs.copy()
+    def outputs(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all outputs."""
+        return self._type_views[ResourceType.OUTPUT]
 
     @property
-    def providers(self) -> Dict[str, TerraformObject]:
-        """Get all providers."""
-        return self._providers.copy()
+    def providers(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all providers."""
+        return self._type_views[ResourceType.PROVIDER]
 
     @property
-    def locals(self) -> Dict[str, TerraformObject]:
-        """Get all locals."""
-        return self._locals.copy()
+    def locals(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all locals."""
+        return self._type_views[ResourceType.LOCAL]
 
     @property
-    def terraform_blocks(self) -> Dict[str, TerraformObject]:
-        """Get all terraform blocks."""
-        return self._terraform_blocks.copy()
+    def terraform_blocks(self) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all terraform blocks."""
+        return self._type_views[ResourceType.TERRAFORM]
 
     def get_objects_by_type(
         self, resource_type: ResourceType
+    ) -> Mapping[str, TerraformObject]:
+        """Get a read-only view of all objects of a specific type."""
+        return self._type_views.get(resource_type, self._empty_view)
+
+    def snapshot(
+        self, resource_type: Optional[ResourceType] = None
     ) -> Dict[str, TerraformObject]:
-        """Get all objects of a specific type."""
-        type_map = {
-            ResourceType.RESOURCE: self._resources,
-            ResourceType.DATA: self._data_sources,
-            ResourceType.MODULE: self._modules,
-            ResourceType.VARIABLE: self._variables,
-            ResourceType.OUTPUT: self._outputs,
-            ResourceType.PROVIDER: self._providers,
-            ResourceType.LOCAL: self._locals,
-            ResourceType.TERRAFORM: self._terraform_blocks,
-        }
-        return type_map.get(resource_type, {}).copy()
+        """
+        Copy the objects into a new dict that later changes do not affect.
+
+        The collection properties return live read-only views; use this
+        when the caller needs to mutate the result or keep it unchanged.
+
+        Args:
+            resource_type: Copy only objects of this type. Defaults to all.
+        """
+        if resource_type is None:
+            return dict(self._objects)
+        return dict(self._type_index.get(resource_type, {}))
 
     def get_objects_by_state(self, state: ObjectState) -> List[TerraformObject]:
         """Get all objects in a specific state."""
-        return [obj for obj in self._objects.values() if obj.state == state]
+        return self._resolve(self._state_index().get(state, ()))
 
     def get_objects_by_file(self, file_path: str) -> List[TerraformObject]:
         """Get all objects defined in a specific file."""
-        return [
-            obj for obj in self._objects.values() if obj.location.file_path == file_path
-        ]
+        objects = []
+        for full_name in self._objects_by_file.get(file_path, ()):
+            obj = self._objects.get(full_name)
+            if obj is not None and obj.location.file_path == file_path:
+                objects.append(obj)
+        return objects
 
     def get_objects_by_provider(self, provider: str) -> List[TerraformObject]:
         """Get all objects using a specific provider."""
-        return [
-            obj
-            for obj in self._objects.values()
-            if obj.provider_info and obj.provider_info.provider_name == provider
-        ]
+        self._refresh_indexes()
+        return self._resolve(self._by_provider.get(provider, ()))
+
+    def get_objects_by_resource_type(self, resource_type: str) -> List[TerraformObject]:
+        """Get all resources and data sources of a type, e.g. ``aws_s3_bucket``."""
+        self._refresh_indexes()
+        return self._resolve(self._by_resource_type.get(resource_type, ()))
+
+    def query(
+        self,
+        type: Optional[ResourceType] = None,
+        provider: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        state: Optional[ObjectState] = None,
+        file_glob: Optional[str] = None,
+    ) -> List[TerraformObject]:
+        """
+        Get the objects matching every given criterion.
+
+        Each criterion is looked up in its index and the smallest match is
+        filtered by the others, so no criterion scans the whole project.
+
+        Args:
+            type: Object type, as a ``ResourceType`` or its value
+            provider: Provider name, e.g. ``aws``
+            resource_type: Resource or data source type, e.g. ``aws_vpc``
+            state: Computed state, as an ``ObjectState`` or its value
+            file_glob: ``fnmatch`` pattern for the declaring file, matched
+                against the path relative to the project (or the full path
+                for absolute patterns)
+
+        Returns:
+            Matching objects in project order; every object if no
+            criterion is given
+        """
+        candidates: List[Collection[str]] = []
+        if type is not None:
+            candidates.append(self._type_index.get(ResourceType(type), {}))
+        if provider is not None or resource_type is not None:
+            self._refresh_indexes()
+        if provider is not None:
+            candidates.append(self._by_provider.get(provider, {}))
+        if resource_type is not None:
+            candidates.append(self._by_resource_type.get(resource_type, {}))
+        if state is not None:
+            candidates.append(self._state_index().get(ObjectState(state), {}))
+
+        file_matches: Optional[Set[str]] = None
+        if file_glob is not None:
+            file_matches = self._names_in_files(file_glob)
+            candidates.append(file_matches)
+
+        if not candidates:
+            return list(self._objects.values())
+
+        smallest = min(candidates, key=len)
+        others = [c for c in candidates if c is not smallest]
+        names = [n for n in smallest if all(n in c for c in others)]
+
+        if smallest is file_matches:
+            # Names from several files come in no particular order
+            positions = self._object_positions()
+            names.sort(key=positions.__getitem__)
+        return self._resolve(names)
+
+    def _names_in_files(self, file_glob: str) -> Set[str]:
+        """Names of the objects declared in files matching a pattern."""
+        absolute = os.path.isabs(file_glob)
+        relative = self._relative_files()
+
+        if not any(char in file_glob for char in "*?["):
+            # A plain path is looked up instead of matched against every file
+            if absolute:
+                file_path: Optional[str] = file_glob
+            else:
+                file_path = relative.get(
+                    os.path.normpath(file_glob).replace(os.sep, "/")
+                )
+            matched = [file_path] if file_path in self._objects_by_file else []
+        else:
+            matched = [
+                file_path
+                for rel_path, file_path in relative.items()
+                if fnmatch.fnmatchcase(file_path if absolute else rel_path, file_glob)
+            ]
+
+        names: Set[str] = set()
+        for file_path in matched:
+            for name in self._objects_by_file[file_path]:
+                obj = self._objects.get(name)
+                if obj is not None and obj.location.file_path == file_path:
+                    names.add(name)
+        return names
+
+    def _relative_files(self) -> Dict[str, str]:
+        """Declaring files by path relative to the project, cached."""
+        if self._relative_paths is None:
+            root = self.metadata.project_path
+            self._relative_paths = {
+                os.path.relpath(file_path, root).replace(os.sep, "/"): file_path
+                for file_path in self._objects_by_file
+            }
+        return self._relative_paths
+
+    def _resolve(self, names: Iterable[str]) -> List[TerraformObject]:
+        objects = self._objects
+        return [objects[name] for name in names]
+
+    def _index_secondary(self, obj: TerraformObject) -> None:
+        provider, resource_type = _index_keys(obj)
+        if provider is not None:
+            self._by_provider.setdefault(provider, {})[obj.full_name] = None
+        if resource_type is not None:
+            self._by_resource_type.setdefault(resource_type, {})[obj.full_name] = None
+
+    def _refresh_indexes(self) -> None:
+        """Rebuild the provider and resource type indexes if they are stale."""
+        if not self._indexes_stale:
+            return
+        self._by_provider.clear()
+        self._by_resource_type.clear()
+        for obj in self._objects.values():
+            self._index_secondary(obj)
+        self._indexes_stale = False
+
+    def _state_index(self) -> Dict[ObjectState, Dict[str, None]]:
+        """Names by computed state, cached until the project changes."""
+        if self._by_state is None:
+            by_state: Dict[ObjectState, Dict[str, None]] = {}
+            for name, obj in self._objects.items():
+                by_state.setdefault(obj.state, {})[name] = None
+            self._by_state = by_state
+        return self._by_state
+
+    def _object_positions(self) -> Dict[str, int]:
+        """Position of every name in project order, cached like the results."""
+        if self._positions is None:
+            self._positions = {name: i for i, name in enumerate(self._objects)}
+        return self._positions
 
     # ============ Dependency Analysis ============
 
@@ -327,12 +638,10 @@ class TerraformProject:
             for dep_name in obj.dependency_info.all_dependencies:
                 dep_obj = self._objects.get(dep_name)
                 if dep_obj:
-                    if obj.full_name not in dep_obj.dependency_info.dependent_objects:
-                        dep_obj.dependency_info.dependent_objects.append(obj.full_name)
-                        dep_obj.invalidate_state()
+                    dep_obj.dependency_info.dependent_objects.add(obj.full_name)
+                    dep_obj.invalidate_state()
 
-        # Invalidate statistics cache
-        self._statistics = None
+        self.invalidate_caches()
 
     def get_dependency_chain(
         self, object_name: str, max_depth: int = 10
@@ -340,6 +649,10 @@ class TerraformProject:
         """
         Get all dependency chains starting from an object.
 
+        The number of chains grows exponentially on graphs where many
+        objects share dependencies; prefer ``iter_dependency_chains`` with
+        limits, or the counting and shortest/longest helpers.
+
         Args:
             object_name: Starting object name
             max_depth: Maximum chain depth to prevent infinite recursion
@@ -347,73 +660,192 @@ class TerraformProject:
         Returns:
             List of dependency chains (each chain is a list of object names)
         """
+        return list(self.iter_dependency_chains(object_name, max_depth=max_depth))
+
+    def iter_dependency_chains(
+        self,
+        object_name: str,
+        max_depth: int = 10,
+        max_chains: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[List[str]]:
+        """
+        Yield dependency chains starting from an object, one at a time.
+
+        A chain ends at an object without dependencies or at a name that is
+        not in the project. Branches that revisit an object already on the
+        chain, or go deeper than ``max_depth``, are dropped.
+
+        Args:
+            object_name: Starting object name
+            max_depth: Maximum chain depth (the start object is depth 0)
+            max_chains: Stop after this many chains
+            timeout: Stop after this many seconds
+
+        Yields:
+            Dependency chains (each chain is a list of object names)
+        """
         obj = self.get_object(object_name)
-        if not obj:
-            return []
+        if not obj or max_depth < 0 or max_chains == 0:
+            return
 
-        chains = []
-        visited = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
 
-        def _build_chain(current_name: str, chain: List[str], depth: int) -> None:
-            if depth > max_depth or current_name in visited:
-                return
+        def edges(name: str) -> Optional[Iterator[str]]:
+            current = self._objects.get(name)
+            if current is None or not current.dependency_info.all_dependencies:
+                return None
+            return iter(current.dependency_info.all_dependencies)
 
-            visited.add(current_name)
-            chain.append(current_name)
+        root_edges = edges(object_name)
+        if root_edges is None:
+            yield [object_name]
+            return
 
-            current_obj = self.get_object(current_name)
-            if not current_obj:
-                chains.append(chain.copy())
-                chain.pop()
-                visited.remove(current_name)
+        chain = [object_name]
+        on_chain = {object_name}
+        stack = [root_edges]
+        emitted = 0
+
+        while stack:
+            if deadline is not None and time.monotonic() > deadline:
                 return
 
-            deps = current_obj.dependency_info.all_dependencies
-            if not deps:
-                chains.append(chain.copy())
-            else:
-                for dep in deps:
-                    _build_chain(dep, chain.copy(), depth + 1)
+            dep = next(stack[-1], None)
+            if dep is None:
+                stack.pop()
+                on_chain.discard(chain.pop())
+                continue
+            if len(chain) > max_depth or dep in on_chain:
+                continue
+
+            dep_edges = edges(dep)
+            if dep_edges is None:
+                yield chain + [dep]
+                emitted += 1
+                if max_chains is not None and emitted >= max_chains:
+                    return
+                continue
+
+            chain.append(dep)
+            on_chain.add(dep)
+            stack.append(dep_edges)
+
+    def count_dependency_chains(self) -> Dict[str, int]:
+        """
+        Count the dependency chains starting from every object.
 
-            chain.pop() if chain else None
-            visited.remove(current_name)
+        Counts are summed over a topological order in linear time instead of
+        enumerating chains. There is no depth limit. Dependencies between
+        objects of the same cycle are not followed, so on acyclic graphs the
+        counts equal the number of chains ``iter_dependency_chains`` yields
+        without a depth limit.
 
-        _build_chain(object_name, [], 0)
-        return chains
+        Returns:
+            Mapping of object name to its number of chains
+        """
+        table = self._chain_table(self._objects)
+        return {name: table[name][0] for name in self._objects}
 
-    def find_circular_dependencies(self) -> List[List[str]]:
-        """Find all circular dependency chains in the project."""
-        cycles = []
-        visited = set()
-        rec_stack = []
-
-        def _visit(node_name: str) -> None:
-            if node_name in rec_stack:
-                # Found a cycle
-                cycle_start = rec_stack.index(node_name)
-                cycle = rec_stack[cycle_start:] + [node_name]
-                if cycle not in cycles:
-                    cycles.append(cycle)
-                return
+    def shortest_dependency_chain(self, object_name: str) -> List[str]:
+        """
+        Get the shortest dependency chain starting from an object.
 
-            if node_name in visited:
-                return
+        Computed in linear time without enumerating chains; see
+        ``count_dependency_chains`` for how cycles are handled.
 
-            visited.add(node_name)
-            rec_stack.append(node_name)
+        Args:
+            object_name: Starting object name
+
+        Returns:
+            The chain, or an empty list if the object has none
+        """
+        return self._follow_chain(object_name, "shortest_next")
 
-            obj = self.get_object(node_name)
-            if obj:
-                for dep in obj.dependency_info.all_dependencies:
-                    _visit(dep)
+    def longest_dependency_chain(self, object_name: str) -> List[str]:
+        """
+        Get the longest dependency chain starting from an object.
 
-            rec_stack.pop()
+        Computed in linear time without enumerating chains; see
+        ``count_dependency_chains`` for how cycles are handled.
 
-        for obj_name in self._objects:
-            if obj_name not in visited:
-                _visit(obj_name)
+        Args:
+            object_name: Starting object name
 
-        return cycles
+        Returns:
+            The chain, or an empty list if the object has none
+        """
+        return self._follow_chain(object_name, "longest_next")
+
+    def _follow_chain(self, object_name: str, next_field: str) -> List[str]:
+        if object_name not in self._objects:
+            return []
+
+        table = self._chain_table([object_name])
+        if not table[object_name].count:
+            return []
+
+        chain = [object_name]
+        while True:
+            following = getattr(table[chain[-1]], next_field)
+            if following is None:
+                return chain
+            chain.append(following)
+
+    def _chain_table(self, roots: Iterable[str]) -> Dict[str, _ChainFacts]:
+        """Chain facts for every name reachable from ``roots``."""
+
+        def successors(name: str) -> Tuple[str, ...]:
+            obj = self._objects.get(name)
+            return obj.dependency_info.all_dependencies if obj else ()
+
+        table: Dict[str, _ChainFacts] = {}
+
+        # Components come dependencies first, so every dependency outside
+        # the current component already has its entry
+        for component in strongly_connected_components(roots, successors):
+            members = set(component)
+            for name in component:
+                deps = successors(name)
+                if not deps:
+                    table[name] = _ChainFacts(1, 1, 1, None, None)
+                    continue
+
+                count = 0
+                shortest = longest = 0
+                shortest_next = longest_next = None
+                for dep in deps:
+                    if dep in members:
+                        continue
+                    dep_count, dep_shortest, dep_longest, _, _ = table[dep]
+                    if not dep_count:
+                        continue
+                    count += dep_count
+                    if shortest_next is None or dep_shortest + 1 < shortest:
+                        shortest, shortest_next = dep_shortest + 1, dep
+                    if longest_next is None or dep_longest + 1 > longest:
+                        longest, longest_next = dep_longest + 1, dep
+
+                table[name] = _ChainFacts(
+                    count, shortest, longest, shortest_next, longest_next
+                )
+
+        return table
+
+    def find_circular_dependencies(self) -> List[List[str]]:
+        """Find circular dependency chains covering every object on a cycle."""
+
+        def successors(name: str) -> List[str]:
+            obj = self._objects.get(name)
+            if obj is None:
+                return []
+            return [
+                dep
+                for dep in obj.dependency_info.all_dependencies
+                if dep in self._objects
+            ]
+
+        return find_cycles(self._objects, successors)
 
     # ============ Statistics & Analysis ============
 
@@ -483,9 +915,16 @@ class TerraformProject:
         """
         Perform validation and return list of issues.
 
+        The result is cached until the project changes.
+
         Returns:
             List of validation error/warning messages
         """
+        if self._validation is None:
+            self._validation = self._collect_issues()
+        return list(self._validation)
+
+    def _collect_issues(self) -> List[str]:
         issues = []
 
         # Check for circular dependencies
@@ -515,25 +954,104 @@ class TerraformProject:
     # ============ Serialization ============
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert entire project to dictionary."""
-        stats = self.compute_statistics()
+        """
+        Convert entire project to dictionary.
+
+        The serialized objects and statistics are cached until the project
+        changes and shared between calls, so treat them as read-only.
+        Metadata is serialized on every call.
+        """
+        if self._objects_dict is None:
+            self._objects_dict = {
+                section: {k: v.to_dict() for k, v in objects.items()}
+                for section, objects in self._object_sections()
+            }
+        if self._statistics_dict is None:
+            self._statistics_dict = self.compute_statistics().to_dict()
 
         return {
             "metadata": self.metadata.to_dict(),
-            "objects": {
-                "resources": {k: v.to_dict() for k, v in self._resources.items()},
-                "data_sources": {k: v.to_dict() for k, v in self._data_sources.items()},
-                "modules": {k: v.to_dict() for k, v in self._modules.items()},
-                "variables": {k: v.to_dict() for k, v in self._variables.items()},
-                "outputs": {k: v.to_dict() for k, v in self._outputs.items()},
-                "providers": {k: v.to_dict() for k, v in self._providers.items()},
-                "locals": {k: v.to_dict() for k, v in self._locals.items()},
-                "terraform_blocks": {
-                    k: v.to_dict() for k, v in self._terraform_blocks.items()
-                },
-            },
+            "objects": self._objects_dict,
             "tfvars_files": self.tfvars_files,
             "backend_config": self.backend_config,
-            "statistics": stats.to_dict(),
+            "statistics": self._statistics_dict,
             "validation": self.validate(),
         }
+
+    def write_json(self, fp: IO[str], indent: Optional[int] = 2) -> None:
+        """
+        Write the project as JSON, one object at a time.
+
+        The text is the same as ``json.dump(self.to_dict(), fp,
+        indent=indent, default=str)``, but objects are serialized one by one
+        and written straight to ``fp``. Memory use does not grow with the
+        number of objects.
+
+        Args:
+            fp: Text file to write to
+            indent: Spaces per nesting level, or None for compact output
+        """
+        writer = JSONStreamWriter(fp, indent)
+        writer.begin_object()
+        self._write_json_fields(writer)
+        writer.end()
+
+    def _write_json_fields(self, writer: JSONStreamWriter) -> None:
+        """Write the fields of ``to_dict`` into an open JSON object."""
+        writer.value(self.metadata.to_dict(), "metadata")
+
+        writer.begin_object("objects")
+        for section, objects in self._object_sections():
+            writer.begin_object(section)
+            for name, obj in objects.items():
+                writer.value(obj.to_dict(), name)
+            writer.end()
+        writer.end()
+
+        writer.value(self.tfvars_files, "tfvars_files")
+        writer.value(self.backend_config, "backend_config")
+        writer.value(self.compute_statistics().to_dict(), "statistics")
+        writer.value(self.validate(), "validation")
+
+    def write_snapshot(self, path: Union[str, Path]) -> None:
+        """
+        Save the project as a binary ``.tfks`` snapshot.
+
+        ``load_snapshot`` rebuilds the project from it without analyzing
+        anything; see ``tfkit.analyzer.snapshot`` for the format.
+        """
+        from .snapshot import write_snapshot
+
+        write_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(
+        cls, path: Union[str, Path], verify: bool = True
+    ) -> "TerraformProject":
+        """
+        Load a project saved with ``write_snapshot``.
+
+        Args:
+            path: Snapshot file
+            verify: Check that the project's files have not changed since
+
+        Raises:
+            SnapshotError: The snapshot is unreadable, was written by another
+                tfkit version, or (with ``verify``) is out of date
+        """
+        from .snapshot import load_snapshot
+
+        return load_snapshot(path, verify=verify)
+
+    def _object_sections(self) -> List[Tuple[str, Dict[str, TerraformObject]]]:
+        """The ``objects`` sections of ``to_dict``, in order."""
+        return [
+            ("resources", self._resources),
+            ("data_sources", self._data_sources),
+            ("modules", self._modules),
+            ("variables", self._variables),
+            ("outputs", self._outputs),
+            ("providers", self._providers),
+            ("locals", self._locals),
+            ("terraform_blocks", self._terraform_blocks),
+        ]
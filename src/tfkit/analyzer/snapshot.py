@@ -0,0 +1,532 @@
+"""
+Binary project snapshots.
+
+``write_snapshot`` saves an analyzed ``TerraformProject`` to a ``.tfks``
+file, and ``load_snapshot`` rebuilds the project from it without parsing
+or analyzing anything, so the steps that run after ``tfkit scan`` can
+reuse its result.
+
+After a fixed header and a JSON table of contents, a snapshot holds:
+
+- ``strings``: every name, address and path once, numbered in the order
+  of the project's ``SymbolTable``; the other sections refer to strings
+  by number
+- ``objects``: one row of integers per object (type, names, location,
+  provider and computed state)
+- ``edges``: the dependency lists of every object, as offset and string
+  number arrays
+- ``files``: the names declared in each file
+- ``data``: the free-form values (attributes, tfvars, statistics) as JSON
+
+Integers are stored as little-endian 32-bit values. Loading memory-maps
+the file and checks the format version, the tfkit version and, unless
+told not to, the SHA-256 hashes of the files the project was analyzed
+from.
+"""
+
+import dataclasses
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from tfkit.core.symbols import SymbolTable
+from tfkit.core.walker import FileWalker
+
+from .models import (
+    DependencyInfo,
+    LocationInfo,
+    ObjectState,
+    ProviderInfo,
+    ResourceMetrics,
+    ResourceType,
+    TerraformObject,
+)
+from .project import ProjectMetadata, ProjectStatistics, TerraformProject
+
+MAGIC = b"TFKS"
+FORMAT_VERSION = 1
+
+# magic, format version, reserved, table of contents length
+_HEADER = struct.Struct("<4sHHI")
+
+# Marks an absent string or state
+_NONE = -1
+
+# Columns of the objects section
+(
+    _TYPE,
+    _NAME,
+    _FULL_NAME,
+    _FILE,
+    _LINE,
+    _RELATIVE_PATH,
+    _MODULE_DEPTH,
+    _RESOURCE_TYPE,
+    _PROVIDER,
+    _STATE,
+    _STATE_REASON,
+) = range(11)
+_COLUMNS = 11
+
+# Dependency lists stored in the edges section, in order
+_EDGE_LISTS = (
+    "explicit_dependencies",
+    "implicit_dependencies",
+    "dependent_objects",
+    "circular_dependencies",
+    "missing_dependencies",
+    "optional_dependencies",
+    "conditional_dependencies",
+)
+_LAZY_EDGE_LISTS = frozenset(_EDGE_LISTS[3:])
+
+# Object fields kept in the data section, with their defaults
+_LOOSE_FIELDS = {
+    "variable_type": None,
+    "default_value": None,
+    "nullable": True,
+    "sensitive": False,
+    "output_value": None,
+    "source": None,
+    "module_version": None,
+    "description": None,
+}
+
+# Fields the analyzer copies out of the block attributes. A value that is
+# the attribute itself is stored once and shared again on load.
+_ATTRIBUTE_KEYS = {
+    "default_value": "default",
+    "output_value": "value",
+    "source": "source",
+    "module_version": "version",
+    "description": "description",
+    "tags": "tags",
+}
+
+_RESOURCE_TYPES = list(ResourceType)
+_STATES = list(ObjectState)
+
+
+class SnapshotError(ValueError):
+    """A snapshot cannot be read, or does not match this tfkit or its sources."""
+
+
+def _int_array(values: Any = ()) -> array:
+    """A signed 32-bit int array in native byte order."""
+    typecode = "i" if array("i").itemsize == 4 else "l"
+    return array(typecode, values)
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data: Union[bytes, memoryview]) -> array:
+    values = _int_array()
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_snapshot(project: TerraformProject, path: Union[str, Path]) -> None:
+    """
+    Save an analyzed project as a binary snapshot.
+
+    The file is written to a temporary name and moved into place, so a
+    failed write never leaves a truncated snapshot behind.
+
+    Args:
+        project: The project to save
+        path: Snapshot file to write
+    """
+    from tfkit import __version__
+
+    root = project.metadata.project_path
+    # Start from the project's own table so string numbers stay the same
+    strings = SymbolTable(project.symbols)
+    symbol_count = len(strings)
+
+    def string_id(value: Optional[str]) -> int:
+        return _NONE if value is None else strings.id_of(value)
+
+    objects = project.all_objects
+    rows = _int_array()
+    edge_offsets = _int_array([0])
+    edge_ids = _int_array()
+    payloads: List[Dict[str, Any]] = []
+
+    for obj in objects.values():
+        location = obj.location
+        provider = obj.provider_info
+        rows.extend(
+            (
+                _RESOURCE_TYPES.index(obj.type),
+                string_id(obj.name),
+                string_id(obj.full_name),
+                string_id(location.file_path),
+                location.line_number,
+                string_id(location.relative_path),
+                location.module_depth,
+                string_id(obj.resource_type),
+                string_id(provider.provider_name if provider else None),
+                _NONE if obj._state is None else _STATES.index(obj._state),
+                string_id(obj._state_reason),
+            )
+        )
+
+        dependency_info = obj.dependency_info
+        for name in _EDGE_LISTS:
+            if name in _LAZY_EDGE_LISTS:
+                items = getattr(dependency_info, f"_lazy_{name}") or ()
+            else:
+                items = getattr(dependency_info, name)
+            edge_ids.extend(strings.id_of(item) for item in items)
+            edge_offsets.append(len(edge_ids))
+
+        payloads.append(_object_payload(obj))
+
+    files = project._objects_by_file
+    file_table = _int_array([len(files)])
+    file_table.extend(strings.id_of(file_path) for file_path in files)
+    file_names = _int_array()
+    file_table.append(0)
+    for declared in files.values():
+        file_names.extend(strings.id_of(name) for name in declared)
+        file_table.append(len(file_names))
+    file_table.extend(file_names)
+
+    data = {
+        "objects": payloads,
+        "metadata": project.metadata.to_dict(),
+        "source_files": project.source_files,
+        "tfvars_files": project.tfvars_files,
+        "backend_config": project.backend_config,
+        "statistics": dataclasses.asdict(project.compute_statistics()),
+        "validation": project.validate(),
+    }
+
+    names = list(strings)
+    if any("\0" in name for name in names):
+        raise SnapshotError("Names containing NUL characters cannot be saved")
+
+    sections = [
+        ("strings", "\0".join(names).encode("utf-8")),
+        ("objects", _to_bytes(rows)),
+        ("edges", _to_bytes(edge_offsets) + _to_bytes(edge_ids)),
+        ("files", _to_bytes(file_table)),
+        ("data", json.dumps(data, separators=(",", ":")).encode("utf-8")),
+    ]
+
+    sources = {}
+    for source in project.source_files:
+        sources[os.path.relpath(source, root)] = hash_file(source)
+
+    toc = {
+        "tfkit_version": __version__,
+        "project_path": root,
+        "strings": len(names),
+        "symbols": symbol_count,
+        "objects": len(objects),
+        "sources": sources,
+        "sections": {},
+    }
+
+    # Section offsets depend on the length of the table of contents that
+    # lists them; lay out until the length stops changing
+    toc_bytes = b""
+    while True:
+        offset = _align(_HEADER.size + len(toc_bytes))
+        for name, content in sections:
+            toc["sections"][name] = [offset, len(content)]
+            offset = _align(offset + len(content))
+        encoded = json.dumps(toc, separators=(",", ":")).encode("utf-8")
+        done = len(encoded) == len(toc_bytes)
+        toc_bytes = encoded
+        if done:
+            break
+
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(toc_bytes)))
+            f.write(toc_bytes)
+            for name, content in sections:
+                f.write(b"\0" * (toc["sections"][name][0] - f.tell()))
+                f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _object_payload(obj: TerraformObject) -> Dict[str, Any]:
+    """The data section entry of one object: its non-default free-form fields."""
+    payload: Dict[str, Any] = {}
+    shared = []
+    attributes = obj.attributes if isinstance(obj.attributes, dict) else {}
+
+    values = {name: getattr(obj, name) for name in _LOOSE_FIELDS}
+    values["tags"] = obj._lazy_tags
+    values["lifecycle_rules"] = obj._lazy_lifecycle_rules
+
+    for name, value in values.items():
+        if value is None or value is _LOOSE_FIELDS.get(name):
+            continue
+        key = _ATTRIBUTE_KEYS.get(name)
+        if key is not None and key in attributes and attributes[key] is value:
+            shared.append(name)
+        else:
+            payload[name] = value
+
+    if obj.attributes:
+        payload["attributes"] = obj.attributes
+    if obj._incompleteness is not None:
+        payload["incompleteness"] = obj._incompleteness
+    if shared:
+        payload["shared"] = shared
+
+    provider = obj.provider_info
+    if provider is not None:
+        if provider.provider_alias is not None:
+            payload["provider_alias"] = provider.provider_alias
+        if provider.provider_version is not None:
+            payload["provider_version"] = provider.provider_version
+        if provider._lazy_provider_config is not None:
+            payload["provider_config"] = provider._lazy_provider_config
+
+    if obj._lazy_metrics is not None:
+        payload["metrics"] = dataclasses.asdict(obj._lazy_metrics)
+
+    return payload
+
+
+def _read_toc(f: Any) -> Dict[str, Any]:
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise SnapshotError("Not a tfkit snapshot: file is too short")
+    magic, version, _, toc_length = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise SnapshotError("Not a tfkit snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(
+            f"Unsupported snapshot format {version} (expected {FORMAT_VERSION})"
+        )
+    try:
+        return json.loads(f.read(toc_length))
+    except ValueError as e:
+        raise SnapshotError(f"Corrupt snapshot: {e}") from None
+
+
+def load_snapshot(
+    path: Union[str, Path], verify: bool = True, walker: Optional[FileWalker] = None
+) -> TerraformProject:
+    """
+    Rebuild a project from a binary snapshot.
+
+    Args:
+        path: Snapshot file written by ``write_snapshot``
+        verify: Check that the project's files are unchanged: the same
+            files are found under the project path and their hashes match
+        walker: File discovery settings for ``verify``
+
+    Returns:
+        The project as it was saved, with states and statistics computed
+
+    Raises:
+        SnapshotError: The file is not a snapshot, was written by another
+            tfkit version, or (with ``verify``) its sources have changed
+    """
+    from tfkit import __version__
+
+    with open(path, "rb") as f:
+        toc = _read_toc(f)
+        if toc.get("tfkit_version") != __version__:
+            raise SnapshotError(
+                f"Snapshot was written by tfkit {toc.get('tfkit_version')}; "
+                f"this is tfkit {__version__}"
+            )
+        if verify:
+            _verify_sources(toc, walker or FileWalker())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Sections are decoded straight from the mapping; the views
+            # must be released before it is closed
+            sections = {}
+            with memoryview(mapped) as view:
+                try:
+                    for name, (offset, length) in toc["sections"].items():
+                        if offset + length > len(mapped):
+                            raise SnapshotError("Corrupt snapshot: file is truncated")
+                        sections[name] = view[offset : offset + length]
+                    return _build_project(toc, sections)
+                except SnapshotError:
+                    raise
+                except (ValueError, KeyError, IndexError, TypeError) as e:
+                    raise SnapshotError(f"Corrupt snapshot: {e}") from None
+                finally:
+                    for section in sections.values():
+                        section.release()
+
+
+def _verify_sources(toc: Dict[str, Any], walker: FileWalker) -> None:
+    """Raise SnapshotError if the files a snapshot was built from changed."""
+    root = toc["project_path"]
+    recorded: Dict[str, str] = toc["sources"]
+
+    discovered = walker.walk(root)
+    current = {
+        os.path.relpath(p, root) for p in discovered.terraform + discovered.tfvars
+    }
+    added = sorted(current - recorded.keys())
+    removed = sorted(recorded.keys() - current)
+    if added or removed:
+        changes = [f"+{p}" for p in added] + [f"-{p}" for p in removed]
+        raise SnapshotError(
+            f"Snapshot is out of date, files changed under {root}: "
+            + ", ".join(changes[:5])
+            + (f" (+{len(changes) - 5} more)" if len(changes) > 5 else "")
+        )
+
+    for rel_path, digest in recorded.items():
+        if hash_file(os.path.join(root, rel_path)) != digest:
+            raise SnapshotError(f"Snapshot is out of date, {rel_path} has changed")
+
+
+def _build_project(
+    toc: Dict[str, Any], sections: Dict[str, memoryview]
+) -> TerraformProject:
+    names = str(sections["strings"], "utf-8").split("\0")
+    if not toc["strings"]:
+        names = []
+    if len(names) != toc["strings"]:
+        raise SnapshotError("Corrupt snapshot: string table does not match")
+
+    data = json.loads(str(sections["data"], "utf-8"))
+    rows = _from_bytes(sections["objects"])
+    count = toc["objects"]
+    edges = _from_bytes(sections["edges"])
+    edge_count = count * len(_EDGE_LISTS) + 1
+    edge_offsets, edge_ids = edges[:edge_count], edges[edge_count:]
+    if len(rows) != count * _COLUMNS or len(data["objects"]) != count:
+        raise SnapshotError("Corrupt snapshot: object table does not match")
+
+    def string(index: int) -> Optional[str]:
+        return None if index == _NONE else names[index]
+
+    project = TerraformProject(project_path=toc["project_path"])
+    project.symbols = SymbolTable(names[: toc["symbols"]])
+
+    for index, payload in enumerate(data["objects"]):
+        row = rows[index * _COLUMNS : (index + 1) * _COLUMNS]
+        obj = _build_object(row, payload, string)
+
+        dependency_info = obj.dependency_info
+        base = index * len(_EDGE_LISTS)
+        for position, name in enumerate(_EDGE_LISTS):
+            start, end = (
+                edge_offsets[base + position],
+                edge_offsets[base + position + 1],
+            )
+            if start != end:
+                setattr(dependency_info, name, [names[i] for i in edge_ids[start:end]])
+
+        project.add_object(obj)
+
+    all_objects = project.all_objects
+    for obj in all_objects.values():
+        obj.set_all_objects_cache(all_objects)
+
+    # Declarations by file, including names shadowed by a later file
+    table = _from_bytes(sections["files"])
+    file_count = table[0]
+    file_ids = table[1 : 1 + file_count]
+    offsets = table[1 + file_count : 2 + 2 * file_count]
+    declared = table[2 + 2 * file_count :]
+    project._objects_by_file.clear()
+    for position, file_id in enumerate(file_ids):
+        start, end = offsets[position], offsets[position + 1]
+        project._objects_by_file[names[file_id]] = dict.fromkeys(
+            names[i] for i in declared[start:end]
+        )
+
+    project.metadata = ProjectMetadata(**data["metadata"])
+    project.source_files = data["source_files"]
+    project.tfvars_files = data["tfvars_files"]
+    project.backend_config = data["backend_config"]
+
+    # Set last: adding objects clears cached results
+    project._statistics = ProjectStatistics(**data["statistics"])
+    project._validation = data["validation"]
+    return project
+
+
+def _build_object(row: Any, payload: Dict[str, Any], string: Any) -> TerraformObject:
+    """Create one object from its objects row and data section entry."""
+    attributes = payload.get("attributes", {})
+    fields = {name: payload[name] for name in _LOOSE_FIELDS if name in payload}
+    for name in payload.get("shared", ()):
+        fields[name] = attributes[_ATTRIBUTE_KEYS[name]]
+
+    provider = None
+    if row[_PROVIDER] != _NONE:
+        provider = ProviderInfo(
+            provider_name=string(row[_PROVIDER]),
+            provider_alias=payload.get("provider_alias"),
+            provider_version=payload.get("provider_version"),
+            provider_config=payload.get("provider_config"),
+        )
+
+    metrics = payload.get("metrics")
+    obj = TerraformObject(
+        type=_RESOURCE_TYPES[row[_TYPE]],
+        name=string(row[_NAME]),
+        full_name=string(row[_FULL_NAME]),
+        location=LocationInfo(
+            file_path=string(row[_FILE]),
+            line_number=row[_LINE],
+            relative_path=string(row[_RELATIVE_PATH]),
+            module_depth=row[_MODULE_DEPTH],
+        ),
+        dependency_info=DependencyInfo(),
+        metrics=ResourceMetrics(**metrics) if metrics is not None else None,
+        attributes=attributes,
+        resource_type=string(row[_RESOURCE_TYPE]),
+        provider_info=provider,
+        tags=fields.pop("tags", payload.get("tags")),
+        lifecycle_rules=payload.get("lifecycle_rules"),
+        **fields,
+    )
+
+    obj._incompleteness = payload.get("incompleteness")
+    if row[_STATE] != _NONE:
+        obj._state = _STATES[row[_STATE]]
+        obj._state_reason = string(row[_STATE_REASON])
+    return obj
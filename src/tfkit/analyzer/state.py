@@ -0,0 +1,156 @@
+"""
+Project-wide state computation.
+
+``TerraformObject.state`` can be worked out for one object on its own, but
+variables and locals then walk their dependents recursively, once for every
+object. ``ProjectStateEngine`` gathers the graph facts for all objects in
+one sweep and assigns their states in bulk.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from tfkit.analyzer.models import ResourceType, StateFacts, TerraformObject
+from tfkit.core.graph import strongly_connected_components
+
+# Dependents that use a value in real infrastructure
+_CONSUMER_TYPES = frozenset(
+    {
+        ResourceType.RESOURCE,
+        ResourceType.MODULE,
+        ResourceType.DATA,
+        ResourceType.PROVIDER,
+        ResourceType.OUTPUT,
+    }
+)
+
+# Dependents that pass a value on to their own dependents
+_PASS_THROUGH_TYPES = frozenset({ResourceType.LOCAL, ResourceType.VARIABLE})
+
+# Provider dependents counted as resources
+_RESOURCE_TYPES = frozenset({ResourceType.RESOURCE, ResourceType.DATA})
+
+# Dependencies that make an output export infrastructure
+_INFRASTRUCTURE_TYPES = frozenset(
+    {ResourceType.RESOURCE, ResourceType.MODULE, ResourceType.DATA}
+)
+
+
+class ProjectStateEngine:
+    """
+    Computes the states of many objects at once.
+
+    Args:
+        all_objects: Every object of the project by full name
+    """
+
+    def __init__(self, all_objects: Mapping[str, TerraformObject]):
+        self.all_objects = all_objects
+
+    def reaches_infrastructure(
+        self, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, bool]:
+        """
+        Work out which objects feed into real infrastructure.
+
+        An object does when a resource, module, data source, provider or
+        output depends on it, directly or through a chain of locals and
+        variables. The chains are swept once, component by component in
+        reverse topological order, so every object and edge is looked at
+        once however the chains overlap.
+
+        Args:
+            names: Objects to answer for (default: all objects)
+
+        Returns:
+            Mapping of full name to the answer, for the given objects and
+            every local or variable they pass values on to
+        """
+        objects = self.all_objects
+        pass_on: Dict[str, List[str]] = {}
+        used_directly: Dict[str, bool] = {}
+
+        def successors(name: str) -> List[str]:
+            edges = pass_on.get(name)
+            if edges is None:
+                edges = []
+                used = False
+                for dep_name in objects[name].dependency_info.dependent_objects:
+                    dep_obj = objects.get(dep_name)
+                    if dep_obj is None:
+                        continue
+                    if dep_obj.type in _CONSUMER_TYPES:
+                        used = True
+                    elif dep_obj.type in _PASS_THROUGH_TYPES:
+                        edges.append(dep_name)
+                pass_on[name] = edges
+                used_directly[name] = used
+            return edges
+
+        roots = objects if names is None else [n for n in names if n in objects]
+
+        reaches: Dict[str, bool] = {}
+        for component in strongly_connected_components(roots, successors):
+            # Components a member passes values on to are already decided;
+            # members of this component are not, and count as False
+            value = any(used_directly[name] for name in component) or any(
+                reaches.get(succ, False) for name in component for succ in pass_on[name]
+            )
+            for name in component:
+                reaches[name] = value
+
+        return reaches
+
+    def collect_facts(
+        self, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, StateFacts]:
+        """
+        Gather the graph facts state computation needs.
+
+        Args:
+            names: Objects to gather facts for (default: all objects)
+
+        Returns:
+            Mapping of full name to its facts
+        """
+        objects = self.all_objects
+        if names is None:
+            names = list(objects)
+        else:
+            names = [name for name in names if name in objects]
+
+        reaches = self.reaches_infrastructure(
+            name for name in names if objects[name].type in _PASS_THROUGH_TYPES
+        )
+
+        facts: Dict[str, StateFacts] = {}
+        for name in names:
+            obj = objects[name]
+            dep_info = obj.dependency_info
+
+            if obj.type in _PASS_THROUGH_TYPES:
+                facts[name] = StateFacts(reaches_infrastructure=reaches[name])
+            elif obj.type == ResourceType.PROVIDER:
+                count = sum(
+                    1
+                    for dep_name in dep_info.dependent_objects
+                    if dep_name in objects and objects[dep_name].type in _RESOURCE_TYPES
+                )
+                facts[name] = StateFacts(resource_dependents=count)
+            elif obj.type == ResourceType.OUTPUT:
+                references = any(
+                    dep_name in objects
+                    and objects[dep_name].type in _INFRASTRUCTURE_TYPES
+                    for dep_name in dep_info.all_dependencies
+                )
+                facts[name] = StateFacts(references_infrastructure=references)
+            else:
+                facts[name] = StateFacts()
+
+        return facts
+
+    def assign_states(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Compute and cache the states of the given objects (default: all).
+        """
+        for name, facts in self.collect_facts(names).items():
+            self.all_objects[name].refresh_state(facts)
@@ -1,13 +1,37 @@
-import glob
 import json
+import os
 import re
+import sys
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
-try:
-    import hcl2
-except ImportError:
-    hcl2 = None
+from tfkit.core.blocks import BlockIndex
+from tfkit.core.cache import MemoryParseCache, ParseCache
+from tfkit.core.graph import cycle_cover, cyclic_components
+from tfkit.core.profiling import Profiler
+from tfkit.core.source import SourceReader
+from tfkit.core.symbols import SymbolTable
+from tfkit.core.walker import (
+    TERRAFORM_SUFFIXES,
+    TFVARS_SUFFIXES,
+    DiscoveredFiles,
+    FileWalker,
+)
 
 from .models import (
     DependencyInfo,
@@ -17,6 +41,8 @@ from .models import (
     TerraformObject,
 )
 from .project import TerraformProject
+from .state import ProjectStateEngine
+from .workspace import WorkspaceAnalysis
 
 
 class DependencyExtractor:
@@ -24,35 +50,77 @@ class DependencyExtractor:
     Enhanced dependency extractor with comprehensive dependency analysis.
     """
 
-    # Enhanced patterns for finding Terraform references
-    PATTERNS = [
-        # Variables: var.name
-        (r"\bvar\.([a-zA-Z_][a-zA-Z0-9_-]*)\b", "var.{}", 1),
-        # Locals: local.name
-        (r"\blocal\.([a-zA-Z_][a-zA-Z0-9_-]*)\b", "local.{}", 1),
-        # Modules: module.name (any attribute)
-        (r"\bmodule\.([a-zA-Z_][a-zA-Z0-9_-]*)\.", "module.{}", 1),
-        # Data sources: data.type.name
-        (
-            r"\bdata\.([a-zA-Z_][a-zA-Z0-9_-]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)\b",
-            "data.{}.{}",
-            2,
-        ),
-        # Resources: resource_type.name (must have at least one dot after name)
-        (r"\b([a-z][a-z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)\.", "{}.{}", 2),
-    ]
-
-    def __init__(self, all_objects: Dict[str, TerraformObject]):
+    # Single scanner for every kind of Terraform reference. It only anchors
+    # on words directly followed by a dot, and each kind is an optional
+    # lookahead, so one pass reports what each kind matches at every
+    # candidate position:
+    #   var.name, local.name, module.name. (any attribute),
+    #   data.type.name, resource_type.name. (at least one dot after name)
+    REFERENCE_SCANNER = re.compile(
+        r"\b(?=[a-z][a-z0-9_]*\.)"
+        r"(?:(?=var\.([a-zA-Z_][a-zA-Z0-9_-]*)\b))?"
+        r"(?:(?=local\.([a-zA-Z_][a-zA-Z0-9_-]*)\b))?"
+        r"(?:(?=module\.([a-zA-Z_][a-zA-Z0-9_-]*)\.))?"
+        r"(?:(?=data\.([a-zA-Z_][a-zA-Z0-9_-]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)\b))?"
+        r"(?:(?=([a-z][a-z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_-]*)\.))?"
+    )
+
+    # First parts that make a dotted name a reference on their own
+    VALID_PREFIXES = frozenset(
+        {"var", "local", "module", "data", "output", "provider", "terraform"}
+    )
+
+    def __init__(
+        self,
+        all_objects: Mapping[str, TerraformObject],
+        symbols: Optional[SymbolTable] = None,
+    ):
         self.all_objects = all_objects
         self.defined_names = set(all_objects.keys())
 
-    def extract(self, config: Any, current_object_name: str = None) -> DependencyInfo:
+        # Shared copies of referenced addresses that are not object names
+        self.symbols = symbols if symbols is not None else SymbolTable()
+
+        # Sorted names form a prefix index: every name starting with a
+        # given prefix is a contiguous run found with one binary search
+        self._sorted_names = sorted(self.defined_names)
+
+    def canonical_name(self, name: str) -> str:
+        """
+        Return the shared copy of an address.
+
+        A defined object's own ``full_name`` (its project key) is the shared
+        copy of its address; any other name goes through the symbol table.
+        """
+        obj = self.all_objects.get(name)
+        return obj.full_name if obj is not None else self.symbols.intern(name)
+
+    def add_name(self, name: str) -> None:
+        """Register a newly defined object name."""
+        if name not in self.defined_names:
+            self.defined_names.add(name)
+            insort(self._sorted_names, name)
+
+    def remove_name(self, name: str) -> None:
+        """Forget an object name that is no longer defined."""
+        if name in self.defined_names:
+            self.defined_names.discard(name)
+            del self._sorted_names[bisect_left(self._sorted_names, name)]
+
+    def extract(
+        self,
+        config: Any,
+        current_object_name: str = None,
+        unresolved: Optional[Set[str]] = None,
+    ) -> DependencyInfo:
         """
         Extract comprehensive dependency information from configuration.
 
         Args:
             config: The configuration to analyze (dict, list, or primitive)
             current_object_name: Name of the current object to avoid self-references
+            unresolved: Optional set that receives every reference that is not
+                an exact object name (partial matches and missing references)
 
         Returns:
             DependencyInfo with all discovered dependencies
@@ -62,37 +130,41 @@ class DependencyExtractor:
         if not config:
             return dep_info
 
+        canonical = self.canonical_name
+
         # Step 1: Handle explicit depends_on
         if isinstance(config, dict):
             depends_on = config.get("depends_on", [])
             if depends_on:
                 if isinstance(depends_on, list):
                     dep_info.explicit_dependencies = [
-                        self._normalize_reference(str(d)) for d in depends_on
+                        canonical(self._normalize_reference(str(d))) for d in depends_on
                     ]
                 elif isinstance(depends_on, str):
                     dep_info.explicit_dependencies = [
-                        self._normalize_reference(depends_on)
+                        canonical(self._normalize_reference(depends_on))
                     ]
 
-        # Step 2: Convert config to searchable string
-        config_str = self._serialize_config(config)
+        # Step 2: Find all references in the configuration tree
+        found_references = self._extract_references(config, current_object_name)
 
-        # Step 3: Find all references using patterns
-        found_references = self._extract_references(config_str, current_object_name)
-
-        # Step 4: Categorize dependencies
-        explicit_set = set(dep_info.explicit_dependencies)
+        # Step 3: Categorize dependencies
+        explicit = dep_info.explicit_dependencies
 
         for dep in found_references:
+            dep = canonical(dep)
+
             # Skip if already in explicit dependencies
-            if dep in explicit_set:
+            if dep in explicit:
                 continue
 
             # Check if dependency exists in project
             if dep in self.defined_names:
                 dep_info.implicit_dependencies.append(dep)
             else:
+                if unresolved is not None:
+                    unresolved.add(dep)
+
                 # Check if it's a partial reference that might match
                 matching = self._find_matching_objects(dep)
                 if matching:
@@ -100,61 +172,83 @@ class DependencyExtractor:
                 else:
                     dep_info.missing_dependencies.append(dep)
 
-        # Step 5: Remove duplicates while preserving order
-        dep_info.implicit_dependencies = list(
-            dict.fromkeys(dep_info.implicit_dependencies)
-        )
-        dep_info.missing_dependencies = list(
-            dict.fromkeys(dep_info.missing_dependencies)
-        )
+        # Step 4: Remove duplicates while preserving order (implicit
+        # dependencies are an ordered set already)
+        if dep_info.has_missing_deps:
+            dep_info.missing_dependencies = list(
+                dict.fromkeys(dep_info.missing_dependencies)
+            )
 
         return dep_info
 
-    def _serialize_config(self, config: Any) -> str:
-        """Convert configuration to searchable string format."""
-        if isinstance(config, dict):
-            # Recursively process nested structures
-            return json.dumps(config, default=str, indent=None)
-        elif isinstance(config, list):
-            return json.dumps(config, default=str, indent=None)
-        else:
-            return str(config)
-
     def _extract_references(
-        self, config_str: str, current_object_name: Optional[str]
-    ) -> Set[str]:
-        """Extract all Terraform references from configuration string."""
-        found_references = set()
+        self, config: Any, current_object_name: Optional[str]
+    ) -> Dict[str, None]:
+        """
+        Extract all Terraform references from a configuration tree.
 
-        for pattern, template, group_count in self.PATTERNS:
-            matches = re.finditer(pattern, config_str)
+        Only string leaves and keys that contain a dot can hold a reference,
+        so everything else is skipped without being scanned.
 
-            for match in matches:
-                try:
-                    if group_count == 1:
-                        dep_name = template.format(match.group(1))
-                    elif group_count == 2:
-                        dep_name = template.format(match.group(1), match.group(2))
-                    else:
-                        continue
+        Returns:
+            Ordered set (dict keys) of references in order of appearance
+        """
+        found_references: Dict[str, None] = {}
+
+        stack = [config]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str):
+                if "." in value:
+                    self._scan_references(value, found_references)
+            elif isinstance(value, dict):
+                items = list(value.items())
+                for key, item in reversed(items):
+                    stack.append(item)
+                    if isinstance(key, str) and "." in key:
+                        stack.append(key)
+            elif isinstance(value, (list, tuple)):
+                stack.extend(reversed(value))
+
+        found_references.pop(current_object_name, None)
+        return found_references
 
-                    # Normalize and validate
-                    dep_name = self._normalize_reference(dep_name)
+    def _scan_references(self, text: str, found_references: Dict[str, None]) -> None:
+        """
+        Add the references in one string to ``found_references``.
 
-                    # Skip self-references
-                    if dep_name == current_object_name:
-                        continue
+        Every kind keeps its own scan position, so matches of one kind never
+        overlap each other while different kinds may share the same text.
+        """
+        var_end = local_end = module_end = data_end = resource_end = 0
+        valid_prefixes = self.VALID_PREFIXES
 
-                    # Skip if it's clearly not a valid reference
-                    if not self._is_valid_reference(dep_name):
-                        continue
+        for match in self.REFERENCE_SCANNER.finditer(text):
+            start = match.start()
+            var, local, module, data_type, data_name, res_type, res_name = (
+                match.groups()
+            )
 
-                    found_references.add(dep_name)
+            if var is not None and start >= var_end:
+                found_references["var." + var] = None
+                var_end = match.end(1)
 
-                except (IndexError, ValueError):
-                    continue
+            if local is not None and start >= local_end:
+                found_references["local." + local] = None
+                local_end = match.end(2)
 
-        return found_references
+            if module is not None and start >= module_end:
+                found_references["module." + module] = None
+                module_end = match.end(3) + 1
+
+            if data_type is not None and start >= data_end:
+                found_references[f"data.{data_type}.{data_name}"] = None
+                data_end = match.end(5)
+
+            if res_type is not None and start >= resource_end:
+                if "_" in res_type or res_type in valid_prefixes:
+                    found_references[f"{res_type}.{res_name}"] = None
+                resource_end = match.end(7) + 1
 
     def _normalize_reference(self, ref: str) -> str:
         """Normalize a reference string."""
@@ -180,19 +274,8 @@ class DependencyExtractor:
         if len(parts) < 2:
             return False
 
-        # First part should be a valid prefix
-        valid_prefixes = {
-            "var",
-            "local",
-            "module",
-            "data",
-            "output",
-            "provider",
-            "terraform",
-        }
-
         # Check if it's a prefixed reference or a resource reference
-        if parts[0] in valid_prefixes:
+        if parts[0] in self.VALID_PREFIXES:
             return True
 
         # For resource references (type.name), check if type looks like a resource type
@@ -203,122 +286,234 @@ class DependencyExtractor:
 
     def _find_matching_objects(self, partial_ref: str) -> List[str]:
         """Find objects that match a partial reference."""
+        names = self._sorted_names
         matches = []
 
-        for obj_name in self.defined_names:
-            if obj_name.startswith(partial_ref):
-                matches.append(obj_name)
+        index = bisect_left(names, partial_ref)
+        while index < len(names) and names[index].startswith(partial_ref):
+            matches.append(names[index])
+            index += 1
 
         return matches
 
-    def detect_circular_dependencies(self) -> Dict[str, List[str]]:
+    def successors(self, obj_name: str) -> List[str]:
+        """Known objects that an object depends on."""
+        obj = self.all_objects.get(obj_name)
+        if obj is None:
+            return []
+        return [
+            dep
+            for dep in obj.dependency_info.all_dependencies
+            if dep in self.all_objects
+        ]
+
+    def find_cycle_components(
+        self,
+        start_nodes: Optional[List[str]] = None,
+        positions: Optional[Dict[str, int]] = None,
+    ) -> List[List[str]]:
+        """
+        Find the groups of objects that depend on each other in a cycle.
+
+        Args:
+            start_nodes: Restrict the search to objects reachable from these
+                objects. Defaults to every object.
+            positions: Project order of the objects, used to order each
+                group and the groups. Defaults to the order of all_objects.
+
+        Returns:
+            Strongly connected components that contain a cycle
+        """
+        if positions is None:
+            positions = {name: i for i, name in enumerate(self.all_objects)}
+
+        def position(name: str) -> int:
+            return positions.get(name, len(positions))
+
+        roots = self.all_objects if start_nodes is None else start_nodes
+        components = [
+            sorted(component, key=position)
+            for component in cyclic_components(roots, self.successors)
+        ]
+        components.sort(key=lambda component: position(component[0]))
+        return components
+
+    def detect_circular_dependencies(
+        self,
+        start_nodes: Optional[List[str]] = None,
+        positions: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, List[str]]:
         """
         Detect circular dependencies across all objects.
 
+        Every object in a cycle component is mapped to a cycle through it
+        that stays inside its strongly connected component. The cycle is
+        not necessarily the shortest one.
+
+        Args:
+            start_nodes: Restrict the search to cycles reachable from these
+                objects. Defaults to every object.
+            positions: Project order of the objects, see
+                ``find_cycle_components``
+
         Returns:
             Dictionary mapping object names to their circular dependency paths
         """
         circular_deps = {}
-        visited = set()
-        rec_stack = set()
-
-        def visit(obj_name: str, path: List[str]) -> Optional[List[str]]:
-            """DFS to detect cycles."""
-            if obj_name in rec_stack:
-                # Found a cycle
-                cycle_start = path.index(obj_name)
-                return path[cycle_start:] + [obj_name]
-
-            if obj_name in visited:
-                return None
-
-            visited.add(obj_name)
-            rec_stack.add(obj_name)
-            path.append(obj_name)
-
-            if obj_name in self.all_objects:
-                obj = self.all_objects[obj_name]
-                for dep in obj.dependency_info.all_dependencies:
-                    if dep in self.all_objects:
-                        cycle = visit(dep, path.copy())
-                        if cycle:
-                            return cycle
-
-            rec_stack.remove(obj_name)
-            return None
-
-        # Check each object
-        for obj_name in self.all_objects:
-            if obj_name not in visited:
-                cycle = visit(obj_name, [])
-                if cycle:
-                    # Record cycle for all objects in it
-                    for cycle_obj in cycle[:-1]:  # Exclude duplicate last element
-                        if cycle_obj not in circular_deps:
-                            circular_deps[cycle_obj] = cycle
-
+        for component in self.find_cycle_components(start_nodes, positions):
+            circular_deps.update(cycle_cover(component, self.successors))
         return circular_deps
 
 
 class FileParser:
     """
     Handles parsing of individual Terraform files.
+
+    When a ``ParseCache`` is given, HCL parse results are looked up by
+    content hash before python-hcl2 is invoked. File contents come from a
+    ``SourceReader``, so a file is read once for both parsing and line
+    number lookups.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ParseCache] = None,
+        source: Optional[SourceReader] = None,
+    ):
         self._file_cache: Dict[str, List[str]] = {}
+        self._block_index: Dict[str, BlockIndex] = {}
+        self.cache = cache
+        self.source = source or SourceReader()
 
     def cache_file(self, file_path: str) -> None:
         """Cache file contents for line number lookups."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                self._file_cache[file_path] = f.readlines()
+            self._file_cache[file_path] = self.source.read(file_path).lines
         except (OSError, UnicodeDecodeError) as e:
             print(f"Warning: Could not cache file {file_path}: {e}")
             self._file_cache[file_path] = []
+        self._block_index[file_path] = BlockIndex.from_lines(
+            self._file_cache[file_path]
+        )
+
+    def uncache_file(self, file_path: str) -> None:
+        """Drop cached file contents."""
+        self._file_cache.pop(file_path, None)
+        self._block_index.pop(file_path, None)
+        self.source.forget(file_path)
+
+    def read_text(self, file_path: str) -> Optional[str]:
+        """Return the text of a file, or None if it cannot be read."""
+        try:
+            return self.source.read(file_path).text
+        except (OSError, UnicodeDecodeError):
+            return None
 
-    def find_line_number(
-        self, file_path: str, search_pattern: str, object_name: str
+    def locate_block(
+        self, file_path: str, block_type: str, *labels: str, occurrence: int = 0
     ) -> int:
         """
-        Find the line number where an object is defined.
+        Return the line where a block is declared, or 1 if it is not found.
         """
-        if file_path not in self._file_cache:
-            return 1
-
-        lines = self._file_cache[file_path]
-
-        # Try to find the exact object definition
-        for i, line in enumerate(lines, 1):
-            if search_pattern in line and f'"{object_name}"' in line:
-                return i
+        index = self._block_index.get(file_path)
+        span = index.find(block_type, *labels, occurrence=occurrence) if index else None
+        return span[0] if span else 1
 
-        # Fallback: find just the pattern
-        for i, line in enumerate(lines, 1):
-            if search_pattern in line:
-                return i
-
-        return 1
+    def locate_local(self, file_path: str, local_name: str) -> int:
+        """
+        Return the line where a local value is assigned.
 
-    def parse_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        Falls back to the first ``locals`` block of the file, then to 1.
+        """
+        index = self._block_index.get(file_path)
+        if index is None:
+            return 1
+        line = index.find_local(local_name)
+        if line is None:
+            span = index.find("locals")
+            line = span[0] if span else 1
+        return line
+
+    def parse_file(
+        self, file_path: str, content: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Parse a Terraform file and return the parsed structure.
+
+        ``content`` skips reading the file when its text is already known.
         """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                content = self.source.read(file_path).text
 
-            if file_path.endswith(".tf.json"):
-                return json.loads(content)
-            else:
-                if hcl2 is None:
-                    raise ImportError("python-hcl2 is required for parsing .tf files")
-                return hcl2.loads(content)
+            return self.parse_content(file_path, content)
 
         except Exception as e:
             print(f"Warning: Could not parse {file_path}: {e}")
             return None
 
+    def parse_content(self, file_path: str, content: str) -> Dict[str, Any]:
+        """
+        Parse already loaded file content, consulting the parse cache.
+        """
+        if file_path.endswith(".tf.json"):
+            return json.loads(content)
+
+        hcl2 = _import_hcl2()
+        if self.cache is None:
+            return hcl2.loads(content)
+
+        key = self.cache.key_for(content)
+        parsed = self.cache.get(key)
+        if parsed is None:
+            parsed = hcl2.loads(content)
+            self.cache.put(key, parsed)
+        return parsed
+
+    def lookup_cached(
+        self, file_path: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look a file up in the parse cache without parsing it.
+
+        Returns:
+            ``(key, parsed)``; ``parsed`` is None on a miss and ``key`` is
+            None when the file cannot be cached at all.
+        """
+        if self.cache is None or file_path.endswith(".tf.json"):
+            return None, None
+
+        content = self.read_text(file_path)
+        if content is None:
+            return None, None
+
+        key = self.cache.key_for(content)
+        return key, self.cache.get(key)
+
+
+def _import_hcl2():
+    """Import python-hcl2 on first parse; it loads lark and its grammar."""
+    try:
+        import hcl2
+    except ImportError:
+        raise ImportError(
+            "python-hcl2 is required for Terraform analysis. "
+            "Install with: pip install python-hcl2"
+        ) from None
+    return hcl2
+
+
+def _parse_file_in_worker(
+    file_path: str, content: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Process pool entry point: parse one file with a worker-local parser.
+
+    The text is read by the parent process and shipped with the task, so
+    workers only open the file if the parent could not read it.
+    """
+    return FileParser().parse_file(file_path, content)
+
 
 class ObjectFactory:
     """
@@ -341,8 +536,8 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, f'resource "{resource_type}"', instance_name
+            line_number=self.file_parser.locate_block(
+                file_path, "resource", resource_type, instance_name
             ),
         )
 
@@ -350,7 +545,8 @@ class ObjectFactory:
         provider_info = ProviderInfo(provider_name=provider) if provider else None
 
         # Extract metadata
-        tags = config.get("tags", {}) if isinstance(config, dict) else {}
+        # Left unset when absent, so the object never allocates empty tags
+        tags = config.get("tags") if isinstance(config, dict) else None
         description = config.get("description") if isinstance(config, dict) else None
 
         return TerraformObject(
@@ -360,7 +556,7 @@ class ObjectFactory:
             location=location,
             dependency_info=DependencyInfo(),
             attributes=config or {},
-            resource_type=resource_type,
+            resource_type=sys.intern(resource_type),
             provider_info=provider_info,
             tags=tags,
             description=description,
@@ -378,8 +574,8 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, f'data "{data_type}"', instance_name
+            line_number=self.file_parser.locate_block(
+                file_path, "data", data_type, instance_name
             ),
         )
 
@@ -393,7 +589,7 @@ class ObjectFactory:
             location=location,
             dependency_info=DependencyInfo(),
             attributes=config or {},
-            resource_type=data_type,
+            resource_type=sys.intern(data_type),
             provider_info=provider_info,
         )
 
@@ -408,9 +604,7 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, 'module "', module_name
-            ),
+            line_number=self.file_parser.locate_block(file_path, "module", module_name),
         )
 
         source = config.get("source") if isinstance(config, dict) else None
@@ -438,9 +632,7 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, 'variable "', var_name
-            ),
+            line_number=self.file_parser.locate_block(file_path, "variable", var_name),
         )
 
         var_type = None
@@ -481,9 +673,7 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, 'output "', output_name
-            ),
+            line_number=self.file_parser.locate_block(file_path, "output", output_name),
         )
 
         sensitive = False
@@ -518,8 +708,8 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, 'provider "', provider_name
+            line_number=self.file_parser.locate_block(
+                file_path, "provider", provider_name
             ),
         )
 
@@ -561,9 +751,7 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(
-                file_path, "locals", local_name
-            ),
+            line_number=self.file_parser.locate_local(file_path, local_name),
         )
 
         return TerraformObject(
@@ -586,7 +774,9 @@ class ObjectFactory:
 
         location = LocationInfo(
             file_path=file_path,
-            line_number=self.file_parser.find_line_number(file_path, "terraform", ""),
+            line_number=self.file_parser.locate_block(
+                file_path, "terraform", occurrence=block_index
+            ),
         )
 
         return TerraformObject(
@@ -603,8 +793,9 @@ class ObjectFactory:
         if not resource_type or not isinstance(resource_type, str):
             return None
 
+        # Interned: thousands of objects share a handful of provider names
         parts = resource_type.split("_", 1)
-        return parts[0] if parts else None
+        return sys.intern(parts[0]) if parts else None
 
     def _format_type(self, type_value: Any) -> Optional[str]:
         """Format a Terraform type value into a readable string."""
@@ -624,60 +815,624 @@ class TerraformAnalyzer:
     Phase 1: Parse and create all objects (no dependencies)
     Phase 2: Extract and build all dependencies
     Phase 3: Compute states and detect circular dependencies
+
+    Parsing in phase 1 can be fanned out to a process pool with ``workers``.
+    Objects are still created in sorted file order, so the resulting project
+    is identical to a serial run.
+
+    After an analysis, ``update_files`` refreshes the project in place for a
+    set of changed files without repeating the full three phases.
+
+    ``analyze_many`` analyzes several root modules in one run, parsing the
+    files of all roots as a single batch.
+
+    With a ``profiler`` each phase is timed and counted, and ``progress`` is
+    told as files are parsed and phases finish.
+
+    ``low_memory`` trades ``update_files`` for a smaller footprint: each
+    file's text and line index are dropped once its objects are built,
+    roots are parsed one at a time, and after the analysis objects keep
+    only the raw attributes named in ``keep_attributes``.
     """
 
-    def __init__(self):
+    TERRAFORM_SUFFIXES = TERRAFORM_SUFFIXES
+    TFVARS_SUFFIXES = TFVARS_SUFFIXES
+
+    # Below these sizes the process pool costs more to start than it saves
+    PARALLEL_MIN_FILES = 8
+    PARALLEL_MIN_BYTES = 256 * 1024
+
+    def __init__(
+        self,
+        workers: Optional[int] = 1,
+        cache: Optional[ParseCache] = None,
+        walker: Optional[FileWalker] = None,
+        profiler: Optional[Profiler] = None,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+        low_memory: bool = False,
+        keep_attributes: Optional[Collection[str]] = (),
+    ):
+        """
+        Args:
+            workers: Number of processes used to parse files. ``1`` parses
+                serially, ``0`` or ``None`` uses one process per CPU.
+            cache: Optional parse cache, persistent (``ParseCache``) or
+                in-process (``MemoryParseCache``). Cache hits are resolved
+                in this process, only misses are sent to the pool.
+            walker: File discovery settings (ignored directories and ignore
+                files). Defaults to ``FileWalker()``.
+            profiler: Records the analysis phases; see
+                ``tfkit.core.profiling``
+            progress: Called as ``progress(description, completed, total)``
+                after each parsed file and each later phase. ``total`` is 0
+                while files are still being discovered.
+            low_memory: Release file contents and raw attributes as soon as
+                the analysis no longer needs them. ``update_files`` is not
+                available afterwards.
+            keep_attributes: With ``low_memory``, the attribute names that
+                the project's consumers read and objects keep; ``None``
+                keeps every attribute
+        """
         self.project: Optional[TerraformProject] = None
-        self.file_parser = FileParser()
+        self.file_parser = FileParser(cache=cache)
         self.object_factory = ObjectFactory(self.file_parser)
+        self.workers = workers
+        self.walker = walker or FileWalker()
+        self.profiler = profiler or Profiler(enabled=False)
+        self.progress = progress
+        self.low_memory = low_memory
+        self.keep_attributes = (
+            None if keep_attributes is None else frozenset(keep_attributes)
+        )
 
-    def analyze_project(self, project_path: str) -> TerraformProject:
+        # State kept between analyze_project() and update_files()
+        self._tf_files: Set[str] = set()
+        self._objects_view: Dict[str, TerraformObject] = {}
+        self._extractor: Optional[DependencyExtractor] = None
+        self._unresolved_refs: Dict[str, Set[str]] = {}
+        self._unresolved_by_object: Dict[str, Set[str]] = {}
+        self._cycle_components: Dict[str, List[str]] = {}
+
+    def analyze_project(
+        self, project_path: str, recursive: bool = True
+    ) -> TerraformProject:
         """
         Analyze a Terraform project with proper three-phase approach.
+
+        ``recursive=False`` reads only the directory itself, the way
+        Terraform loads a single module.
         """
-        if hcl2 is None:
-            raise ImportError(
-                "python-hcl2 is required for Terraform analysis. "
-                "Install with: pip install python-hcl2"
-            )
+        self._require_hcl2()
 
         project_path = Path(project_path).resolve()
 
         if not project_path.exists():
             raise ValueError(f"Project path does not exist: {project_path}")
 
+        # Every file is read again on a new analysis
+        self.file_parser.source.clear()
+        io_start = self._io_counters()
+
+        with self.profiler.phase("analyze") as analysis:
+            # Find all Terraform and tfvars files in one traversal
+            self._report_progress("Discovering files...", 0, 0)
+            with self.profiler.phase("discover") as phase:
+                discovered = self.walker.walk(str(project_path), recursive=recursive)
+                phase.count("terraform files", len(discovered.terraform))
+                phase.count("tfvars files", len(discovered.tfvars))
+
+            self._analyze_root(project_path, discovered, self._iter_parsed_files)
+            self._record_io(io_start)
+            analysis.count("objects", len(self.project.all_objects))
+
+        return self.project
+
+    def analyze_many(
+        self, project_paths: Iterable[str], fail_fast: bool = False
+    ) -> WorkspaceAnalysis:
+        """
+        Analyze several root modules in one run.
+
+        Files are discovered for every root first, then the Terraform files
+        of all roots are parsed as one batch: a file under several roots is
+        read and parsed once, files with identical content are parsed once
+        through an in-memory parse cache, and with ``workers`` the whole
+        batch shares a single process pool. Each root is then built into its
+        own project exactly as ``analyze_project`` would build it.
+
+        Afterwards ``self.project`` is the last root analyzed, so
+        ``update_files`` applies to that root.
+
+        Args:
+            project_paths: Root module directories; duplicates are skipped
+            fail_fast: Raise the first error instead of recording it
+
+        Returns:
+            Projects and errors by resolved root path, in input order
+        """
+        self._require_hcl2()
+
+        with self.profiler.phase("analyze") as analysis:
+            workspace = self._analyze_many(project_paths, fail_fast)
+            analysis.count("roots", len(workspace.projects) + len(workspace.errors))
+            analysis.count(
+                "objects",
+                sum(len(p.all_objects) for p in workspace.projects.values()),
+            )
+        return workspace
+
+    def _analyze_many(
+        self, project_paths: Iterable[str], fail_fast: bool
+    ) -> WorkspaceAnalysis:
+        workspace = WorkspaceAnalysis()
+        self.file_parser.source.clear()
+        io_start = self._io_counters()
+        self._report_progress("Discovering files...", 0, 0)
+
+        roots: List[Tuple[Path, DiscoveredFiles]] = []
+        seen: Set[Path] = set()
+        for project_path in project_paths:
+            root = Path(project_path).resolve()
+            if root in seen:
+                continue
+            seen.add(root)
+
+            if not root.exists():
+                error = ValueError(f"Project path does not exist: {root}")
+                if fail_fast:
+                    raise error
+                workspace.errors[str(root)] = str(error)
+                continue
+            with self.profiler.phase("discover") as phase:
+                discovered = self.walker.walk(str(root))
+                phase.count("terraform files", len(discovered.terraform))
+                phase.count("tfvars files", len(discovered.tfvars))
+            roots.append((root, discovered))
+
+        # How many roots still need each file; a file's text and parse
+        # result are dropped once the last root using it is built
+        pending_uses: Dict[str, int] = {}
+        for _, discovered in roots:
+            for path in discovered.terraform + discovered.tfvars:
+                pending_uses[path] = pending_uses.get(path, 0) + 1
+
+        cache = self.file_parser.cache
+        if not self.low_memory and not isinstance(cache, MemoryParseCache):
+            self.file_parser.cache = MemoryParseCache(cache)
+
+        try:
+            parsed_files: Dict[str, Optional[Dict[str, Any]]] = {}
+            parse_files = self._iter_parsed_files
+            # In low-memory mode each root parses its own files, so only
+            # one file's tree is alive at a time
+            if not self.low_memory:
+                tf_files = sorted(
+                    p for p in pending_uses if p.endswith(TERRAFORM_SUFFIXES)
+                )
+                with self.profiler.phase("parse batch") as phase:
+                    parsed_files.update(self._iter_parsed_files(tf_files))
+                    phase.count("files", len(tf_files))
+
+                def parse_files(
+                    files: List[str],
+                ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+                    for path in files:
+                        yield path, parsed_files.get(path)
+
+            for root, discovered in roots:
+                root_io_start = self._io_counters()
+                try:
+                    self._analyze_root(root, discovered, parse_files)
+                except Exception as e:
+                    if fail_fast:
+                        raise
+                    workspace.errors[str(root)] = str(e)
+                else:
+                    self._record_io(root_io_start)
+                    workspace.projects[str(root)] = self.project
+                finally:
+                    for path in discovered.terraform + discovered.tfvars:
+                        pending_uses[path] -= 1
+                        if not pending_uses[path]:
+                            parsed_files.pop(path, None)
+                            self.file_parser.uncache_file(path)
+        finally:
+            self.file_parser.cache = cache
+
+        files_opened, bytes_read = self._io_counters()
+        workspace.files_opened = files_opened - io_start[0]
+        workspace.bytes_read = bytes_read - io_start[1]
+        return workspace
+
+    def _analyze_root(
+        self,
+        project_path: Path,
+        discovered: DiscoveredFiles,
+        parse_files: Callable[
+            [List[str]], Iterable[Tuple[str, Optional[Dict[str, Any]]]]
+        ],
+    ) -> TerraformProject:
+        """Build ``self.project`` for one root from its discovered files."""
         self.project = TerraformProject(project_path=str(project_path))
 
-        # Find all Terraform files
-        tf_files = self._find_terraform_files(project_path)
+        tf_files = discovered.terraform
 
         if not tf_files:
             raise ValueError(f"No Terraform files found in {project_path}")
 
         self.project.metadata.total_files = len(tf_files)
-
-        # Cache all files for line number lookups
-        for tf_file in tf_files:
-            self.file_parser.cache_file(tf_file)
-
-        # ===== PHASE 1: Parse and create all objects =====
-        for tf_file in tf_files:
-            self._parse_terraform_file(tf_file)
+        self.project.source_files = tf_files + discovered.tfvars
+        self._tf_files = set(tf_files)
+
+        profiler = self.profiler
+        # Parsed files, then dependencies, cycles, states and tfvars
+        total_steps = len(tf_files) + 4
+
+        with profiler.phase("parse") as parse:
+            # Cache all files for line number lookups; in low-memory mode
+            # each file is cached only while its objects are built
+            if not self.low_memory:
+                with profiler.phase("read files"):
+                    for tf_file in tf_files:
+                        self.file_parser.cache_file(tf_file)
+
+            # ===== PHASE 1: Parse and create all objects =====
+            parsed_files = iter(parse_files(tf_files))
+            for done in range(1, len(tf_files) + 1):
+                with profiler.phase("parse HCL"):
+                    tf_file, parsed = next(parsed_files)
+                with profiler.phase("create objects"):
+                    if self.low_memory:
+                        self.file_parser.cache_file(tf_file)
+                    self._extract_objects(parsed, tf_file)
+                    if self.low_memory:
+                        self.file_parser.uncache_file(tf_file)
+                # Free this file's tree before the next one is parsed
+                del parsed
+                self._report_progress("Parsing files...", done, total_steps)
+
+            parse.count("files", len(tf_files))
+            parse.count("objects", len(self.project.all_objects))
 
         # ===== PHASE 2: Extract and build dependencies =====
-        self._build_all_dependencies()
+        with profiler.phase("dependencies") as phase:
+            self._build_all_dependencies()
+            phase.count(
+                "edges",
+                sum(
+                    len(obj.dependency_info.explicit_dependencies)
+                    + len(obj.dependency_info.implicit_dependencies)
+                    for obj in self.project.all_objects.values()
+                ),
+            )
+        self._report_progress("Building dependencies...", total_steps - 3, total_steps)
 
         # ===== PHASE 3: Detect circular dependencies and compute states =====
-        self._detect_all_circular_dependencies()
+        with profiler.phase("cycles") as phase:
+            self._detect_all_circular_dependencies()
+            phase.count("objects in cycles", len(self._cycle_components))
+        self._report_progress("Detecting cycles...", total_steps - 2, total_steps)
 
-        self._compute_all_states()
+        with profiler.phase("states"):
+            self._compute_all_states()
+            self.project.invalidate_caches()
+        self._report_progress("Computing states...", total_steps - 1, total_steps)
 
         # Parse additional files
-        self._parse_tfvars_files(project_path)
-        self._parse_backend_config(project_path)
+        with profiler.phase("tfvars and backend") as phase:
+            self._parse_tfvars_files(discovered.tfvars)
+            self._parse_backend_config(project_path)
+            phase.count("tfvars files", len(discovered.tfvars))
+        self._report_progress("Reading variables...", total_steps, total_steps)
+
+        if self.low_memory:
+            with profiler.phase("release memory"):
+                self._release_memory(discovered.tfvars)
 
         return self.project
 
+    def _release_memory(self, tfvars_files: List[str]) -> None:
+        """Drop what only the analysis or ``update_files`` needed."""
+        for tfvars_file in tfvars_files:
+            self.file_parser.uncache_file(tfvars_file)
+
+        keep = self.keep_attributes
+        if keep is not None:
+            for obj in self.project.all_objects.values():
+                obj.record_completeness()
+                attributes = obj.attributes
+                if attributes and isinstance(attributes, dict):
+                    obj.attributes = {
+                        name: value
+                        for name, value in attributes.items()
+                        if name in keep
+                    }
+
+        self._tf_files = set()
+        self._objects_view = {}
+        self._extractor = None
+        self._unresolved_refs = {}
+        self._unresolved_by_object = {}
+        self._cycle_components = {}
+
+    def _report_progress(self, description: str, completed: int, total: int) -> None:
+        if self.progress is not None:
+            self.progress(description, completed, total)
+
+    def update_files(
+        self, changed: Iterable[str] = (), deleted: Iterable[str] = ()
+    ) -> TerraformProject:
+        """
+        Refresh the analyzed project in place after files changed on disk.
+
+        Only the given files are re-parsed. Dependencies are re-extracted for
+        their objects, for objects that depended on removed objects, and for
+        objects whose missing or partial references may now resolve. Reverse
+        edges are patched and states are recomputed only for the affected
+        neighbourhood, so the result matches a fresh ``analyze_project``.
+
+        Args:
+            changed: Created or modified files (absolute or project-relative)
+            deleted: Removed files (absolute or project-relative)
+
+        Returns:
+            The updated project
+        """
+        if not self.project:
+            raise ValueError("update_files() requires a prior analyze_project() call")
+        if self.low_memory:
+            raise ValueError("update_files() is not available with low_memory")
+
+        project = self.project
+        root = project.metadata.project_path
+
+        changed_paths = {os.path.abspath(os.path.join(root, p)) for p in changed}
+        deleted_paths = {os.path.abspath(os.path.join(root, p)) for p in deleted}
+
+        # A "changed" file that no longer exists, or that file discovery
+        # would now skip, has left the project
+        for path in list(changed_paths):
+            if not os.path.exists(path) or not self.walker.includes(root, path):
+                changed_paths.discard(path)
+                deleted_paths.add(path)
+        deleted_paths -= changed_paths
+
+        sources = (set(project.source_files) - deleted_paths) | changed_paths
+        project.source_files = sorted(
+            p for p in sources if p.endswith(self.TERRAFORM_SUFFIXES)
+        ) + sorted(p for p in sources if p.endswith(self.TFVARS_SUFFIXES))
+
+        io_start = self._io_counters()
+
+        for path in sorted(changed_paths | deleted_paths):
+            if path.endswith(self.TFVARS_SUFFIXES):
+                project.tfvars_files.pop(path, None)
+                self.file_parser.source.forget(path)
+                if path in changed_paths:
+                    self._parse_tfvars_file(path)
+
+        changed_tf = {p for p in changed_paths if p.endswith(self.TERRAFORM_SUFFIXES)}
+        deleted_tf = {p for p in deleted_paths if p.endswith(self.TERRAFORM_SUFFIXES)}
+        if not changed_tf and not deleted_tf:
+            self._record_io(io_start)
+            return project
+
+        objects = self._objects_view
+        touched = changed_tf | deleted_tf
+
+        # Files that declare a name also declared by a touched file are
+        # re-parsed too, so the right declaration wins afterwards
+        declared: Set[str] = set()
+        for path in touched:
+            declared.update(project.get_names_by_file(path))
+
+        reparse = set(changed_tf)
+        for path in project.files:
+            if path not in touched and not declared.isdisjoint(
+                project.get_names_by_file(path)
+            ):
+                reparse.add(path)
+
+        # ===== Remove objects owned by the touched files =====
+        removed: Dict[str, TerraformObject] = {}
+        self._detach_files(sorted(reparse | deleted_tf), removed)
+
+        self._tf_files -= deleted_tf
+        self._tf_files |= changed_tf
+        project.metadata.total_files = len(self._tf_files)
+
+        # ===== Re-parse changed files =====
+        parsed_files: Dict[str, Optional[Dict[str, Any]]] = {}
+        while True:
+            pending = sorted(f for f in reparse if f not in parsed_files)
+            for tf_file in pending:
+                self.file_parser.cache_file(tf_file)
+            parsed_files.update(self._iter_parsed_files(pending))
+
+            for tf_file in sorted(reparse):
+                self._extract_objects(parsed_files[tf_file], tf_file)
+
+            # A new declaration may clash with a file that was not re-parsed;
+            # pull such files in and extract again so the last file wins
+            declared = set()
+            for path in reparse:
+                declared.update(project.get_names_by_file(path))
+            extra = {
+                path
+                for path in project.files
+                if path not in reparse
+                and not declared.isdisjoint(project.get_names_by_file(path))
+            }
+            if not extra:
+                break
+
+            for path in reparse:
+                project.remove_file(path)
+            self._detach_files(sorted(extra), removed)
+            reparse |= extra
+
+        project.reorder_by_files(sorted(self._tf_files))
+
+        reextract: Set[str] = set()
+        stale_targets: Set[str] = set()
+        for name, obj in removed.items():
+            self._forget_unresolved(name)
+            reextract.update(obj.dependency_info.dependent_objects)
+            for dep in obj.dependency_info.all_dependencies:
+                target = objects.get(dep)
+                if target and name in target.dependency_info.dependent_objects:
+                    target.dependency_info.dependent_objects.discard(name)
+                    stale_targets.add(dep)
+
+        added: Dict[str, TerraformObject] = {}
+        for path in sorted(reparse):
+            for name in project.get_names_by_file(path):
+                obj = project.get_object(name)
+                if obj is not None:
+                    added[name] = obj
+        objects.update(added)
+        for name in added:
+            self._extractor.add_name(name)
+
+        # Objects with an unresolved reference that is a prefix of (or equal
+        # to) a new name may now resolve to it
+        for name in added:
+            for end in range(1, len(name) + 1):
+                referrers = self._unresolved_refs.get(name[:end])
+                if referrers:
+                    reextract.update(referrers)
+
+        reextract = {n for n in reextract if n in objects and n not in added}
+
+        # ===== Re-extract dependencies =====
+        extractor = self._extractor
+        old_dependencies: Dict[str, List[str]] = {}
+
+        for name in reextract:
+            obj = objects[name]
+            old_dependencies[name] = obj.dependency_info.all_dependencies
+            self._forget_unresolved(name)
+            dep_info = self._extract_dependencies(extractor, name, obj)
+            dep_info.dependent_objects = obj.dependency_info.dependent_objects
+            obj.dependency_info = dep_info
+
+        for name, obj in added.items():
+            obj.set_all_objects_cache(objects)
+            if obj.type in [ResourceType.VARIABLE, ResourceType.TERRAFORM]:
+                continue
+            obj.dependency_info = self._extract_dependencies(extractor, name, obj)
+
+        providers = self._provider_index()
+        new_providers = {p for p in providers.values() if p in added}
+        relinked: Set[str] = set()
+
+        for name, obj in objects.items():
+            if obj.type not in [ResourceType.RESOURCE, ResourceType.DATA]:
+                continue
+            if name in reextract or name in added:
+                self._link_provider(name, obj, providers)
+            elif self._resolve_provider(obj, providers) in new_providers:
+                old_dependencies[name] = obj.dependency_info.all_dependencies
+                self._link_provider(name, obj, providers)
+                relinked.add(name)
+
+        # ===== Patch reverse edges =====
+        changed_nodes = reextract | relinked | set(added)
+
+        for name in changed_nodes:
+            obj = objects[name]
+            new_deps = obj.dependency_info.all_dependencies
+            for dep in set(old_dependencies.get(name, ())) - set(new_deps):
+                target = objects.get(dep)
+                if target and name in target.dependency_info.dependent_objects:
+                    target.dependency_info.dependent_objects.discard(name)
+                    stale_targets.add(dep)
+            for dep in new_deps:
+                target = objects.get(dep)
+                if target is None:
+                    continue
+                target.dependency_info.dependent_objects.add(name)
+                stale_targets.add(dep)
+
+        # Keep reverse edges in project order, as a full build lists them
+        positions = {name: i for i, name in enumerate(project.all_objects)}
+        for name in stale_targets | set(added):
+            obj = objects.get(name)
+            if obj is not None:
+                obj.dependency_info.dependent_objects.sort(
+                    key=lambda n: positions.get(n, len(positions))
+                )
+
+        # ===== Re-detect cycles through changed edges =====
+        # A changed edge can only split or merge the cycle components of
+        # its endpoints, so the old components of changed and removed
+        # objects are searched again along with the changed objects
+        cycle_nodes = set(changed_nodes)
+        for name in changed_nodes | set(removed):
+            cycle_nodes.update(self._cycle_components.get(name, ()))
+        cycle_nodes &= objects.keys()
+
+        for name in cycle_nodes | set(removed):
+            self._cycle_components.pop(name, None)
+        for name in cycle_nodes:
+            objects[name].dependency_info.circular_dependencies = []
+
+        start_nodes = sorted(cycle_nodes, key=positions.__getitem__)
+        cycle_nodes.update(self._assign_cycles(start_nodes, positions))
+
+        # ===== Recompute states of the affected neighbourhood =====
+        affected = (changed_nodes | stale_targets | cycle_nodes) & objects.keys()
+
+        # Variables and locals are judged by whether their dependents reach
+        # infrastructure, so a change propagates up through chains of them
+        pending = list(affected)
+        while pending:
+            obj = objects[pending.pop()]
+            if obj.type not in [ResourceType.LOCAL, ResourceType.VARIABLE]:
+                continue
+            for dep in obj.dependency_info.all_dependencies:
+                if dep in objects and dep not in affected:
+                    affected.add(dep)
+                    pending.append(dep)
+
+        ProjectStateEngine(objects).assign_states(affected)
+        project.invalidate_caches()
+
+        project.backend_config = None
+        self._parse_backend_config(Path(root))
+
+        self._record_io(io_start)
+
+        return project
+
+    def _detach_files(
+        self, file_paths: List[str], removed: Dict[str, TerraformObject]
+    ) -> None:
+        """Remove the objects defined in files from the project and the shared view."""
+        for path in file_paths:
+            for name in self.project.get_names_by_file(path):
+                obj = self._objects_view.get(name)
+                if obj is not None and obj.location.file_path == path:
+                    removed[name] = self._objects_view.pop(name)
+                    self._extractor.remove_name(name)
+            self.project.remove_file(path)
+            self.file_parser.uncache_file(path)
+
+    @staticmethod
+    def _require_hcl2() -> None:
+        _import_hcl2()
+
+    def _io_counters(self) -> Tuple[int, int]:
+        """Current ``(files_opened, bytes_read)`` of the source reader."""
+        source = self.file_parser.source
+        return source.files_opened, source.bytes_read
+
+    def _record_io(self, start: Tuple[int, int]) -> None:
+        """Add the I/O done since ``start`` to the project metadata."""
+        files_opened, bytes_read = self._io_counters()
+        self.project.metadata.files_opened += files_opened - start[0]
+        self.project.metadata.bytes_read += bytes_read - start[1]
+
     def _build_all_dependencies(self) -> None:
         """
         Build dependencies for all objects in a single pass.
@@ -685,30 +1440,62 @@ class TerraformAnalyzer:
         if not self.project:
             return
 
-        # Create dependency extractor with all objects
-        extractor = DependencyExtractor(self.project.all_objects)
+        # One mapping of all objects and one extractor (with its prefix
+        # index) serve every later phase and update_files(). The mapping is
+        # a snapshot: update_files() needs the old objects of re-parsed
+        # files after the project has replaced them.
+        self._objects_view = self.project.snapshot()
+        self._extractor = extractor = DependencyExtractor(
+            self._objects_view, self.project.symbols
+        )
+        self._unresolved_refs = {}
+        self._unresolved_by_object = {}
 
         # Extract dependencies for ALL object types
         # Variables don't have dependencies, but providers, outputs, locals, and modules do
-        for obj_name, obj in self.project.all_objects.items():
+        all_objects = self._objects_view
+        for obj_name, obj in all_objects.items():
             # Skip only variables and terraform blocks (they don't reference other objects)
             if obj.type in [ResourceType.VARIABLE, ResourceType.TERRAFORM]:
                 continue
 
-            dep_info = extractor.extract(obj.attributes, obj_name)
-            obj.dependency_info = dep_info
+            obj.dependency_info = self._extract_dependencies(extractor, obj_name, obj)
 
         # Build reverse dependencies (who depends on me)
-        for obj_name, obj in self.project.all_objects.items():
+        for obj_name, obj in all_objects.items():
             for dep in obj.dependency_info.all_dependencies:
-                if dep in self.project.all_objects:
-                    dep_obj = self.project.all_objects[dep]
-                    if obj_name not in dep_obj.dependency_info.dependent_objects:
-                        dep_obj.dependency_info.dependent_objects.append(obj_name)
+                if dep in all_objects:
+                    all_objects[dep].dependency_info.dependent_objects.add(obj_name)
 
         # Build provider relationships
         self._build_provider_relationships()
 
+    def _extract_dependencies(
+        self, extractor: DependencyExtractor, obj_name: str, obj: TerraformObject
+    ) -> DependencyInfo:
+        """
+        Extract an object's dependencies and index its unresolved references,
+        so that objects added later can find the objects they may satisfy.
+        """
+        unresolved: Set[str] = set()
+        dep_info = extractor.extract(obj.attributes, obj_name, unresolved)
+
+        if unresolved:
+            self._unresolved_by_object[obj_name] = unresolved
+            for ref in unresolved:
+                self._unresolved_refs.setdefault(ref, set()).add(obj_name)
+
+        return dep_info
+
+    def _forget_unresolved(self, obj_name: str) -> None:
+        """Remove an object from the unresolved reference index."""
+        for ref in self._unresolved_by_object.pop(obj_name, ()):
+            referrers = self._unresolved_refs.get(ref)
+            if referrers is not None:
+                referrers.discard(obj_name)
+                if not referrers:
+                    del self._unresolved_refs[ref]
+
     def _detect_all_circular_dependencies(self) -> None:
         """
         Detect circular dependencies across all objects.
@@ -716,14 +1503,34 @@ class TerraformAnalyzer:
         if not self.project:
             return
 
-        extractor = DependencyExtractor(self.project.all_objects)
-        circular_deps = extractor.detect_circular_dependencies()
+        self._cycle_components = {}
+        self._assign_cycles()
+
+    def _assign_cycles(
+        self,
+        start_nodes: Optional[List[str]] = None,
+        positions: Optional[Dict[str, int]] = None,
+    ) -> Set[str]:
+        """
+        Record a cycle on every object of the cycle components reachable
+        from ``start_nodes`` and remember the components for update_files.
+
+        Returns:
+            Names of the objects that lie on a cycle
+        """
+        extractor = self._extractor
+        on_cycle: Set[str] = set()
+
+        for component in extractor.find_cycle_components(start_nodes, positions):
+            cover = cycle_cover(component, extractor.successors)
+            for name in component:
+                self._cycle_components[name] = component
+                self._objects_view[name].dependency_info.circular_dependencies = cover[
+                    name
+                ]
+            on_cycle.update(component)
 
-        # Update each object with its circular dependency information
-        for obj_name, cycle in circular_deps.items():
-            if obj_name in self.project.all_objects:
-                obj = self.project.all_objects[obj_name]
-                obj.dependency_info.circular_dependencies = cycle
+        return on_cycle
 
     def _compute_all_states(self) -> None:
         """
@@ -732,32 +1539,137 @@ class TerraformAnalyzer:
         if not self.project:
             return
 
-        # Set all_objects cache for each object (needed for provider state computation)
-        for obj in self.project.all_objects.values():
-            obj.set_all_objects_cache(self.project.all_objects)
+        # Share one all_objects mapping between every object (needed for
+        # provider state computation); update_files keeps it current
+        for obj in self._objects_view.values():
+            obj.set_all_objects_cache(self._objects_view)
 
-        # Invalidate any cached states
-        for obj in self.project.all_objects.values():
-            obj.invalidate_state()
-
-        # States will be computed lazily when accessed via the state property
+        # One sweep over the graph instead of a recursive walk per object;
+        # objects changed later through the API fall back to lazy states
+        ProjectStateEngine(self._objects_view).assign_states()
 
     def _find_terraform_files(self, project_path: Path) -> List[str]:
         """Find all Terraform files in the project."""
-        patterns = [
-            "**/*.tf",
-            "**/*.tf.json",
-        ]
+        return self.walker.walk(str(project_path)).terraform
 
-        files = []
-        for pattern in patterns:
-            files.extend(glob.glob(str(project_path / pattern), recursive=True))
+    def _resolve_workers(self, tf_files: List[str], sizes: Dict[str, int]) -> int:
+        """Decide how many parse processes are worth starting for these files."""
+        workers = self.workers if self.workers else (os.cpu_count() or 1)
+        workers = min(workers, len(tf_files))
 
-        return sorted(set(files))
+        if len(tf_files) < self.PARALLEL_MIN_FILES:
+            return 1
+        if sum(sizes.values()) < self.PARALLEL_MIN_BYTES:
+            return 1
+
+        return max(workers, 1)
+
+    def _iter_parsed_files(
+        self, tf_files: List[str]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Yield ``(file_path, parsed)`` for every file in the given order.
+
+        With more than one worker, files are submitted to a process pool
+        largest first for load balancing, while results are still yielded in
+        the caller's order so object creation stays deterministic.
+        """
+        if self.workers == 1:
+            for tf_file in tf_files:
+                yield tf_file, self.file_parser.parse_file(tf_file)
+            return
 
-    def _parse_terraform_file(self, file_path: str) -> None:
-        """Parse a single Terraform file and add objects to project."""
-        parsed = self.file_parser.parse_file(file_path)
+        sizes = {}
+        for tf_file in tf_files:
+            try:
+                sizes[tf_file] = os.path.getsize(tf_file)
+            except OSError:
+                sizes[tf_file] = 0
+
+        workers = self._resolve_workers(tf_files, sizes)
+        if workers <= 1:
+            for tf_file in tf_files:
+                yield tf_file, self.file_parser.parse_file(tf_file)
+            return
+
+        cached: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[str, str] = {}
+        # Files whose content matches an earlier miss reuse its result
+        same_content: Dict[str, str] = {}
+        misses = tf_files
+        if self.file_parser.cache is not None:
+            misses = []
+            first_by_key: Dict[str, str] = {}
+            for tf_file in tf_files:
+                key, parsed = self.file_parser.lookup_cached(tf_file)
+                if parsed is not None:
+                    cached[tf_file] = parsed
+                    continue
+                if key is not None:
+                    if key in first_by_key:
+                        same_content[tf_file] = first_by_key[key]
+                        continue
+                    first_by_key[key] = tf_file
+                    cache_keys[tf_file] = key
+                misses.append(tf_file)
+
+            workers = self._resolve_workers(misses, sizes)
+            if workers <= 1:
+                for tf_file in tf_files:
+                    parsed = cached.pop(tf_file, None)
+                    if parsed is None:
+                        parsed = self.file_parser.parse_file(tf_file)
+                    yield tf_file, parsed
+                return
+
+        schedule = sorted(misses, key=lambda f: sizes[f], reverse=True)
+
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError, ValueError) as e:
+            print(f"Warning: Parallel parsing unavailable, parsing serially: {e}")
+            for tf_file in tf_files:
+                yield tf_file, self.file_parser.parse_file(tf_file)
+            return
+
+        with executor:
+            futures = {
+                tf_file: executor.submit(
+                    _parse_file_in_worker,
+                    tf_file,
+                    self.file_parser.read_text(tf_file),
+                )
+                for tf_file in schedule
+            }
+            # Files still to be yielded from each future; a finished future
+            # is dropped so its result is not kept for the whole run
+            pending = dict.fromkeys(schedule, 1)
+            for source_file in same_content.values():
+                pending[source_file] += 1
+
+            for tf_file in tf_files:
+                if tf_file in cached:
+                    yield tf_file, cached.pop(tf_file)
+                    continue
+                source_file = same_content.get(tf_file, tf_file)
+                future = futures[source_file]
+                pending[source_file] -= 1
+                if not pending[source_file]:
+                    del futures[source_file]
+                try:
+                    parsed = future.result()
+                except BrokenProcessPool:
+                    parsed = self.file_parser.parse_file(tf_file)
+                else:
+                    key = cache_keys.get(tf_file)
+                    if key is not None and parsed is not None:
+                        self.file_parser.cache.put(key, parsed)
+                yield tf_file, parsed
+
+    def _extract_objects(
+        self, parsed: Optional[Dict[str, Any]], file_path: str
+    ) -> None:
+        """Create project objects from an already parsed file."""
         if not parsed:
             return
 
@@ -838,26 +1750,24 @@ class TerraformAnalyzer:
                 obj = self.object_factory.create_local(local_name, value, file_path)
                 self.project.add_object(obj)
 
-    def _parse_tfvars_files(self, project_path: Path) -> None:
+    def _parse_tfvars_files(self, tfvars_files: List[str]) -> None:
         """Parse .tfvars files for variable values."""
-        patterns = ["**/*.tfvars", "**/*.tfvars.json"]
-
-        tfvars_files = []
-        for pattern in patterns:
-            tfvars_files.extend(glob.glob(str(project_path / pattern), recursive=True))
-
         for tfvars_file in tfvars_files:
-            try:
-                with open(tfvars_file, encoding="utf-8") as f:
-                    if tfvars_file.endswith(".json"):
-                        variables = json.load(f)
-                    else:
-                        variables = hcl2.load(f)
+            self._parse_tfvars_file(tfvars_file)
 
-                self.project.tfvars_files[tfvars_file] = variables
+    def _parse_tfvars_file(self, tfvars_file: str) -> None:
+        """Parse a single .tfvars file into the project."""
+        try:
+            content = self.file_parser.source.read(tfvars_file).text
+            if tfvars_file.endswith(".json"):
+                variables = json.loads(content)
+            else:
+                variables = self.file_parser.parse_content(tfvars_file, content)
+
+            self.project.tfvars_files[tfvars_file] = variables
 
-            except Exception as e:
-                print(f"Warning: Could not parse tfvars file {tfvars_file}: {e}")
+        except Exception as e:
+            print(f"Warning: Could not parse tfvars file {tfvars_file}: {e}")
 
     def _parse_backend_config(self, project_path: Path) -> None:
         """Extract backend configuration from terraform blocks."""
@@ -874,45 +1784,57 @@ class TerraformAnalyzer:
         if not self.project:
             return
 
-        providers = {}
-        for obj_name, obj in self.project.all_objects.items():
-            if obj.type == ResourceType.PROVIDER:
-                provider_name = obj.name
-                provider_alias = (
-                    obj.provider_info.provider_alias if obj.provider_info else None
-                )
-
-                if provider_alias:
-                    providers[f"{provider_name}.{provider_alias}"] = obj_name
-                else:
-                    providers[provider_name] = obj_name
+        providers = self._provider_index()
 
-        relationships_built = 0
         for obj_name, obj in self.project.all_objects.items():
             if obj.type not in [ResourceType.RESOURCE, ResourceType.DATA]:
                 continue
+            self._link_provider(obj_name, obj, providers)
 
-            provider_prefix = obj.provider_prefix
-            if not provider_prefix:
-                continue
+    def _provider_index(self) -> Dict[str, str]:
+        """Map provider keys (``name`` or ``name.alias``) to provider objects."""
+        providers = {}
+        for obj_name, obj in self.project.providers.items():
+            provider_name = obj.name
+            provider_alias = (
+                obj.provider_info.provider_alias if obj.provider_info else None
+            )
+
+            if provider_alias:
+                providers[f"{provider_name}.{provider_alias}"] = obj_name
+            else:
+                providers[provider_name] = obj_name
+
+        return providers
+
+    def _resolve_provider(
+        self, obj: TerraformObject, providers: Dict[str, str]
+    ) -> Optional[str]:
+        """Find the provider object a resource or data source is served by."""
+        provider_prefix = obj.provider_prefix
+        if not provider_prefix:
+            return None
+
+        explicit_provider = None
+        if isinstance(obj.attributes, dict):
+            explicit_provider = obj.attributes.get("provider")
+
+        if explicit_provider:
+            return providers.get(explicit_provider)
+        return providers.get(provider_prefix)
+
+    def _link_provider(
+        self, obj_name: str, obj: TerraformObject, providers: Dict[str, str]
+    ) -> Optional[str]:
+        """Add the implicit dependency of a resource on its provider."""
+        provider_obj_name = self._resolve_provider(obj, providers)
+        if not provider_obj_name:
+            return None
+
+        obj.dependency_info.implicit_dependencies.add(provider_obj_name)
+
+        provider_obj = self.project.get_object(provider_obj_name)
+        if provider_obj is not None:
+            provider_obj.dependency_info.dependent_objects.add(obj_name)
 
-            explicit_provider = None
-            if isinstance(obj.attributes, dict):
-                explicit_provider = obj.attributes.get("provider")
-
-            provider_obj_name = None
-            if explicit_provider:
-                if explicit_provider in providers:
-                    provider_obj_name = providers[explicit_provider]
-            elif provider_prefix in providers:
-                provider_obj_name = providers[provider_prefix]
-
-            if provider_obj_name:
-                if provider_obj_name not in obj.dependency_info.implicit_dependencies:
-                    obj.dependency_info.implicit_dependencies.append(provider_obj_name)
-                    relationships_built += 1
-
-                if provider_obj_name in self.project.all_objects:
-                    provider_obj = self.project.all_objects[provider_obj_name]
-                    if obj_name not in provider_obj.dependency_info.dependent_objects:
-                        provider_obj.dependency_info.dependent_objects.append(obj_name)
+        return provider_obj_name
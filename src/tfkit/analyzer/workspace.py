@@ -0,0 +1,129 @@
+"""
+Results of analyzing several root modules together.
+"""
+
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Optional
+
+from tfkit.core.jsonstream import JSONStreamWriter
+
+from .project import ProjectStatistics, TerraformProject
+
+
+@dataclass
+class WorkspaceAnalysis:
+    """
+    Projects produced by ``TerraformAnalyzer.analyze_many``.
+
+    Attributes:
+        projects: Analyzed projects by resolved root path, in input order
+        errors: Error messages for roots that could not be analyzed
+        files_opened: Files read from disk for the whole run
+        bytes_read: Bytes read from disk for the whole run
+    """
+
+    projects: Dict[str, TerraformProject] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    files_opened: int = 0
+    bytes_read: int = 0
+
+    def compute_statistics(self) -> ProjectStatistics:
+        """
+        Combine the statistics of every analyzed root.
+
+        Counts are summed and providers merged. Object names in the issue
+        lists are prefixed with their root, as in ``<root>:<name>``.
+        """
+        total = ProjectStatistics()
+        providers = set()
+
+        for root, project in self.projects.items():
+            stats = project.compute_statistics()
+            total.resource_count += stats.resource_count
+            total.data_source_count += stats.data_source_count
+            total.module_count += stats.module_count
+            total.variable_count += stats.variable_count
+            total.output_count += stats.output_count
+            total.provider_count += stats.provider_count
+            total.local_count += stats.local_count
+
+            for state, count in stats.state_distribution.items():
+                total.state_distribution[state] = (
+                    total.state_distribution.get(state, 0) + count
+                )
+            for resource_type, count in stats.resource_counts_by_type.items():
+                total.resource_counts_by_type[resource_type] = (
+                    total.resource_counts_by_type.get(resource_type, 0) + count
+                )
+            providers.update(stats.providers_used)
+
+            total.unused_objects.extend(f"{root}:{n}" for n in stats.unused_objects)
+            total.orphaned_objects.extend(f"{root}:{n}" for n in stats.orphaned_objects)
+            total.isolated_objects.extend(f"{root}:{n}" for n in stats.isolated_objects)
+            total.incomplete_objects.extend(
+                f"{root}:{n}" for n in stats.incomplete_objects
+            )
+
+        total.providers_used = sorted(providers)
+        return total
+
+    def _metadata(self) -> Dict[str, Any]:
+        return {
+            "roots": len(self.projects) + len(self.errors),
+            "analyzed": len(self.projects),
+            "failed": len(self.errors),
+            "total_files": sum(p.metadata.total_files for p in self.projects.values()),
+            "files_opened": self.files_opened,
+            "bytes_read": self.bytes_read,
+        }
+
+    def to_dict(self, statistics_only: bool = False) -> Dict[str, Any]:
+        """
+        Convert to a dictionary.
+
+        ``statistics`` has the same shape as a single project's, so reports
+        built for one project can show the whole workspace.
+
+        Args:
+            statistics_only: Give each root only its metadata and statistics
+                instead of all its objects
+        """
+        if statistics_only:
+            projects = {
+                root: {
+                    "metadata": project.metadata.to_dict(),
+                    "statistics": project.compute_statistics().to_dict(),
+                }
+                for root, project in self.projects.items()
+            }
+        else:
+            projects = {
+                root: project.to_dict() for root, project in self.projects.items()
+            }
+
+        return {
+            "metadata": self._metadata(),
+            "statistics": self.compute_statistics().to_dict(),
+            "projects": projects,
+            "errors": dict(self.errors),
+        }
+
+    def write_json(self, fp: IO[str], indent: Optional[int] = 2) -> None:
+        """
+        Write the workspace as JSON, one object at a time.
+
+        The text is the same as ``json.dump(self.to_dict(), fp,
+        indent=indent, default=str)``; see ``TerraformProject.write_json``.
+        """
+        writer = JSONStreamWriter(fp, indent)
+        writer.begin_object()
+        writer.value(self._metadata(), "metadata")
+        writer.value(self.compute_statistics().to_dict(), "statistics")
+        writer.begin_object("projects")
+        for root, project in self.projects.items():
+            writer.begin_object(root)
+            project._write_json_fields(writer)
+            writer.end()
+        writer.end()
+        writer.value(self.errors, "errors")
+        writer.end()
@@ -1,9 +1,17 @@
+import importlib
 import sys
 
 import click
-from rich.console import Console
 
-console = Console()
+# Command name -> "module:attribute". Command modules import the analyzer,
+# validator and rich, so they are only loaded when their command runs or
+# its help is shown.
+LAZY_COMMANDS = {
+    "scan": "tfkit.commands.scan:scan",
+    "validate": "tfkit.commands.validate:validate",
+    "export": "tfkit.commands.export:export",
+    "examples": "tfkit.commands.examples:examples",
+}
 
 
 def print_welcome():
@@ -31,20 +39,60 @@ def show_version_info():
     print("https://github.com/ivasik-k7/tfkit/releases")
 
 
+class LazyGroup(click.Group):
+    """
+    Click group that imports each command's module on first lookup.
+
+    Args:
+        lazy_commands: Command name to ``"module:attribute"`` of the command
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 # ============================================================================
 # MAIN CLI GROUP
 # ============================================================================
 
 
 @click.group(
+    cls=LazyGroup,
+    lazy_commands=LAZY_COMMANDS,
     invoke_without_command=True,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 @click.option("--version", "-v", is_flag=True, help="Show version and exit")
 @click.option("--welcome", "-w", is_flag=True, help="Show welcome message")
 @click.option("--debug", is_flag=True, help="Enable debug output")
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Time each phase and print a summary (tracing memory slows the run)",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False),
+    help="Write the profile as JSON (implies --profile)",
+)
+@click.option(
+    "--cprofile",
+    type=click.Path(dir_okay=False),
+    help="Also write cProfile stats to a .prof file (implies --profile)",
+)
 @click.pass_context
-def cli(ctx, version, welcome, debug):
+def cli(ctx, version, welcome, debug, profile, profile_output, cprofile):
     """tfkit - Terraform analysis tool
 
     Analyze, validate, and export Terraform configurations.
@@ -52,6 +100,9 @@ def cli(ctx, version, welcome, debug):
     ctx.ensure_object(dict)
     ctx.obj["DEBUG"] = debug
 
+    if (profile or profile_output or cprofile) and ctx.invoked_subcommand:
+        _start_profiling(ctx, profile_output, cprofile)
+
     if version:
         show_version_info()
         ctx.exit()
@@ -62,27 +113,41 @@ def cli(ctx, version, welcome, debug):
             ctx.exit()
 
 
-# ============================================================================
-# REGISTER COMMANDS
-# ============================================================================
+def _start_profiling(ctx, profile_output, cprofile):
+    """Profile the subcommand; the report is written when the context closes."""
+    from tfkit.core.profiling import Profiler
+
+    profiler = Profiler(trace_memory=True)
+    ctx.obj["PROFILER"] = profiler
 
+    stats_profiler = None
+    if cprofile:
+        import cProfile
 
-def _register_commands():
-    """Register all CLI commands. Called after cli group is defined."""
-    # Use absolute imports from tfkit.commands (not relative)
-    from tfkit.commands.examples import examples
-    from tfkit.commands.export import export
-    from tfkit.commands.scan import scan
-    from tfkit.commands.validate import validate
+        stats_profiler = cProfile.Profile()
 
-    cli.add_command(scan)
-    cli.add_command(validate)
-    cli.add_command(export)
-    cli.add_command(examples)
+    def finish():
+        if stats_profiler is not None:
+            stats_profiler.disable()
+        profiler.stop()
 
+        from tfkit.commands.utils import display_profile, err_console
 
-# Register commands immediately
-_register_commands()
+        display_profile(profiler)
+        if profile_output:
+            import json
+
+            with open(profile_output, "w", encoding="utf-8") as f:
+                json.dump(profiler.to_dict(), f, indent=2)
+            err_console.print(f"[dim]Profile written to {profile_output}[/dim]")
+        if stats_profiler is not None:
+            stats_profiler.dump_stats(cprofile)
+            err_console.print(f"[dim]cProfile stats written to {cprofile}[/dim]")
+
+    ctx.call_on_close(finish)
+    profiler.start()
+    if stats_profiler is not None:
+        stats_profiler.enable()
 
 
 # ============================================================================
@@ -95,9 +160,13 @@ def main():
     try:
         cli(obj={})
     except KeyboardInterrupt:
+        from tfkit.commands.utils import console
+
         console.print("\n\n[yellow]⚠[/yellow]  Operation cancelled by user")
         sys.exit(130)
     except Exception as e:
+        from tfkit.commands.utils import console
+
         console.print(f"\n[red]✗ Unexpected error:[/red] {e}")
         console.print("\n[dim]Run with --debug for detailed traceback[/dim]")
         sys.exit(1)
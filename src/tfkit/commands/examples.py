@@ -1,5 +1,4 @@
 import click
-from rich.panel import Panel
 
 from .utils import console, print_banner
 
@@ -13,6 +12,8 @@ def examples():
     multi-environment setups, and exporting data for CI/CD pipelines.
     Includes advanced usage scenarios and integration patterns.
     """
+    from rich.panel import Panel
+
     print_banner()
 
     examples_content = """
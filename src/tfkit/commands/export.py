@@ -1,14 +1,41 @@
 import csv
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
 import click
 
-from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+from tfkit.core.cache import DEFAULT_CACHE_DIR
+
+from .utils import (
+    console,
+    display_peak_rss,
+    export_yaml_file,
+    get_parse_cache,
+    get_profiler,
+    print_banner,
+)
+
+# Raw object attributes each format writes, for --low-memory; None means
+# every attribute
+FORMAT_ATTRIBUTES = {
+    "json": None,
+    "yaml": None,
+    "toml": None,
+    "csv": (),
+    "xml": (),
+}
 
-from .utils import console, export_yaml_file, print_banner
+
+def required_attributes(formats):
+    """Attribute names the given formats write, or None for all of them."""
+    names = set()
+    for fmt in formats:
+        declared = FORMAT_ATTRIBUTES[fmt]
+        if declared is None:
+            return None
+        names.update(declared)
+    return names
 
 
 @click.command()
@@ -33,7 +60,48 @@ from .utils import console, export_yaml_file, print_banner
 @click.option("--include", multiple=True, help="Include specific components")
 @click.option("--exclude", multiple=True, help="Exclude specific components")
 @click.option("--compress", "-c", is_flag=True, help="Compress output files")
-def export(path, formats, output_dir, prefix, split_by, include, exclude, compress):
+@click.option("--compact", is_flag=True, help="Write JSON output without indentation")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Parse files in N worker processes (0 = one per CPU, default: 1)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_CACHE_DIR,
+    show_default=True,
+    help="Directory for the persistent parse cache",
+)
+@click.option("--no-cache", is_flag=True, help="Disable the persistent parse cache")
+@click.option(
+    "--from-snapshot",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Export a project snapshot (.tfks) instead of analyzing PATH",
+)
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    help="Release file contents and unexported attributes early; prints peak RSS",
+)
+def export(
+    path,
+    formats,
+    output_dir,
+    prefix,
+    split_by,
+    include,
+    exclude,
+    compress,
+    compact,
+    jobs,
+    cache_dir,
+    no_cache,
+    from_snapshot,
+    low_memory,
+):
     """Export analysis data in multiple formats.
 
     Export Terraform analysis data in various structured formats
@@ -63,7 +131,26 @@ def export(path, formats, output_dir, prefix, split_by, include, exclude, compre
 
       # Custom prefix
       tfkit export -f json --prefix infrastructure
+
+      # JSON without indentation
+      tfkit export -f json --compact
+
+      # Parse with one worker process per CPU
+      tfkit export -f json --jobs 0
+
+      # Export the project saved by `tfkit scan --snapshot`
+      tfkit export -f json --from-snapshot out.tfks
+
+      # Resource inventory of a large tree
+      tfkit export -f csv --low-memory
+
+    With --low-memory, objects keep only the raw attributes the chosen
+    formats write: none for CSV and XML, all of them for JSON, YAML and
+    TOML.
     """
+    from tfkit.analyzer.project import TerraformProject
+    from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
     if not formats:
         formats = ("json",)
 
@@ -74,9 +161,21 @@ def export(path, formats, output_dir, prefix, split_by, include, exclude, compre
         console.print(f"   Split by: [yellow]{split_by}[/yellow]")
     console.print()
 
+    profiler = get_profiler()
     try:
-        analyzer = TerraformAnalyzer()
-        project = analyzer.analyze_project(path)
+        if from_snapshot:
+            with profiler.phase("load snapshot") as phase:
+                project = TerraformProject.load_snapshot(from_snapshot)
+                phase.count("objects", len(project.all_objects))
+        else:
+            analyzer = TerraformAnalyzer(
+                workers=jobs,
+                cache=get_parse_cache(no_cache, cache_dir),
+                profiler=profiler,
+                low_memory=low_memory,
+                keep_attributes=required_attributes(formats),
+            )
+            project = analyzer.analyze_project(path)
 
         output_dir = output_dir or Path(".")
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -84,12 +183,17 @@ def export(path, formats, output_dir, prefix, split_by, include, exclude, compre
         exported_files = []
 
         for fmt in formats:
-            if split_by:
-                files = _export_split(project, fmt, output_dir, prefix, split_by)
-                exported_files.extend(files)
-            else:
-                file = _export_single(project, fmt, output_dir, prefix)
-                exported_files.append(file)
+            with profiler.phase(f"export {fmt}") as phase:
+                if split_by:
+                    files = _export_split(
+                        project, fmt, output_dir, prefix, split_by, compact
+                    )
+                    exported_files.extend(files)
+                    phase.count("files", len(files))
+                else:
+                    file = _export_single(project, fmt, output_dir, prefix, compact)
+                    exported_files.append(file)
+                    phase.count("files")
 
             console.print(f"   ✓ Exported as {fmt.upper()}")
 
@@ -100,7 +204,9 @@ def export(path, formats, output_dir, prefix, split_by, include, exclude, compre
             zip_path = (
                 output_dir / f"{prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.zip"
             )
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            with profiler.phase("compress"), zipfile.ZipFile(
+                zip_path, "w", zipfile.ZIP_DEFLATED
+            ) as zipf:
                 for file in exported_files:
                     zipf.write(file, file.name)
                     file.unlink()
@@ -110,19 +216,22 @@ def export(path, formats, output_dir, prefix, split_by, include, exclude, compre
             for file in exported_files:
                 console.print(f"   • [green]{file}[/green]")
 
+        if low_memory:
+            display_peak_rss()
+
     except Exception as e:
         console.print(f"\n[red]✗ Export failed:[/red] {e}")
         sys.exit(1)
 
 
-def _export_single(project, format, output_dir, prefix):
+def _export_single(project, format, output_dir, prefix, compact=False):
     """Export project data in single format."""
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     filepath = output_dir / f"{prefix}-{timestamp}.{format}"
 
     if format == "json":
         with filepath.open("w") as f:
-            json.dump(project.to_dict(), f, indent=2, default=str)
+            project.write_json(f, indent=None if compact else 2)
     elif format == "yaml":
         export_yaml_file(project.to_dict(), filepath)
     elif format == "csv":
@@ -135,10 +244,10 @@ def _export_single(project, format, output_dir, prefix):
     return filepath
 
 
-def _export_split(project, format, output_dir, prefix, split_by):
+def _export_split(project, format, output_dir, prefix, split_by, compact=False):
     """Export project data split by category."""
     files = []
-    files.append(_export_single(project, format, output_dir, f"{prefix}-all"))
+    files.append(_export_single(project, format, output_dir, f"{prefix}-all", compact))
     return files
 
 
@@ -176,7 +285,7 @@ def _export_xml(project, filepath):
     except Exception as e:
         console.print(f"[yellow]⚠[/yellow] XML export error: {e}")
         with filepath.open("w") as f:
-            json.dump(project.to_dict(), f, indent=2, default=str)
+            project.write_json(f)
 
 
 def _export_toml(project, filepath):
@@ -192,4 +301,4 @@ def _export_toml(project, filepath):
             "[yellow]⚠[/yellow] TOML export requires 'toml' package. Falling back to JSON."
         )
         with filepath.open("w") as f:
-            json.dump(project.to_dict(), f, indent=2, default=str)
+            project.write_json(f)
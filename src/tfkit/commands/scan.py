@@ -1,24 +1,21 @@
+import glob
 import json
 import sys
 from pathlib import Path
 
 import click
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
 
-from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
-from tfkit.visualizer.generator import ReportGenerator
+from tfkit.core.cache import DEFAULT_CACHE_DIR
 
 from .utils import (
     console,
+    display_peak_rss,
     display_scan_results,
     display_simple_results,
+    display_workspace_results,
     export_yaml,
+    get_parse_cache,
+    get_profiler,
     get_scan_data,
     print_banner,
 )
@@ -67,7 +64,71 @@ from .utils import (
     default="graph",
     help="Visualization layout (default: graph)",
 )
-def scan(path, output, format, open, quiet, save, theme, layout):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Parse files in N worker processes (0 = one per CPU, default: 1)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_CACHE_DIR,
+    show_default=True,
+    help="Directory for the persistent parse cache",
+)
+@click.option("--no-cache", is_flag=True, help="Disable the persistent parse cache")
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Write --save output without indentation",
+)
+@click.option(
+    "--snapshot",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Save the analyzed project as a binary snapshot (.tfks)",
+)
+@click.option(
+    "--from-snapshot",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Load the project from a snapshot instead of analyzing it",
+)
+@click.option(
+    "--roots",
+    "root_patterns",
+    multiple=True,
+    help="Scan every root module matching a glob pattern (repeatable)",
+)
+@click.option(
+    "--roots-from",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Scan the root modules listed in a file, one path per line",
+)
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    help="Release file contents and raw attributes early; prints peak RSS",
+)
+def scan(
+    path,
+    output,
+    format,
+    open,
+    quiet,
+    save,
+    theme,
+    layout,
+    jobs,
+    cache_dir,
+    no_cache,
+    compact,
+    snapshot,
+    from_snapshot,
+    root_patterns,
+    roots_from,
+    low_memory,
+):
     """Quick scan of Terraform project for rapid insights.
 
     Performs a fast scan of your Terraform project and displays
@@ -80,34 +141,98 @@ def scan(path, output, format, open, quiet, save, theme, layout):
       tfkit scan --format json            # Output as JSON
       tfkit scan --open                   # Scan and open visualization
       tfkit scan --save scan.json         # Save results
+      tfkit scan --save scan.json --compact  # Save without indentation
+      tfkit scan --jobs 8                 # Parse with 8 worker processes
+      tfkit scan --no-cache               # Re-parse every file
+      tfkit scan --snapshot out.tfks      # Save a snapshot for later steps
+      tfkit scan --from-snapshot out.tfks # Reuse a snapshot's analysis
+      tfkit scan --roots 'envs/*'         # Scan many root modules at once
+      tfkit scan --roots-from roots.txt   # Scan the roots listed in a file
+      tfkit scan --low-memory             # Inventory scan of a large tree
+
+    With --roots or --roots-from, every root is analyzed in one run and
+    files shared between roots are parsed once. Relative roots and
+    patterns are resolved against PATH. The output covers all roots
+    together, followed by one entry per root.
+
+    A snapshot is only loaded if it was written by this tfkit version
+    and the project's files are unchanged; otherwise the scan fails.
+
+    --low-memory keeps only what the scan reports: file contents are
+    released as soon as their objects are built and raw attributes are
+    dropped after the analysis, unless --save or --snapshot will write
+    them.
 
     PATH: Path to Terraform project (default: current directory)
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
+    from tfkit.analyzer.project import TerraformProject
+    from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+    from tfkit.visualizer.generator import ReportGenerator
+
     if not quiet:
         print_banner(show_version=False)
+
+    if root_patterns or roots_from:
+        if open or snapshot or from_snapshot:
+            raise click.UsageError(
+                "--open, --snapshot and --from-snapshot support a single project only"
+            )
+        roots = collect_roots(path, root_patterns, roots_from)
+        if not roots:
+            console.print("[red]✗ No root modules matched[/red]")
+            sys.exit(1)
+        scan_roots(
+            roots, format, quiet, save, compact, jobs, cache_dir, no_cache, low_memory
+        )
+        return
+
+    profiler = get_profiler()
     try:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=console,
+            console=console.instance,
             transient=True,
         ) as progress:
-            task = progress.add_task("Scanning Terraform files...", total=100)
+            task = progress.add_task("Scanning Terraform files...", total=None)
+
+            def report_progress(description, completed, total):
+                if total:
+                    progress.update(
+                        task, description=description, completed=completed, total=total
+                    )
+                else:
+                    progress.update(task, description=description)
 
-            analyzer = TerraformAnalyzer()
-            progress.update(task, advance=30, description="Parsing configurations...")
-            project = analyzer.analyze_project(path)
-            progress.update(task, advance=40, description="Building resource map...")
-            progress.update(task, advance=30, description="Finalizing analysis...")
+            if from_snapshot:
+                report_progress("Loading snapshot...", 0, 0)
+                with profiler.phase("load snapshot") as phase:
+                    project = TerraformProject.load_snapshot(from_snapshot)
+                    phase.count("objects", len(project.all_objects))
+            else:
+                analyzer = TerraformAnalyzer(
+                    workers=jobs,
+                    cache=get_parse_cache(no_cache, cache_dir),
+                    profiler=profiler,
+                    progress=report_progress,
+                    low_memory=low_memory,
+                    keep_attributes=None if save or snapshot else (),
+                )
+                project = analyzer.analyze_project(path)
 
-        if hasattr(project, "to_dict"):
-            project_data = project.to_dict()
-        elif hasattr(project, "__dict__"):
-            project_data = project.__dict__
-        else:
-            project_data = project
+        with profiler.phase("serialize"):
+            # The summaries only read the statistics; --save streams the objects
+            project_data = {"statistics": project.compute_statistics().to_dict()}
 
         if format == "table":
             display_scan_results(project_data, quiet)
@@ -119,13 +244,19 @@ def scan(path, output, format, open, quiet, save, theme, layout):
             display_simple_results(project_data)
 
         if save:
-            with save.open("w") as f:
-                json.dump(project.to_dict(), f, indent=2, default=str)
+            with profiler.phase("save"), save.open("w") as f:
+                project.write_json(f, indent=None if compact else 2)
             if not quiet:
                 console.print(f"\n✓ Results saved to: [green]{save}[/green]")
 
+        if snapshot:
+            with profiler.phase("write snapshot"):
+                project.write_snapshot(snapshot)
+            if not quiet:
+                console.print(f"\n✓ Snapshot saved to: [green]{snapshot}[/green]")
+
         if open:
-            generator = ReportGenerator()
+            generator = ReportGenerator(profiler=profiler)
             html_file = generator.generate_analysis_report(
                 project,
                 output,
@@ -139,6 +270,82 @@ def scan(path, output, format, open, quiet, save, theme, layout):
                     f"\n🌐 Opened {layout} visualization: [green]{html_file}[/green]"
                 )
 
+        if low_memory:
+            display_peak_rss()
+
     except Exception as e:
         console.print(f"\n[red]✗ Scan failed:[/red] {e}")
         sys.exit(1)
+
+
+def collect_roots(base, patterns, roots_file):
+    """Resolve root module directories from glob patterns and a roots file."""
+    roots = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(str(base / pattern), recursive=True))
+        roots.extend(Path(match) for match in matches if Path(match).is_dir())
+
+    if roots_file:
+        for line in roots_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                roots.append(base / line)
+
+    return roots
+
+
+def scan_roots(
+    roots, format, quiet, save, compact, jobs, cache_dir, no_cache, low_memory=False
+):
+    """Scan several root modules in one run and report them together."""
+    from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+    profiler = get_profiler()
+    try:
+        with console.status(f"Scanning {len(roots)} root modules...", spinner="dots"):
+            analyzer = TerraformAnalyzer(
+                workers=jobs,
+                cache=get_parse_cache(no_cache, cache_dir),
+                profiler=profiler,
+                low_memory=low_memory,
+                keep_attributes=None if save else (),
+            )
+            workspace = analyzer.analyze_many(roots)
+
+        with profiler.phase("serialize"):
+            # The summaries only read the statistics; --save streams the objects
+            workspace_data = workspace.to_dict(statistics_only=True)
+        projects = workspace_data["projects"]
+
+        if format == "table":
+            display_scan_results(workspace_data, quiet)
+            display_workspace_results(workspace_data)
+        elif format in ("json", "yaml"):
+            scan_data = {
+                "workspace": get_scan_data(workspace_data),
+                "roots": {root: get_scan_data(data) for root, data in projects.items()},
+                "errors": workspace_data["errors"],
+            }
+            if format == "json":
+                console.print(json.dumps(scan_data, indent=2))
+            else:
+                export_yaml(scan_data)
+        else:  # simple format
+            display_simple_results(workspace_data)
+            display_workspace_results(workspace_data)
+
+        if save:
+            with profiler.phase("save"), save.open("w") as f:
+                workspace.write_json(f, indent=None if compact else 2)
+            if not quiet:
+                console.print(f"\n✓ Results saved to: [green]{save}[/green]")
+
+        if low_memory:
+            display_peak_rss()
+
+    except Exception as e:
+        console.print(f"\n[red]✗ Scan failed:[/red] {e}")
+        sys.exit(1)
+
+    if workspace.errors:
+        sys.exit(1)
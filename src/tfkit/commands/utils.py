@@ -1,9 +1,38 @@
 import json
 
-from rich.console import Console
-from rich.table import Table
+import click
 
-console = Console()
+from tfkit.core.cache import ParseCache
+from tfkit.core.profiling import Profiler, peak_rss
+
+
+class LazyConsole:
+    """
+    A rich ``Console`` that is created on first use.
+
+    Keeps rich out of the import of the command modules, so that
+    ``tfkit --help`` and ``tfkit <command> --help`` start quickly.
+    """
+
+    def __init__(self, **options):
+        self._options = options
+        self._console = None
+
+    @property
+    def instance(self):
+        """The underlying Console, for rich objects that take one."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._options)
+        return self._console
+
+    def __getattr__(self, name):
+        return getattr(self.instance, name)
+
+
+console = LazyConsole()
+err_console = LazyConsole(stderr=True)
 
 
 def print_banner(show_version: bool = True):
@@ -19,6 +48,21 @@ def print_banner(show_version: bool = True):
     console.print(f"[bold blue]{TFKIT_BANNER}[/bold blue]", highlight=False)
 
 
+def get_parse_cache(no_cache, cache_dir):
+    """Build the parse cache for a command, or None when disabled."""
+    if no_cache:
+        return None
+    return ParseCache(cache_dir)
+
+
+def get_profiler():
+    """Return the --profile profiler, or a disabled one when not profiling."""
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.find_root().obj if ctx is not None else None
+    profiler = obj.get("PROFILER") if isinstance(obj, dict) else None
+    return profiler or Profiler(enabled=False)
+
+
 def get_scan_data(data):
     """Extract scan data for JSON/YAML output."""
     if isinstance(data, dict) and "statistics" in data:
@@ -83,6 +127,8 @@ def export_yaml_file(data, filepath):
 
 def display_scan_results(data, quiet=False):
     """Display scan results in table format."""
+    from rich.table import Table
+
     if isinstance(data, dict) and "statistics" in data:
         stats = data["statistics"]
     else:
@@ -247,6 +293,40 @@ def display_scan_results(data, quiet=False):
         console.print(state_table)
 
 
+def display_workspace_results(data):
+    """Display one row per root of a multi-root scan, then any failures."""
+    from rich.table import Table
+
+    metadata = data.get("metadata", {})
+    console.print(
+        f"\n[bold cyan]📁 ROOT MODULES[/bold cyan] "
+        f"({metadata.get('analyzed', 0)} analyzed, {metadata.get('failed', 0)} failed)"
+    )
+
+    roots_table = Table(show_header=True, header_style="bold magenta")
+    roots_table.add_column("Root", style="cyan")
+    roots_table.add_column("Files", style="white", justify="right")
+    roots_table.add_column("Objects", style="white", justify="right")
+    roots_table.add_column("Resources", style="white", justify="right")
+    roots_table.add_column("Health", style="green", justify="right")
+
+    for root, project in data.get("projects", {}).items():
+        stats = project.get("statistics", {})
+        counts = stats.get("counts", {})
+        roots_table.add_row(
+            root,
+            str(project.get("metadata", {}).get("total_files", 0)),
+            str(counts.get("total", 0)),
+            str(counts.get("resources", 0)),
+            f"{stats.get('health', {}).get('score', 0):.1f}%",
+        )
+
+    console.print(roots_table)
+
+    for root, error in data.get("errors", {}).items():
+        console.print(f"[red]✗ {root}:[/red] {error}")
+
+
 def display_simple_results(data):
     """Display minimal scan results."""
     if isinstance(data, dict) and "statistics" in data:
@@ -279,3 +359,56 @@ def display_simple_results(data):
         console.print(
             f"❌ Incomplete: {health_data.get('incomplete_count', 0)} objects"
         )
+
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def display_peak_rss():
+    """Print the process's peak resident set size on stderr, where known."""
+    peak = peak_rss()
+    if peak is not None:
+        err_console.print(f"[dim]Peak memory (RSS): {_format_bytes(peak)}[/dim]")
+
+
+def display_profile(profiler):
+    """Display the --profile summary on stderr, one row per phase."""
+    from rich.table import Table
+
+    table = Table(title="⏱  Profile", show_header=True, header_style="bold magenta")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Calls", style="white", justify="right")
+    table.add_column("Wall (s)", style="white", justify="right")
+    table.add_column("CPU (s)", style="white", justify="right")
+    table.add_column("Peak memory", style="white", justify="right")
+    table.add_column("Counts", style="dim")
+
+    def memory(value):
+        return _format_bytes(value) if value is not None else "-"
+
+    for record in profiler.records:
+        table.add_row(
+            "  " * record.depth + record.name,
+            str(record.calls),
+            f"{record.wall_time:.3f}",
+            f"{record.cpu_time:.3f}",
+            memory(record.peak_memory),
+            ", ".join(f"{name}={value}" for name, value in record.counts.items()),
+        )
+
+    table.add_section()
+    table.add_row(
+        "total",
+        "",
+        f"{profiler.wall_time:.3f}",
+        f"{profiler.cpu_time:.3f}",
+        memory(profiler.peak_memory),
+        "",
+        style="bold",
+    )
+    err_console.print(table)
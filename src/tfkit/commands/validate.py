@@ -4,17 +4,16 @@ from datetime import datetime
 from pathlib import Path
 
 import click
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from tfkit.inspector.parser import TerraformParser
-from tfkit.inspector.resolver import ReferenceResolver
-from tfkit.validator.models import ValidationCategory, ValidationSeverity
-from tfkit.validator.rule_register import rule_registry
-from tfkit.validator.validator import TerraformValidator, ValidatorConfig
+from tfkit.core.cache import DEFAULT_CACHE_DIR
 
-from .utils import console, print_banner
+from .utils import (
+    console,
+    display_peak_rss,
+    get_parse_cache,
+    get_profiler,
+    print_banner,
+)
 
 
 @click.command()
@@ -101,6 +100,19 @@ from .utils import console, print_banner
     multiple=True,
     help="Set Terraform variable values for reference resolution (format: key=value)",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_CACHE_DIR,
+    show_default=True,
+    help="Directory for the persistent parse cache",
+)
+@click.option("--no-cache", is_flag=True, help="Disable the persistent parse cache")
+@click.option(
+    "--low-memory",
+    is_flag=True,
+    help="Release each file's contents once it is parsed; prints peak RSS",
+)
 def validate(
     path,
     checks,
@@ -121,6 +133,9 @@ def validate(
     resolve_references,
     terraform_vars,
     var,
+    cache_dir,
+    no_cache,
+    low_memory,
 ):
     """Validate Terraform configurations.
 
@@ -176,7 +191,13 @@ def validate(
 
       # Ignore specific rules
       tfkit validate --checks all --ignore TF020 --ignore TF021
+
+      # Keep memory down on a large tree
+      tfkit validate --low-memory
     """
+    from tfkit.validator.rule_register import rule_registry
+    from tfkit.validator.validator import TerraformValidator, ValidatorConfig
+
     print_banner(show_version=False)
 
     # Initialize validator configuration
@@ -190,7 +211,8 @@ def validate(
         rules_package=rules_package,
     )
 
-    validator = TerraformValidator(config)
+    profiler = get_profiler()
+    validator = TerraformValidator(config, profiler=profiler)
 
     if not quiet:
         with console.status("[bold cyan]Loading validation rules..."):
@@ -253,12 +275,20 @@ def validate(
             console.print(f"     • {category.value} ({rules_count} rules)")
         console.print()
 
+    cache = get_parse_cache(no_cache, cache_dir)
+
     try:
         if not quiet:
             with console.status("[bold cyan]Analyzing Terraform project..."):
                 # Use the new parser and resolver
                 project = _analyze_terraform_project(
-                    path, resolve_references, terraform_vars, var
+                    path,
+                    resolve_references,
+                    terraform_vars,
+                    var,
+                    cache,
+                    profiler,
+                    low_memory,
                 )
 
             console.print(
@@ -269,7 +299,13 @@ def validate(
             console.print()
         else:
             project = _analyze_terraform_project(
-                path, resolve_references, terraform_vars, var
+                path,
+                resolve_references,
+                terraform_vars,
+                var,
+                cache,
+                profiler,
+                low_memory,
             )
 
         if not quiet:
@@ -325,6 +361,9 @@ def validate(
             else:
                 console.print("[bold red]✗ Validation failed[/bold red]")
 
+        if low_memory:
+            display_peak_rss()
+
         sys.exit(exit_code)
 
     except ImportError as e:
@@ -344,18 +383,29 @@ def validate(
 
 
 def _analyze_terraform_project(
-    path, resolve_references=False, terraform_vars=None, var_args=None
+    path,
+    resolve_references=False,
+    terraform_vars=None,
+    var_args=None,
+    cache=None,
+    profiler=None,
+    low_memory=False,
 ):
     """Analyze Terraform project using the new parser and resolver."""
-    parser = TerraformParser()
+    from tfkit.inspector.parser import TerraformParser
+    from tfkit.inspector.resolver import ReferenceResolver
+
+    profiler = profiler or get_profiler()
+    parser = TerraformParser(cache=cache, low_memory=low_memory)
 
     # if not quiet:
     #     console.print("   [dim]Parsing Terraform files...[/dim]")
 
-    module = parser.parse_module(str(path))
+    with profiler.phase("parse module"):
+        module = parser.parse_module(str(path))
 
-    # Convert to dictionary for compatibility with existing validator
-    project_dict = module.to_dict()
+        # Convert to dictionary for compatibility with existing validator
+        project_dict = module.to_dict()
 
     # Add enhanced metadata if reference resolution is enabled
     if resolve_references:
@@ -400,9 +450,12 @@ def _analyze_terraform_project(
         # Resolve references
         resolver = ReferenceResolver(module, terraform_variables)
         try:
-            resolved_module = resolver.resolve_module()
-            # Add resolved values to project dict
-            project_dict["resolved_values"] = _extract_resolved_values(resolved_module)
+            with profiler.phase("resolve references"):
+                resolved_module = resolver.resolve_module()
+                # Add resolved values to project dict
+                project_dict["resolved_values"] = _extract_resolved_values(
+                    resolved_module
+                )
         except Exception as e:
             console.print(
                 f"   [yellow]Warning: Reference resolution failed: {e}[/yellow]"
@@ -443,6 +496,8 @@ def _extract_resolved_values(module):
 
 def _resolve_check_categories(checks):
     """Determine which check categories to run based on the checks list."""
+    from tfkit.validator.models import ValidationCategory
+
     if "all" in checks:
         return set(ValidationCategory)
 
@@ -467,6 +522,8 @@ def _resolve_check_categories(checks):
 
 def _display_loaded_rules_summary(validator):
     """Display a summary of loaded rules."""
+    from rich.table import Table
+
     console.print("\n[bold cyan]Loaded Rules Summary[/bold cyan]\n")
 
     stats = validator.get_stats()
@@ -550,6 +607,12 @@ def _display_validation_results(result, format, base_path=None, stats=None):
 
 def _display_validation_results_table(result, stats=None):
     """Display validation results in table format."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    from tfkit.validator.models import ValidationSeverity
+
     summary = result.get_summary()
 
     summary_text = Text()
@@ -728,6 +791,8 @@ def _format_validation_results_json(result, stats=None):
 
 def _format_validation_results_sarif(result, base_path):
     """Format validation results as SARIF for file output."""
+    from tfkit.validator.models import ValidationSeverity
+
     sarif_output = {
         "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
         "version": "2.1.0",
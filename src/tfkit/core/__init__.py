@@ -0,0 +1 @@
+"""Shared building blocks used by the analyzer and the inspector."""
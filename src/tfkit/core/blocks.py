@@ -0,0 +1,111 @@
+"""
+Block header index for Terraform source files.
+
+A single pass over a file's lines records where every top-level block
+starts and ends, so looking up the location of a block is a dictionary
+access instead of a scan of the file.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# block_type "label" label {
+_HEADER_RE = re.compile(
+    r'^\s*([A-Za-z_][\w-]*)((?:\s+(?:"[^"]*"|[A-Za-z_][\w-]*))*)\s*\{'
+)
+_LABEL_RE = re.compile(r'"([^"]*)"|([A-Za-z_][\w-]*)')
+
+# name = value (but not name == value)
+_ATTRIBUTE_RE = re.compile(r"^\s*([A-Za-z_][\w-]*)\s*=(?!=)")
+
+BlockKey = Tuple[str, ...]
+BlockSpan = Tuple[int, int]
+
+
+class BlockIndex:
+    """
+    Index of the top-level blocks of one file.
+
+    Blocks are keyed by ``(block_type, *labels)`` and map to the 1-based
+    ``(start_line, end_line)`` of every occurrence, in file order. End lines
+    come from brace counting. Attributes of top-level ``locals`` blocks are
+    indexed as well.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[BlockKey, List[BlockSpan]] = {}
+        self._ends: Dict[int, int] = {}
+        self._locals: Dict[str, int] = {}
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str]) -> "BlockIndex":
+        """Build the index in one pass over a file's lines."""
+        index = cls()
+
+        depth = 0
+        open_key: Optional[BlockKey] = None
+        open_start = 0
+
+        for line_num, line in enumerate(lines, 1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith(("#", "//")):
+                continue
+
+            if depth == 0:
+                match = _HEADER_RE.match(line)
+                if match:
+                    labels = tuple(
+                        quoted or bare
+                        for quoted, bare in _LABEL_RE.findall(match.group(2))
+                    )
+                    open_key = (match.group(1),) + labels
+                    open_start = line_num
+            elif depth == 1 and open_key == ("locals",):
+                match = _ATTRIBUTE_RE.match(line)
+                if match:
+                    index._locals.setdefault(match.group(1), line_num)
+
+            depth += line.count("{") - line.count("}")
+
+            if depth <= 0:
+                depth = 0
+                if open_key is not None:
+                    index._add(open_key, open_start, line_num)
+                    open_key = None
+
+        # Unterminated block: it runs to the end of the file
+        if open_key is not None:
+            index._add(open_key, open_start, len(lines))
+
+        return index
+
+    def _add(self, key: BlockKey, start: int, end: int) -> None:
+        self._blocks.setdefault(key, []).append((start, end))
+        self._ends[start] = end
+
+    def find(
+        self, block_type: str, *labels: str, occurrence: int = 0
+    ) -> Optional[BlockSpan]:
+        """
+        Find a block by type and labels.
+
+        Args:
+            block_type: Block keyword such as ``resource`` or ``locals``
+            labels: Block labels, e.g. the resource type and name
+            occurrence: Which occurrence to return when the block repeats
+
+        Returns:
+            ``(start_line, end_line)`` or None if the block is not in the file
+        """
+        spans = self._blocks.get((block_type,) + labels)
+        if spans is None or occurrence >= len(spans):
+            return None
+        return spans[occurrence]
+
+    def end_of(self, start_line: int) -> Optional[int]:
+        """Return the end line of the block starting at ``start_line``."""
+        return self._ends.get(start_line)
+
+    def find_local(self, name: str) -> Optional[int]:
+        """Return the line where a local value is assigned."""
+        return self._locals.get(name)
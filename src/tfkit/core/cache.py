@@ -0,0 +1,228 @@
+"""
+Persistent parse cache shared by the analyzer and the inspector.
+
+Parsed HCL documents are stored as JSON files keyed by a hash of the file
+content, the python-hcl2 version and the tfkit version, so a change to any
+of them produces a fresh entry instead of a stale hit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+DEFAULT_CACHE_DIR = ".tfkit-cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _package_version(distribution: str) -> str:
+    """Return an installed distribution version, or 'unknown'."""
+    from importlib import metadata
+
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class ParseCache:
+    """
+    Size-bounded on-disk cache of parsed Terraform files.
+
+    Entries live under ``<cache_dir>/parse/``. Every hit refreshes the
+    entry's modification time, and when the cache grows beyond
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    # Eviction trims the cache to this fraction of max_bytes so that a
+    # full cache is not pruned again on the very next write
+    LOW_WATER_MARK = 0.9
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        from tfkit import __version__
+
+        self.root = Path(cache_dir) / "parse"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        salt = f"tfkit={__version__};python-hcl2={_package_version('python-hcl2')};"
+        self._salt = salt.encode("utf-8")
+        self._size: Optional[int] = None
+
+    def key_for(self, content: Union[str, bytes]) -> str:
+        """Compute the cache key for a file's content."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.sha256(self._salt + content).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse result for a key, or None on a miss."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, encoding="utf-8") as f:
+                parsed = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            # Corrupt or unreadable entry: drop it and treat as a miss
+            self._remove(entry)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return parsed
+
+    def put(self, key: str, parsed: Dict[str, Any]) -> None:
+        """Store a parse result. Failures are ignored; the cache is best-effort."""
+        entry = self._entry_path(key)
+        try:
+            payload = json.dumps(parsed, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, entry)
+        except OSError:
+            return
+
+        if self._size is None:
+            self._size = self._total_size()
+        else:
+            self._size += len(payload)
+
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Evict least recently used entries until the cache fits its budget.
+
+        Returns:
+            Number of evicted entries
+        """
+        entries = self._list_entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            self._size = total
+            return 0
+
+        target = int(self.max_bytes * self.LOW_WATER_MARK)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+                evicted += 1
+
+        self._size = total
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for _, _, path in self._list_entries():
+            self._remove(path)
+        self._size = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key[2:]}.json"
+
+    def _list_entries(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every entry."""
+        entries = []
+        if not self.root.is_dir():
+            return entries
+
+        for bucket in os.scandir(self.root):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+
+        return entries
+
+    def _total_size(self) -> int:
+        return sum(size for _, size, _ in self._list_entries())
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+class MemoryParseCache:
+    """
+    In-process parse cache with the ``ParseCache`` interface.
+
+    Parse results are kept in memory by content hash, so files with the
+    same content are parsed once per process. Misses fall through to an
+    optional persistent ``backing`` cache, and new results are written to
+    it as well. Cached results are shared, not copied, and must be treated
+    as read-only.
+    """
+
+    def __init__(self, backing: Optional[ParseCache] = None):
+        self.backing = backing
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def key_for(self, content: Union[str, bytes]) -> str:
+        """Compute the cache key for a file's content."""
+        if self.backing is not None:
+            return self.backing.key_for(content)
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse result for a key, or None on a miss."""
+        parsed = self._entries.get(key)
+        if parsed is None and self.backing is not None:
+            parsed = self.backing.get(key)
+            if parsed is not None:
+                self._entries[key] = parsed
+        if parsed is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return parsed
+
+    def put(self, key: str, parsed: Dict[str, Any]) -> None:
+        """Store a parse result in memory and in the backing cache."""
+        self._entries[key] = parsed
+        if self.backing is not None:
+            self.backing.put(key, parsed)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries; the backing cache is left alone."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
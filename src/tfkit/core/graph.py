@@ -0,0 +1,206 @@
+"""
+Cycle detection for dependency graphs.
+
+Every dependency graph in tfkit finds its cycles through the strongly
+connected components computed here. The traversal is iterative, so deep
+reference chains do not run into Python's recursion limit, and it visits
+each node and edge once.
+"""
+
+from collections import deque
+from typing import Callable, Dict, Hashable, Iterable, List, TypeVar
+
+Node = TypeVar("Node", bound=Hashable)
+Successors = Callable[[Node], Iterable[Node]]
+
+
+def strongly_connected_components(
+    roots: Iterable[Node], successors: Successors
+) -> List[List[Node]]:
+    """
+    Find the strongly connected components reachable from ``roots``.
+
+    Uses Tarjan's algorithm with an explicit stack.
+
+    Args:
+        roots: Nodes to start from; every node reachable from them is visited
+        successors: Returns the nodes a node points to
+
+    Returns:
+        Components in reverse topological order (a component comes after
+        every component it points to). Nodes keep their discovery order.
+    """
+    index: Dict[Node, int] = {}
+    low: Dict[Node, int] = {}
+    stack: List[Node] = []
+    on_stack = set()
+    components: List[List[Node]] = []
+
+    for root in roots:
+        if root in index:
+            continue
+
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            node, edges = work[-1]
+            for succ in edges:
+                if succ not in index:
+                    index[succ] = low[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(successors(succ))))
+                    break
+                if succ in on_stack and index[succ] < low[node]:
+                    low[node] = index[succ]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+
+    return components
+
+
+def cyclic_components(
+    roots: Iterable[Node], successors: Successors
+) -> List[List[Node]]:
+    """
+    Find the strongly connected components that contain a cycle.
+
+    These are the components with more than one node, plus single nodes
+    that point to themselves.
+    """
+    return [
+        component
+        for component in strongly_connected_components(roots, successors)
+        if len(component) > 1 or component[0] in successors(component[0])
+    ]
+
+
+def _bfs_tree(
+    root: Node, neighbours: Successors, members: Iterable[Node]
+) -> Dict[Node, Node]:
+    """Breadth-first tree of ``members`` from ``root``, as child -> parent."""
+    parents: Dict[Node, Node] = {root: root}
+    queue = deque([root])
+
+    while queue:
+        node = queue.popleft()
+        for succ in neighbours(node):
+            if succ in members and succ not in parents:
+                parents[succ] = node
+                queue.append(succ)
+
+    return parents
+
+
+def _tree_path(parents: Dict[Node, Node], node: Node) -> List[Node]:
+    """Path from ``node`` up to the root of a tree built by ``_bfs_tree``."""
+    path = [node]
+    while parents[path[-1]] != path[-1]:
+        path.append(parents[path[-1]])
+    return path
+
+
+def _erase_loops(walk: List[Node]) -> List[Node]:
+    """
+    Turn a closed walk ``[v, ..., v]`` into a simple cycle through ``v``.
+
+    Whenever the walk comes back to a node it already passed, the detour in
+    between is dropped. ``v`` only occurs at both ends, so it is kept.
+    """
+    cycle: List[Node] = []
+    positions: Dict[Node, int] = {}
+
+    for node in walk[:-1]:
+        if node in positions:
+            for dropped in cycle[positions[node] + 1 :]:
+                del positions[dropped]
+            del cycle[positions[node] + 1 :]
+        else:
+            positions[node] = len(cycle)
+            cycle.append(node)
+
+    cycle.append(walk[-1])
+    return cycle
+
+
+def cycle_cover(
+    component: List[Node], successors: Successors
+) -> Dict[Node, List[Node]]:
+    """
+    Map every node of a cyclic component to a cycle that passes through it.
+
+    The component is spanned by two breadth-first trees rooted at its first
+    node: one along the edges and one against them. A node that is not
+    covered yet gets the cycle made of its tree path back to the root and
+    the root's tree path out to it, with any repeated nodes cut out. Each
+    cycle is shared by all the nodes on it that were not covered yet, so
+    the result depends only on the component, its order and its edges.
+
+    This takes time linear in the size of the component plus the length of
+    the cycles returned.
+    """
+    members = set(component)
+    root = component[0]
+
+    predecessors: Dict[Node, List[Node]] = {node: [] for node in component}
+    for node in component:
+        for succ in successors(node):
+            if succ in members:
+                predecessors[succ].append(node)
+
+    forward = _bfs_tree(root, successors, members)
+    backward = _bfs_tree(root, predecessors.__getitem__, members)
+    order = {node: position for position, node in enumerate(forward)}
+
+    cover: Dict[Node, List[Node]] = {}
+
+    for node in component:
+        if node in cover:
+            continue
+        if node == root:
+            # Close the cycle with the edge into the root nearest to it
+            last = min(predecessors[root], key=order.__getitem__)
+            cycle = _tree_path(forward, last)[::-1] + [root]
+        else:
+            walk = _tree_path(backward, node) + _tree_path(forward, node)[-2::-1]
+            cycle = _erase_loops(walk)
+        for member in cycle[:-1]:
+            cover.setdefault(member, cycle)
+
+    return cover
+
+
+def find_cycles(roots: Iterable[Node], successors: Successors) -> List[List[Node]]:
+    """
+    Find cycles covering every node that lies on a cycle.
+
+    Returns:
+        Closed paths ``[a, ..., a]``; every cyclic component contributes at
+        least one, in reverse topological order of the components
+    """
+    cycles = []
+    for component in cyclic_components(roots, successors):
+        seen = set()
+        for cycle in cycle_cover(component, successors).values():
+            if id(cycle) not in seen:
+                seen.add(id(cycle))
+                cycles.append(cycle)
+    return cycles
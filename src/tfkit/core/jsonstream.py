@@ -0,0 +1,86 @@
+"""
+Incremental JSON output.
+
+``JSONStreamWriter`` writes a document to a file piece by piece, so large
+reports can be produced one value at a time instead of being built as a
+single nested dict first. The text matches ``json.dump`` with the same
+``indent`` and ``default=str``; with ``indent=None`` it is written
+compactly, without whitespace.
+"""
+
+import json
+from typing import IO, Any, List, Optional
+
+
+class JSONStreamWriter:
+    """
+    Writes a JSON document as a sequence of objects, arrays and values.
+
+    Open containers with ``begin_object`` and ``begin_array`` and close
+    them with ``end``. Inside an object every value needs a key; inside an
+    array, and for the top-level value, it must be omitted.
+
+    Args:
+        fp: Text file to write to
+        indent: Spaces per nesting level, or None for compact output
+    """
+
+    def __init__(self, fp: IO[str], indent: Optional[int] = 2):
+        self.fp = fp
+        self.indent = indent
+        if indent is None:
+            self._item_separator, self._key_separator = ",", ":"
+        else:
+            self._item_separator, self._key_separator = ",", ": "
+        # One entry per open container: (closing bracket, has items)
+        self._open: List[List[Any]] = []
+
+    def begin_object(self, key: Optional[str] = None) -> None:
+        """Open an object, as the value of ``key`` inside an object."""
+        self._start_value(key)
+        self.fp.write("{")
+        self._open.append(["}", False])
+
+    def begin_array(self, key: Optional[str] = None) -> None:
+        """Open an array, as the value of ``key`` inside an object."""
+        self._start_value(key)
+        self.fp.write("[")
+        self._open.append(["]", False])
+
+    def end(self) -> None:
+        """Close the innermost open object or array."""
+        closing, has_items = self._open.pop()
+        if has_items:
+            self.fp.write(self._newline())
+        self.fp.write(closing)
+
+    def value(self, value: Any, key: Optional[str] = None) -> None:
+        """Write a complete value, as the value of ``key`` inside an object."""
+        self._start_value(key)
+        text = json.dumps(
+            value,
+            indent=self.indent,
+            separators=(self._item_separator, self._key_separator),
+            default=str,
+        )
+        if self.indent:
+            # JSON strings never contain raw newlines, so every newline is
+            # structural and takes the current nesting indentation
+            text = text.replace("\n", self._newline())
+        self.fp.write(text)
+
+    def _newline(self) -> str:
+        if self.indent is None:
+            return ""
+        return "\n" + " " * (self.indent * len(self._open))
+
+    def _start_value(self, key: Optional[str]) -> None:
+        if not self._open:
+            return
+        container = self._open[-1]
+        if container[1]:
+            self.fp.write(self._item_separator)
+        container[1] = True
+        self.fp.write(self._newline())
+        if key is not None:
+            self.fp.write(json.dumps(key) + self._key_separator)
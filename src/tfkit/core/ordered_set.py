@@ -0,0 +1,104 @@
+"""
+Insertion-ordered set.
+
+Dependency lists need both the order in which names were found and fast
+membership checks. ``OrderedSet`` keeps its items as the keys of a dict,
+which gives both, and offers the list methods the dependency code uses
+(``append``, ``extend``, ``sort``, indexing) so it can stand in for a list.
+"""
+
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    MutableSet,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T", bound=Hashable)
+
+
+class OrderedSet(MutableSet[T]):
+    """
+    A mutable set that remembers insertion order.
+
+    ``version`` increases on every change, so callers can cache values
+    derived from the set and notice when they go stale.
+    """
+
+    __slots__ = ("_items", "version")
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: Dict[T, None] = dict.fromkeys(items)
+        self.version = 0
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        """Index or slice in insertion order. This is O(n)."""
+        return list(self._items)[index]
+
+    def add(self, item: T) -> None:
+        """Add an item at the end unless it is already present."""
+        if item not in self._items:
+            self._items[item] = None
+            self.version += 1
+
+    # List-style spelling used throughout the dependency code
+    append = add
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Add several items in order."""
+        for item in items:
+            self.add(item)
+
+    def discard(self, item: T) -> None:
+        """Remove an item if it is present."""
+        if item in self._items:
+            del self._items[item]
+            self.version += 1
+
+    def clear(self) -> None:
+        """Remove every item."""
+        if self._items:
+            self._items.clear()
+            self.version += 1
+
+    def sort(
+        self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False
+    ) -> None:
+        """Reorder the items in place, like ``list.sort``."""
+        self._items = dict.fromkeys(sorted(self._items, key=key, reverse=reverse))
+        self.version += 1
+
+    def copy(self) -> "OrderedSet[T]":
+        """Return a shallow copy."""
+        return OrderedSet(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        # Ordered comparison against sequences, set comparison against sets
+        if isinstance(other, (OrderedSet, list, tuple)):
+            return list(self._items) == list(other)
+        if isinstance(other, AbstractSet):
+            return self._items.keys() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)!r})"
@@ -0,0 +1,206 @@
+"""
+Phase timing for ``tfkit --profile``.
+
+Code marks its phases with ``Profiler.phase``. Nested phases form a tree,
+and a phase entered again under the same parent adds to its earlier
+record, so per-file work shows up as one row with a call count. Each
+phase records wall time, CPU time of this process (parse worker processes
+are not included), counts attached by the code, and, when memory tracing
+is on, the peak of the memory traced by ``tracemalloc`` while it ran.
+
+A disabled profiler hands out a shared record that ignores everything, so
+instrumented code costs next to nothing when profiling is off.
+"""
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class PhaseRecord:
+    """
+    Totals for one phase.
+
+    Attributes:
+        name: Phase name
+        depth: Nesting level, 0 for top-level phases
+        calls: Times the phase was entered
+        wall_time: Elapsed seconds, summed over calls
+        cpu_time: CPU seconds of this process, summed over calls
+        peak_memory: Highest traced memory in bytes during any call, or
+            None without memory tracing
+        counts: Counters attached with ``count``
+    """
+
+    name: str
+    depth: int = 0
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: Optional[int] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+    children: Dict[str, "PhaseRecord"] = field(default_factory=dict, repr=False)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add ``value`` to the counter ``name``."""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "counts": self.counts,
+        }
+
+
+class _IgnoredRecord(PhaseRecord):
+    """The record a disabled profiler hands out; counts are dropped."""
+
+    def count(self, name: str, value: int = 1) -> None:
+        pass
+
+
+_IGNORED = _IgnoredRecord("ignored")
+
+
+class Profiler:
+    """
+    Records wall time, CPU time, counts and peak memory per phase.
+
+    Args:
+        enabled: Record anything at all
+        trace_memory: Trace allocations with ``tracemalloc`` between
+            ``start`` and ``stop`` to record peak memory. This slows the
+            traced code down considerably.
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        self.enabled = enabled
+        self.trace_memory = trace_memory and enabled
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory: Optional[int] = None
+
+        self._root = PhaseRecord("total", depth=-1)
+        self._records: List[PhaseRecord] = []
+        self._stack: List[PhaseRecord] = [self._root]
+        # Highest traced memory seen by each open phase before the last
+        # reset of the tracemalloc peak, parallel to _stack
+        self._carried: List[int] = [0]
+        self._started_tracing = False
+        self._start: Optional[float] = None
+        self._start_cpu = 0.0
+
+    @property
+    def records(self) -> List[PhaseRecord]:
+        """Every phase, parents before children, in order of first entry."""
+        return list(self._records)
+
+    def start(self) -> None:
+        """Start the overall clock and, with ``trace_memory``, tracing."""
+        if not self.enabled:
+            return
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._start = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    def stop(self) -> None:
+        """Stop the overall clock and any tracing ``start`` began."""
+        if not self.enabled or self._start is None:
+            return
+        self.wall_time = time.perf_counter() - self._start
+        self.cpu_time = time.process_time() - self._start_cpu
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_memory = max(self._carried[0], tracemalloc.get_traced_memory()[1])
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        self._start = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseRecord]:
+        """
+        Time the enclosed block as the phase ``name``.
+
+        Yields:
+            The phase's record, for attaching counts
+        """
+        if not self.enabled:
+            yield _IGNORED
+            return
+
+        parent = self._stack[-1]
+        record = parent.children.get(name)
+        if record is None:
+            record = PhaseRecord(name, depth=len(self._stack) - 1)
+            parent.children[name] = record
+            self._records.append(record)
+
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            # The enclosing phases keep the peak so far; this phase starts
+            # from the current level
+            self._carried[-1] = max(
+                self._carried[-1], tracemalloc.get_traced_memory()[1]
+            )
+            _reset_peak()
+
+        self._stack.append(record)
+        self._carried.append(0)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_time += time.perf_counter() - wall_start
+            record.cpu_time += time.process_time() - cpu_start
+            record.calls += 1
+            self._stack.pop()
+            carried = self._carried.pop()
+            if tracing:
+                peak = max(carried, tracemalloc.get_traced_memory()[1])
+                record.peak_memory = max(record.peak_memory or 0, peak)
+                self._carried[-1] = max(self._carried[-1], peak)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "phases": [record.to_dict() for record in self._records],
+        }
+
+
+def _reset_peak() -> None:
+    # tracemalloc.reset_peak() needs Python 3.9; before that peaks are
+    # measured from the start of tracing
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if reset_peak is not None:
+        reset_peak()
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of this process in bytes.
+
+    Returns None where the ``resource`` module is not available (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
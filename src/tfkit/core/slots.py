@@ -0,0 +1,94 @@
+"""
+Memory-lean dataclasses.
+
+An analysis keeps one model object per Terraform block, and large trees
+hold hundreds of thousands of them. ``slotted`` rebuilds a dataclass with
+``__slots__`` so instances carry no ``__dict__`` (``dataclass(slots=True)``
+needs Python 3.10).
+
+Fields declared with ``lazy_field`` hold None until they are first read,
+so collections that stay empty are never allocated. Their value lives in
+the slot ``_lazy_<name>``; code that only needs to know whether the
+collection has items can test that slot without allocating it.
+"""
+
+import dataclasses
+from typing import Any, Callable, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+_LAZY_FACTORY = "tfkit_lazy_factory"
+
+
+def lazy_field(factory: Callable[[], Any], **kwargs: Any) -> Any:
+    """
+    Declare a dataclass field whose value is built on first read.
+
+    Args:
+        factory: Builds the value, like ``default_factory``
+        **kwargs: Passed on to ``dataclasses.field``
+
+    Returns:
+        The field
+    """
+    metadata = dict(kwargs.pop("metadata", None) or {})
+    metadata[_LAZY_FACTORY] = factory
+    return dataclasses.field(default=None, metadata=metadata, **kwargs)
+
+
+class _LazySlot:
+    """Data descriptor over a hidden slot that builds its value on first read."""
+
+    __slots__ = ("slot", "factory")
+
+    def __init__(self, slot: Any, factory: Callable[[], Any]):
+        self.slot = slot
+        self.factory = factory
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if value is None:
+            value = self.factory()
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Rebuild a dataclass with ``__slots__``.
+
+    Apply it above ``@dataclass``. Assigning ``None`` to a lazy field resets
+    it to an empty value.
+    """
+    fields = dataclasses.fields(cls)
+    namespace = dict(cls.__dict__)
+    slots = []
+    lazy = {}
+
+    for f in fields:
+        # Class-level defaults would clash with the slots; the generated
+        # __init__ keeps its own copy of them
+        namespace.pop(f.name, None)
+        factory = f.metadata.get(_LAZY_FACTORY)
+        if factory is None:
+            slots.append(f.name)
+        else:
+            slots.append(f"_lazy_{f.name}")
+            lazy[f.name] = factory
+
+    namespace["__slots__"] = tuple(slots)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+
+    for name, factory in lazy.items():
+        setattr(new_cls, name, _LazySlot(new_cls.__dict__[f"_lazy_{name}"], factory))
+
+    return new_cls
@@ -0,0 +1,90 @@
+"""
+Read-once access to source files.
+
+Parsing and location lookups both need a file's contents. ``SourceReader``
+opens each file once per run and hands the same text to the parser and
+to the line-based lookups, counting files opened and bytes read.
+"""
+
+import io
+import mmap
+import os
+from typing import Dict, List, Optional
+
+# Files at least this large are read through mmap
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+
+class SourceFile:
+    """Text of one source file; lines are split on first use."""
+
+    def __init__(self, path: str, text: str):
+        self.path = path
+        self.text = text
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def lines(self) -> List[str]:
+        """Lines with their line endings, like ``readlines()``."""
+        if self._lines is None:
+            self._lines = io.StringIO(self.text).readlines()
+        return self._lines
+
+
+class SourceReader:
+    """
+    Reads source files once and keeps their text for the rest of the run.
+
+    Text is decoded as UTF-8 with universal newlines, matching
+    ``open(path, encoding="utf-8")``.
+
+    Attributes:
+        files_opened: Number of files opened from disk
+        bytes_read: Number of bytes read from disk
+    """
+
+    def __init__(self, mmap_threshold: int = DEFAULT_MMAP_THRESHOLD):
+        self.mmap_threshold = mmap_threshold
+        self.files_opened = 0
+        self.bytes_read = 0
+        self._files: Dict[str, SourceFile] = {}
+
+    def read(self, path: str) -> SourceFile:
+        """
+        Return the contents of a file, reading it on first access only.
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        source = self._files.get(path)
+        if source is not None:
+            return source
+
+        with open(path, "rb") as f:
+            self.files_opened += 1
+            size = os.fstat(f.fileno()).st_size
+            if size and size >= self.mmap_threshold:
+                # Decode straight from the mapping, without a bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    text = str(mapped, "utf-8")
+            else:
+                data = f.read()
+                size = len(data)
+                text = data.decode("utf-8")
+        self.bytes_read += size
+
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        source = SourceFile(path, text)
+        self._files[path] = source
+        return source
+
+    def forget(self, path: str) -> None:
+        """Drop a file so the next ``read`` goes back to disk."""
+        self._files.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop every file read so far."""
+        self._files.clear()
@@ -0,0 +1,61 @@
+"""
+Project-scoped symbol table for object addresses.
+
+Addresses such as ``aws_iam_role.app`` or ``var.region`` are built again
+every time a block is created or a reference is scanned. Passing each one
+through ``SymbolTable.intern`` replaces it with the single copy the table
+holds, so dependency sets, reverse edges and graph nodes all share one
+string per address. ``str`` caches its hash and dict lookups compare by
+identity first, so shared copies are also cheaper to look up.
+
+Each address also gets a small integer ID, in order of first appearance,
+for int-indexed structures and compact serialized forms.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class SymbolTable:
+    """Interns strings and numbers them."""
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> str:
+        """Return the table's copy of ``name``, adding it if it is new."""
+        index = self._ids.get(name)
+        if index is None:
+            index = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return self._names[index]
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Return the table's copy of ``name`` without adding it."""
+        index = self._ids.get(name)
+        return None if index is None else self._names[index]
+
+    def id_of(self, name: str) -> int:
+        """Return the ID of ``name``, adding it if it is new."""
+        index = self._ids.get(name)
+        if index is None:
+            index = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return index
+
+    def name_of(self, index: int) -> str:
+        """Return the name with the given ID."""
+        return self._names[index]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -0,0 +1,256 @@
+"""
+Terraform file discovery.
+
+``FileWalker`` collects ``.tf``, ``.tf.json``, ``.tfvars`` and
+``.tfvars.json`` files in one ``os.scandir`` traversal. Directories such
+as ``.terraform`` (provider and module caches), ``.git`` and
+``node_modules`` are pruned without being listed, and ignore files in the
+gitignore format can exclude more.
+
+Entries whose names start with a dot are skipped, as ``glob`` does.
+Symlinked directories are followed once each.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Pattern, Sequence, Tuple
+
+TERRAFORM_SUFFIXES = (".tf", ".tf.json")
+TFVARS_SUFFIXES = (".tfvars", ".tfvars.json")
+
+# Never descended into
+DEFAULT_IGNORED_DIRS = frozenset({".terraform", ".git", "node_modules"})
+
+# Ignore files read by default; pass (".gitignore", ".tfkitignore") to
+# honour .gitignore as well
+DEFAULT_IGNORE_FILES = (".tfkitignore",)
+
+
+@dataclass
+class DiscoveredFiles:
+    """Files found by one walk, as sorted paths."""
+
+    terraform: List[str] = field(default_factory=list)
+    tfvars: List[str] = field(default_factory=list)
+
+
+class IgnoreRule:
+    """
+    One pattern line of an ignore file in the gitignore format.
+
+    Supports ``*``, ``?``, ``[...]``, ``**``, a leading ``!`` to re-include,
+    a trailing ``/`` for directories only, and a leading or inner ``/`` to
+    anchor the pattern to the ignore file's directory.
+    """
+
+    __slots__ = ("base", "negated", "dir_only", "anchored", "regex")
+
+    def __init__(self, pattern: str, base: str = ""):
+        self.base = base
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        self.anchored = "/" in pattern
+        self.regex: Pattern[str] = re.compile(_translate(pattern.lstrip("/")))
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Check a path relative to the walk root (``/``-separated)."""
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        if not self.anchored:
+            rel_path = rel_path.rsplit("/", 1)[-1]
+        return self.regex.fullmatch(rel_path) is not None
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore pattern into a regular expression."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif char == "*":
+            out.append("[^/]*")
+            i += 1
+        elif char == "?":
+            out.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        elif char == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(char))
+            i += 1
+    return "".join(out)
+
+
+def parse_ignore_file(text: str, base: str = "") -> List[IgnoreRule]:
+    """
+    Parse the contents of an ignore file.
+
+    Args:
+        text: File contents
+        base: Directory of the ignore file, relative to the walk root
+
+    Returns:
+        Rules in file order
+    """
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        rules.append(IgnoreRule(line, base))
+    return rules
+
+
+def _is_ignored(rules: Sequence[IgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    # The last matching rule decides
+    for rule in reversed(rules):
+        if rule.matches(rel_path, is_dir):
+            return not rule.negated
+    return False
+
+
+class FileWalker:
+    """
+    Finds Terraform and tfvars files under a directory.
+
+    Args:
+        ignore_dirs: Directory names that are never descended into
+        ignore_files: Names of ignore files to honour in every directory
+    """
+
+    def __init__(
+        self,
+        ignore_dirs: Iterable[str] = DEFAULT_IGNORED_DIRS,
+        ignore_files: Sequence[str] = DEFAULT_IGNORE_FILES,
+    ):
+        self.ignore_dirs = frozenset(ignore_dirs)
+        self.ignore_files = tuple(ignore_files)
+
+    def walk(self, root: str, recursive: bool = True) -> DiscoveredFiles:
+        """
+        Collect the files under ``root`` in one traversal.
+
+        Args:
+            root: Directory to search
+            recursive: Whether to search subdirectories
+
+        Returns:
+            The Terraform and tfvars files found, with paths joined onto
+            ``root`` as given
+        """
+        found = DiscoveredFiles()
+        visited = set()
+
+        # (directory, path relative to root, rules in effect)
+        pending: List[Tuple[str, str, List[IgnoreRule]]] = [(root, "", [])]
+        while pending:
+            directory, rel_dir, rules = pending.pop()
+            try:
+                stat = os.stat(directory)
+            except OSError:
+                continue
+            if (stat.st_dev, stat.st_ino) in visited:
+                continue
+            visited.add((stat.st_dev, stat.st_ino))
+
+            rules = rules + self._read_ignore_files(directory, rel_dir)
+            try:
+                with os.scandir(directory) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if (
+                        recursive
+                        and name not in self.ignore_dirs
+                        and not _is_ignored(rules, rel_path, True)
+                    ):
+                        pending.append((entry.path, rel_path, rules))
+                elif name.endswith(TERRAFORM_SUFFIXES):
+                    if not _is_ignored(rules, rel_path, False):
+                        found.terraform.append(entry.path)
+                elif name.endswith(TFVARS_SUFFIXES):
+                    if not _is_ignored(rules, rel_path, False):
+                        found.tfvars.append(entry.path)
+
+        found.terraform.sort()
+        found.tfvars.sort()
+        return found
+
+    def includes(self, root: str, path: str) -> bool:
+        """
+        Check whether a walk of ``root`` would consider ``path``.
+
+        Only the name rules are checked; the path does not need to exist.
+        """
+        root = os.path.abspath(root)
+        rel = os.path.relpath(os.path.abspath(path), root)
+        if rel == os.curdir or rel.startswith(os.pardir):
+            return False
+
+        parts = rel.split(os.sep)
+        rules: List[IgnoreRule] = []
+        directory, rel_dir = root, ""
+        for index, name in enumerate(parts):
+            rules = rules + self._read_ignore_files(directory, rel_dir)
+            is_dir = index < len(parts) - 1
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if name.startswith("."):
+                return False
+            if is_dir and name in self.ignore_dirs:
+                return False
+            if _is_ignored(rules, rel_path, is_dir):
+                return False
+            directory, rel_dir = os.path.join(directory, name), rel_path
+        return True
+
+    def _read_ignore_files(self, directory: str, rel_dir: str) -> List[IgnoreRule]:
+        rules: List[IgnoreRule] = []
+        for name in self.ignore_files:
+            try:
+                with open(os.path.join(directory, name), encoding="utf-8") as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            rules.extend(parse_ignore_file(text, rel_dir))
+        return rules
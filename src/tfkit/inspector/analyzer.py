@@ -9,6 +9,7 @@ from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 
+from tfkit.core.graph import find_cycles
 from tfkit.inspector.models import (
     ReferenceType,
     TerraformBlock,
@@ -544,35 +545,9 @@ class DependencyAnalyzer:
     # ========================================================================
 
     def _detect_circular_dependencies(self):
-        """Detect circular dependencies using DFS."""
-        visited = set()
-        rec_stack = set()
-        cycles = []
-
-        def dfs(node: str, path: List[str]) -> bool:
-            """DFS to detect cycles."""
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in self.analysis.dependency_graph.get(node, set()):
-                if neighbor not in visited:
-                    if dfs(neighbor, path):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-                    return True
-
-            path.pop()
-            rec_stack.remove(node)
-            return False
-
-        for node in self.analysis.nodes:
-            if node not in visited:
-                dfs(node, [])
+        """Detect circular dependencies from the strongly connected components."""
+        graph = self.analysis.dependency_graph
+        cycles = find_cycles(self.analysis.nodes, lambda node: graph.get(node, ()))
 
         self.analysis.circular_dependencies = cycles
 
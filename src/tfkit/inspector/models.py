@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Union
 
+from tfkit.core.graph import find_cycles
+
 # ============================================================================
 # ENUMS AND TYPE DEFINITIONS
 # ============================================================================
@@ -170,34 +172,9 @@ class ReferenceDependencyGraph:
 
     def detect_cycles(self) -> List[List[str]]:
         """Detect circular dependencies in the graph."""
-        visited = set()
-        recursion_stack = set()
-        cycles = []
-
-        def dfs(node: str, path: List[str]) -> None:
-            if node in recursion_stack:
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:]
-                if cycle not in cycles:
-                    cycles.append(cycle)
-                return
-
-            if node in visited:
-                return
-
-            visited.add(node)
-            recursion_stack.add(node)
-
-            for neighbor in self.dependencies.get(node, set()):
-                dfs(neighbor, path + [neighbor])
-
-            recursion_stack.remove(node)
-
-        for node in self.dependencies:
-            if node not in visited:
-                dfs(node, [node])
-
-        return cycles
+        return find_cycles(
+            self.dependencies, lambda node: self.dependencies.get(node, ())
+        )
 
     def calculate_resolution_order(self) -> List[str]:
         """Calculate optimal resolution order using topological sort."""
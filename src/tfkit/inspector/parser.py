@@ -7,6 +7,11 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from tfkit.core.blocks import BlockIndex
+from tfkit.core.cache import ParseCache
+from tfkit.core.source import SourceReader
+from tfkit.core.symbols import SymbolTable
+from tfkit.core.walker import FileWalker
 from tfkit.inspector.models import (
     AttributeType,
     AttributeValue,
@@ -26,8 +31,23 @@ from tfkit.inspector.models import (
 class TerraformParser:
     """Terraform parser with full metadata extraction."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ParseCache] = None,
+        source: Optional[SourceReader] = None,
+        walker: Optional[FileWalker] = None,
+        low_memory: bool = False,
+    ):
+        # With low_memory, a file's lines are dropped once it is parsed
+        self.low_memory = low_memory
         self._file_cache: Dict[str, List[str]] = {}
+        self._block_index: Dict[str, BlockIndex] = {}
+        self.cache = cache
+        self.source = source or SourceReader()
+        self.walker = walker or FileWalker()
+
+        # One shared copy of every reference string seen by this parser
+        self.symbols = SymbolTable()
 
         self.terraform_functions = {
             "file",
@@ -120,17 +140,30 @@ class TerraformParser:
             return
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                self._file_cache[file_path] = f.readlines()
+            self._file_cache[file_path] = self.source.read(file_path).lines
         except (OSError, UnicodeDecodeError) as e:
             print(f"Warning: Could not cache file {file_path}: {e}")
             self._file_cache[file_path] = []
+        self._block_index[file_path] = BlockIndex.from_lines(
+            self._file_cache[file_path]
+        )
+
+    def _release_file(self, file_path: str) -> None:
+        """Drop the cached content of a parsed file."""
+        self._file_cache.pop(file_path, None)
+        self._block_index.pop(file_path, None)
+        self.source.forget(file_path)
 
     def _get_file_lines(self, file_path: str) -> List[str]:
         """Get cached file lines."""
         self._cache_file(file_path)
         return self._file_cache.get(file_path, [])
 
+    def _get_block_index(self, file_path: str) -> BlockIndex:
+        """Get the top-level block index of a cached file."""
+        self._cache_file(file_path)
+        return self._block_index[file_path]
+
     # ========================================================================
     # LINE NUMBER DETECTION
     # ========================================================================
@@ -139,6 +172,15 @@ class TerraformParser:
         self, file_path: str, block_type: str, labels: List[str]
     ) -> Optional[int]:
         """Find the line number where a block starts."""
+        # Top-level blocks come straight from the index
+        index = self._get_block_index(file_path)
+        if block_type in ["locals", "terraform"]:
+            span = index.find(block_type)
+        else:
+            span = index.find(block_type, *labels)
+        if span:
+            return span[0]
+
         lines = self._get_file_lines(file_path)
 
         # --- Special Handling for Singleton/Container Blocks (locals, terraform) ---
@@ -200,6 +242,10 @@ class TerraformParser:
 
     def _find_block_end(self, file_path: str, start_line: int) -> int:
         """Find the closing brace '}' of a block using brace counting."""
+        end_line = self._get_block_index(file_path).end_of(start_line)
+        if end_line is not None:
+            return end_line
+
         lines = self._get_file_lines(file_path)
 
         if start_line < 1 or start_line > len(lines):
@@ -532,6 +578,7 @@ class TerraformParser:
         if not ref_string:
             return None
 
+        ref_string = self.symbols.intern(ref_string)
         parts = ref_string.split(".")
 
         if len(parts) < 2:
@@ -1358,14 +1405,26 @@ class TerraformParser:
             return TerraformFile(file_path=file_path, blocks=blocks)
         except Exception:
             return TerraformFile(file_path=file_path, blocks=[])
+        finally:
+            if self.low_memory:
+                self._release_file(file_path)
 
     def _parse_hcl_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Parse HCL file using python-hcl2."""
         try:
             import hcl2
 
-            with open(file_path, encoding="utf-8") as f:
-                return hcl2.load(f)
+            content = self.source.read(file_path).text
+
+            if self.cache is None:
+                return hcl2.loads(content)
+
+            key = self.cache.key_for(content)
+            parsed = self.cache.get(key)
+            if parsed is None:
+                parsed = hcl2.loads(content)
+                self.cache.put(key, parsed)
+            return parsed
         except ImportError:
             print(
                 "Error: python-hcl2 not installed. Install with: pip install python-hcl2"
@@ -1378,8 +1437,7 @@ class TerraformParser:
     def _parse_json_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Parse JSON Terraform file."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(self.source.read(file_path).text)
         except Exception as e:
             print(f"Error parsing JSON file {file_path}: {e}")
             return None
@@ -1402,22 +1460,11 @@ class TerraformParser:
         root = Path(root_path)
         files = []
 
-        patterns = ["*.tf", "*.tf.json"]
-
-        def collect_files(directory: Path):
-            for pattern in patterns:
-                for tf_file in directory.glob(pattern):
-                    try:
-                        parsed_file = self.parse_file(str(tf_file))
-                        files.append(parsed_file)
-                    except Exception as e:
-                        print(f"Warning: Failed to parse {tf_file}: {e}")
-
-        collect_files(root)
-
-        if recursive:
-            for subdir in root.rglob("*"):
-                if subdir.is_dir() and subdir != root:
-                    collect_files(subdir)
+        for tf_file in self.walker.walk(str(root), recursive=recursive).terraform:
+            try:
+                parsed_file = self.parse_file(tf_file)
+                files.append(parsed_file)
+            except Exception as e:
+                print(f"Warning: Failed to parse {tf_file}: {e}")
 
         return TerraformModule(root_path=str(root), files=files)
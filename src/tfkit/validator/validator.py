@@ -3,6 +3,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 
+from tfkit.core.profiling import Profiler
 from tfkit.validator.models import (
     ValidationCategory,
     ValidationIssue,
@@ -35,8 +36,13 @@ class TerraformValidator:
     Enhanced validator with cloud resource filtering and safe validation
     """
 
-    def __init__(self, config: Optional[ValidatorConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ValidatorConfig] = None,
+        profiler: Optional[Profiler] = None,
+    ):
         self.config = config or ValidatorConfig()
+        self.profiler = profiler or Profiler(enabled=False)
         self.rule_registry = rule_registry
         self._initialized = False
         self._stats: Dict[str, Any] = {}
@@ -47,7 +53,9 @@ class TerraformValidator:
             return
 
         if self.config.auto_load_rules:
-            loaded = RuleLoader.load_rules_from_package(self.config.rules_package)
+            with self.profiler.phase("load rules") as phase:
+                loaded = RuleLoader.load_rules_from_package(self.config.rules_package)
+                phase.count("rules", loaded)
             print(f"Loaded {loaded} validation rules")
 
         self._initialized = True
@@ -61,7 +69,19 @@ class TerraformValidator:
         """
         Validate Terraform project using registered rules with cloud resource filtering
         """
+        with self.profiler.phase("validate") as phase:
+            result = self._validate(project, check_categories, specific_resources)
+            phase.count("issues", result.total_issues)
+        return result
+
+    def _validate(
+        self,
+        project,
+        check_categories: Optional[Set[ValidationCategory]],
+        specific_resources: Optional[Set[str]],
+    ) -> ValidationResult:
         self.initialize()
+        profiler = self.profiler
 
         start_time = time.time()
         result = ValidationResult()
@@ -70,23 +90,35 @@ class TerraformValidator:
             check_categories = set(ValidationCategory)
 
         # Collect only cloud resources to validate
-        resources_to_validate = self._collect_cloud_resources(
-            project, specific_resources
-        )
-
-        if self.config.parallel and len(resources_to_validate) > 1:
-            self._validate_parallel(
-                resources_to_validate, project, check_categories, result
+        with profiler.phase("collect resources") as phase:
+            resources_to_validate = self._collect_cloud_resources(
+                project, specific_resources
             )
-        else:
-            self._validate_sequential(
-                resources_to_validate, project, check_categories, result
+            phase.count("resources", len(resources_to_validate))
+
+        with profiler.phase("resource rules") as phase:
+            rules_before = self._stats.get("rules_executed", 0)
+            if self.config.parallel and len(resources_to_validate) > 1:
+                self._validate_parallel(
+                    resources_to_validate, project, check_categories, result
+                )
+            else:
+                self._validate_sequential(
+                    resources_to_validate, project, check_categories, result
+                )
+            phase.count(
+                "rules executed", self._stats.get("rules_executed", 0) - rules_before
             )
 
         if self.config.fail_fast and result.errors:
             return result
 
-        self._validate_project_level(project, check_categories, result)
+        with profiler.phase("project rules") as phase:
+            rules_before = self._stats.get("rules_executed", 0)
+            self._validate_project_level(project, check_categories, result)
+            phase.count(
+                "rules executed", self._stats.get("rules_executed", 0) - rules_before
+            )
 
         self._stats = {
             "duration": time.time() - start_time,
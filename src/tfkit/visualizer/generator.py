@@ -2,10 +2,10 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from tfkit.analyzer.project import TerraformProject
-from tfkit.templates.template_factory import TemplateFactory
+from tfkit.core.profiling import Profiler
 from tfkit.templates.theme_manager import ThemeManager
 from tfkit.visualizer.graph_builder import TerraformGraphBuilder
 
@@ -16,16 +16,23 @@ class ReportGenerator:
     supporting multiple themes, layouts, and data inclusions.
     """
 
-    def __init__(self, default_theme: str = "dark", default_layout: str = "classic"):
+    def __init__(
+        self,
+        default_theme: str = "dark",
+        default_layout: str = "classic",
+        profiler: Optional[Profiler] = None,
+    ):
         """
         Initialize the report generator with default settings.
 
         Args:
             default_theme: Default visual theme ('light', 'dark', 'cyber', 'nord', etc.)
             default_layout: Default layout type ('classic', 'graph', 'dashboard', etc.)
+            profiler: Optional profiler recording the report phases
         """
         self.default_theme = default_theme
         self.default_layout = default_layout
+        self.profiler = profiler or Profiler(enabled=False)
         self._graph_builder = TerraformGraphBuilder()
 
     def generate_analysis_report(
@@ -45,12 +52,26 @@ class ReportGenerator:
         Returns:
             Path to the generated HTML file.
         """
+        with self.profiler.phase("report"):
+            return self._generate_analysis_report(project, output_directory, options)
+
+    def _generate_analysis_report(
+        self,
+        project: TerraformProject,
+        output_directory: Optional[Path],
+        options: Dict[str, Any],
+    ) -> Path:
+        profiler = self.profiler
+
         # --- 1. Configuration Setup ---
         report_theme = options.get("theme", self.default_theme)
         report_layout = options.get("layout", self.default_layout)
 
         # --- 2. Data Transformation ---
-        graph_data = self._graph_builder.build_graph(project)
+        with profiler.phase("build graph") as phase:
+            graph_data = self._graph_builder.build_graph(project)
+            phase.count("nodes", len(graph_data["nodes"]))
+            phase.count("edges", len(graph_data["edges"]))
 
         # graph_file = "graph_data"
 
@@ -65,6 +86,10 @@ class ReportGenerator:
         except ImportError:
             __version__ = "Unknown"
 
+        with profiler.phase("serialize"):
+            config_data = json.dumps(project.tfvars_files)
+            graph_json = json.dumps(graph_data)
+
         report_context = {
             "title": options.get("title", "Terraform Project Visualization"),
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -73,19 +98,23 @@ class ReportGenerator:
                 "project_path",
                 str(project.source_path) if hasattr(project, "source_path") else ".",
             ),
-            "config_data": json.dumps(project.tfvars_files),
-            "graph_data": json.dumps(graph_data),
+            "config_data": config_data,
+            "graph_data": graph_json,
             "theme_name": report_theme,
             "theme_colors": ThemeManager.get_theme_colors(report_theme),
         }
 
         output_file_path = self._determine_output_file(output_directory)
 
-        TemplateFactory().render_to_file(
-            report_layout,
-            output_file_path,
-            **report_context,
-        )
+        with profiler.phase("render"):
+            # Imported here so that loading the module does not load jinja2
+            from tfkit.templates.template_factory import TemplateFactory
+
+            TemplateFactory().render_to_file(
+                report_layout,
+                output_file_path,
+                **report_context,
+            )
 
         return output_file_path
 
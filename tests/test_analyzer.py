@@ -1,10 +1,13 @@
+import json
 import os
 from pathlib import Path
 
+import hcl2
 import pytest
 
-from tfkit.analyzer.models import DependencyInfo, ResourceType
+from tfkit.analyzer.models import DependencyInfo, ObjectState, ResourceType
 from tfkit.analyzer.terraform_analyzer import DependencyExtractor, TerraformAnalyzer
+from tfkit.core.cache import MemoryParseCache, ParseCache
 
 
 class TestTerraformAnalyzer:
@@ -63,6 +66,374 @@ class TestTerraformAnalyzer:
             or ResourceType.VARIABLE in object_types
         )
 
+    @pytest.mark.skipif(not os.path.exists("examples"), reason="Examples not available")
+    def test_parallel_parse_matches_serial(self):
+        """Test that parsing in a process pool yields the same project"""
+        serial = TerraformAnalyzer().analyze_project("examples")
+
+        analyzer = TerraformAnalyzer(workers=2)
+        analyzer.PARALLEL_MIN_FILES = 1
+        analyzer.PARALLEL_MIN_BYTES = 0
+        parallel = analyzer.analyze_project("examples")
+
+        assert list(parallel.all_objects) == list(serial.all_objects)
+        assert json.dumps(parallel.to_dict(), default=str) == json.dumps(
+            serial.to_dict(), default=str
+        )
+
+    def test_each_file_is_read_once(self, tmp_path):
+        """Test that parsing and line lookups share one read per file"""
+        (tmp_path / "main.tf").write_text('variable "region" {}\n')
+        (tmp_path / "outputs.tf").write_text('output "region" {\n  value = 1\n}\n')
+        (tmp_path / "terraform.tfvars").write_text('region = "eu-west-1"\n')
+
+        project = TerraformAnalyzer().analyze_project(str(tmp_path))
+
+        assert project.metadata.files_opened == 3
+        assert project.metadata.bytes_read == sum(
+            f.stat().st_size for f in tmp_path.iterdir()
+        )
+        assert project.get_object("output.region").location.line_number == 1
+
+    def test_addresses_are_shared(self, tmp_path):
+        """Test that references reuse one string per address"""
+        (tmp_path / "main.tf").write_text(
+            'variable "region" {}\n'
+            'output "a" {\n  value = "${var.region}-${var.zone}"\n}\n'
+            'output "b" {\n  value = "${var.region}-${var.zone}"\n}\n'
+        )
+
+        project = TerraformAnalyzer().analyze_project(str(tmp_path))
+        a = project.get_object("output.a").dependency_info
+        b = project.get_object("output.b").dependency_info
+        region = project.get_object("var.region")
+
+        assert a.implicit_dependencies[0] is region.full_name
+        assert b.implicit_dependencies[0] is region.full_name
+        assert a.missing_dependencies[0] is b.missing_dependencies[0]
+        assert "var.zone" in project.symbols
+
+    def test_small_projects_parse_serially(self, tmp_path):
+        """Test that tiny projects do not start a process pool"""
+        (tmp_path / "main.tf").write_text('variable "region" {}\n')
+        analyzer = TerraformAnalyzer(workers=4)
+        files = analyzer._find_terraform_files(tmp_path)
+        sizes = {f: os.path.getsize(f) for f in files}
+
+        assert analyzer._resolve_workers(files, sizes) == 1
+
+    @pytest.mark.skipif(not os.path.exists("examples"), reason="Examples not available")
+    def test_warm_cache_run_matches_cold_run(self, tmp_path):
+        """Test that a warm parse cache skips parsing and yields the same project"""
+        cold_cache = ParseCache(tmp_path / "cache")
+        cold = TerraformAnalyzer(cache=cold_cache).analyze_project("examples")
+        assert cold_cache.hits == 0
+
+        warm_cache = ParseCache(tmp_path / "cache")
+        warm = TerraformAnalyzer(cache=warm_cache).analyze_project("examples")
+
+        assert warm_cache.misses == 0
+        assert warm_cache.hits == cold_cache.misses
+        assert json.dumps(warm.to_dict(), default=str) == json.dumps(
+            cold.to_dict(), default=str
+        )
+
+
+    def test_warm_cache_run_skips_parser(self, tmp_path, monkeypatch):
+        """Test that a warm parse cache covers .tfvars files as well"""
+        root = tmp_path / "project"
+        root.mkdir()
+        (root / "main.tf").write_text('variable "region" {}\n')
+        (root / "dev.tfvars").write_text('region = "us-east-1"\n')
+        cold = TerraformAnalyzer(cache=ParseCache(tmp_path / "cache"))
+        cold.analyze_project(str(root))
+
+        def fail(content):
+            raise AssertionError("hcl2 parser used on a warm run")
+
+        monkeypatch.setattr(hcl2, "loads", fail)
+        warm_cache = ParseCache(tmp_path / "cache")
+        warm = TerraformAnalyzer(cache=warm_cache).analyze_project(str(root))
+
+        assert warm_cache.misses == 0
+        assert list(warm.tfvars_files.values()) == [{"region": "us-east-1"}]
+
+class TestAnalyzeMany:
+    @staticmethod
+    def _snapshot(project):
+        data = project.to_dict()
+        data["metadata"].pop("files_opened")
+        data["metadata"].pop("bytes_read")
+        return json.dumps(data, default=str)
+
+    @staticmethod
+    def _make_roots(tmp_path):
+        shared = 'variable "region" {}\noutput "region" {\n  value = var.region\n}\n'
+        for env in ("dev", "prod"):
+            root = tmp_path / env
+            root.mkdir()
+            (root / "main.tf").write_text(shared)
+            (root / "bucket.tf").write_text(f'resource "aws_s3_bucket" "{env}" {{}}\n')
+        return [str(tmp_path / "dev"), str(tmp_path / "prod")]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_roots_match_single_analyses(self, tmp_path, workers):
+        """Test that every root matches its own analyze_project run"""
+        roots = self._make_roots(tmp_path)
+        analyzer = TerraformAnalyzer(workers=workers)
+        analyzer.PARALLEL_MIN_FILES = 1
+        analyzer.PARALLEL_MIN_BYTES = 0
+
+        workspace = analyzer.analyze_many(roots + roots[:1])
+
+        assert list(workspace.projects) == roots
+        for root in roots:
+            fresh = TerraformAnalyzer().analyze_project(root)
+            assert self._snapshot(workspace.projects[root]) == self._snapshot(fresh)
+        assert workspace.files_opened == 4
+
+        stats = workspace.compute_statistics()
+        assert stats.resource_count == 2
+        assert f"{roots[0]}:output.region" in stats.orphaned_objects
+
+    def test_identical_files_are_parsed_once(self, tmp_path):
+        """Test that files with the same content share one parse"""
+        roots = self._make_roots(tmp_path)
+        cache = MemoryParseCache()
+
+        TerraformAnalyzer(cache=cache).analyze_many(roots)
+
+        assert len(cache) == 3
+        assert cache.hits == 1
+
+    def test_failed_roots_are_recorded(self, tmp_path):
+        """Test that one bad root does not stop the others"""
+        roots = self._make_roots(tmp_path)
+        (tmp_path / "empty").mkdir()
+        missing = str(tmp_path / "missing")
+        empty = str(tmp_path / "empty")
+
+        workspace = TerraformAnalyzer().analyze_many([missing, roots[0], empty])
+
+        assert list(workspace.projects) == [roots[0]]
+        assert "does not exist" in workspace.errors[missing]
+        assert "No Terraform files" in workspace.errors[empty]
+        assert workspace.to_dict()["metadata"]["failed"] == 2
+
+        with pytest.raises(ValueError, match="No Terraform files"):
+            TerraformAnalyzer().analyze_many([empty], fail_fast=True)
+
+    def test_statistics_only(self, tmp_path):
+        """Test that a statistics-only dictionary leaves out the objects"""
+        roots = self._make_roots(tmp_path)
+        workspace = TerraformAnalyzer().analyze_many(roots)
+
+        full = workspace.to_dict()
+        summary = workspace.to_dict(statistics_only=True)
+
+        assert summary["statistics"] == full["statistics"]
+        for root in roots:
+            assert summary["projects"][root] == {
+                "metadata": full["projects"][root]["metadata"],
+                "statistics": full["projects"][root]["statistics"],
+            }
+
+
+class TestIncrementalUpdate:
+    @staticmethod
+    def _snapshot(project):
+        data = project.to_dict()
+        # I/O counters describe the run, not the project
+        data["metadata"].pop("files_opened")
+        data["metadata"].pop("bytes_read")
+        return json.dumps(data, default=str)
+
+    def test_update_matches_fresh_analysis(self, tmp_path):
+        """Test that editing a file yields the same project as a full re-analysis"""
+        (tmp_path / "variables.tf").write_text('variable "name" {}\n')
+        main = tmp_path / "main.tf"
+        main.write_text('resource "aws_s3_bucket" "logs" {\n  bucket = var.name\n}\n')
+
+        analyzer = TerraformAnalyzer()
+        # Serializing first fills the project's cached results
+        analyzer.analyze_project(str(tmp_path)).to_dict()
+
+        main.write_text(
+            'resource "aws_s3_bucket" "logs" {\n  bucket = "static"\n}\n'
+            'output "bucket" {\n  value = aws_s3_bucket.logs.id\n}\n'
+        )
+        updated = analyzer.update_files(changed=["main.tf"])
+        fresh = TerraformAnalyzer().analyze_project(str(tmp_path))
+
+        assert self._snapshot(updated) == self._snapshot(fresh)
+        assert updated.get_object("var.name").dependency_info.dependent_objects == []
+
+    def test_new_file_resolves_missing_reference(self, tmp_path):
+        """Test that a missing reference resolves once a file defines it"""
+        (tmp_path / "main.tf").write_text(
+            'resource "aws_s3_bucket" "logs" {\n  bucket = local.bucket_name\n}\n'
+        )
+
+        analyzer = TerraformAnalyzer()
+        project = analyzer.analyze_project(str(tmp_path))
+        bucket = project.get_object("aws_s3_bucket.logs")
+        assert bucket.dependency_info.missing_dependencies == ["local.bucket_name"]
+
+        locals_tf = tmp_path / "locals.tf"
+        locals_tf.write_text('locals {\n  bucket_name = "logs"\n}\n')
+        analyzer.update_files(changed=[str(locals_tf)])
+
+        bucket = project.get_object("aws_s3_bucket.logs")
+        assert bucket.dependency_info.missing_dependencies == []
+        assert "local.bucket_name" in bucket.dependency_info.implicit_dependencies
+        assert project.get_object(
+            "local.bucket_name"
+        ).dependency_info.dependent_objects == ["aws_s3_bucket.logs"]
+
+        assert project.source_files == [str(locals_tf), str(tmp_path / "main.tf")]
+
+        locals_tf.unlink()
+        analyzer.update_files(deleted=[str(locals_tf)])
+
+        assert project.get_object("local.bucket_name") is None
+        assert project.source_files == [str(tmp_path / "main.tf")]
+        assert self._snapshot(project) == self._snapshot(
+            TerraformAnalyzer().analyze_project(str(tmp_path))
+        )
+
+    def test_update_detects_new_cycle(self, tmp_path):
+        """Test that a cycle introduced by an edit is reported"""
+        (tmp_path / "a.tf").write_text("locals {\n  a = local.b\n}\n")
+        b_tf = tmp_path / "b.tf"
+        b_tf.write_text('locals {\n  b = "static"\n}\n')
+
+        analyzer = TerraformAnalyzer()
+        project = analyzer.analyze_project(str(tmp_path))
+        assert not project.get_object("local.a").dependency_info.has_circular_deps
+
+        b_tf.write_text("locals {\n  b = local.a\n}\n")
+        analyzer.update_files(changed=[str(b_tf)])
+
+        assert project.get_object("local.a").dependency_info.has_circular_deps
+        assert project.get_object("local.b").dependency_info.has_circular_deps
+
+    def test_update_requires_analysis(self):
+        """Test that update_files needs a previously analyzed project"""
+        with pytest.raises(ValueError):
+            TerraformAnalyzer().update_files(changed=["main.tf"])
+
+
+class TestLowMemory:
+    MAIN_TF = """
+variable "region" {
+  default = "eu-west-1"
+}
+
+resource "aws_vpc" "main" {
+  cidr_block = "10.0.0.0/16"
+  tags = {
+    Region = var.region
+  }
+}
+
+resource "aws_subnet" "a" {
+  vpc_id     = aws_vpc.main.id
+  cidr_block = "10.0.1.0/24"
+}
+
+output "subnet" {
+  value = aws_subnet.a.id
+}
+"""
+
+    @staticmethod
+    def _without_attributes(project):
+        data = project.to_dict()
+        data["metadata"].pop("files_opened")
+        data["metadata"].pop("bytes_read")
+        for objects in data["objects"].values():
+            for obj in objects.values():
+                obj.pop("attributes")
+        return json.dumps(data, default=str)
+
+    def _make_project(self, tmp_path):
+        (tmp_path / "main.tf").write_text(self.MAIN_TF)
+        (tmp_path / "extra.tf").write_text('locals {\n  name = "x"\n}\n')
+        (tmp_path / "dev.tfvars").write_text('region = "us-east-1"\n')
+        return str(tmp_path)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_full_analysis_without_attributes(self, tmp_path, workers):
+        """Test that only raw attributes and file contents are dropped"""
+        root = self._make_project(tmp_path)
+        analyzer = TerraformAnalyzer(workers=workers, low_memory=True)
+        analyzer.PARALLEL_MIN_FILES = 1
+        analyzer.PARALLEL_MIN_BYTES = 0
+
+        project = analyzer.analyze_project(root)
+        full = TerraformAnalyzer().analyze_project(root)
+
+        assert self._without_attributes(project) == self._without_attributes(full)
+        assert project.compute_statistics() == full.compute_statistics()
+        assert all(not obj.attributes for obj in project.all_objects.values())
+        assert project.resources["aws_vpc.main"].tags == {"Region": "${var.region}"}
+        assert analyzer.file_parser._file_cache == {}
+        assert analyzer.file_parser.source.files_opened == 3
+
+    def test_states_survive_recompute(self, tmp_path):
+        """Test that recomputed states do not see the dropped attributes"""
+        root = self._make_project(tmp_path)
+        project = TerraformAnalyzer(low_memory=True).analyze_project(root)
+        before = {name: obj.state for name, obj in project.all_objects.items()}
+
+        project.build_dependency_graph()
+
+        assert project.resources["aws_vpc.main"].state != ObjectState.INCOMPLETE
+        assert {
+            name: obj.state for name, obj in project.all_objects.items()
+        } == before
+
+    def test_keep_attributes(self, tmp_path):
+        """Test that declared attributes survive and the rest are dropped"""
+        root = self._make_project(tmp_path)
+
+        project = TerraformAnalyzer(
+            low_memory=True, keep_attributes={"cidr_block"}
+        ).analyze_project(root)
+        everything = TerraformAnalyzer(
+            low_memory=True, keep_attributes=None
+        ).analyze_project(root)
+
+        assert project.resources["aws_subnet.a"].attributes == {
+            "cidr_block": "10.0.1.0/24"
+        }
+        assert everything.resources["aws_subnet.a"].attributes == (
+            TerraformAnalyzer()
+            .analyze_project(root)
+            .resources["aws_subnet.a"]
+            .attributes
+        )
+
+    def test_roots_match_single_analyses(self, tmp_path):
+        """Test that low-memory roots match their own analyses"""
+        roots = TestAnalyzeMany._make_roots(tmp_path)
+
+        workspace = TerraformAnalyzer(low_memory=True).analyze_many(roots)
+
+        for root in roots:
+            fresh = TerraformAnalyzer(low_memory=True).analyze_project(root)
+            assert TestAnalyzeMany._snapshot(
+                workspace.projects[root]
+            ) == TestAnalyzeMany._snapshot(fresh)
+
+    def test_update_files_is_unavailable(self, tmp_path):
+        """Test that the state update_files needs is not kept"""
+        analyzer = TerraformAnalyzer(low_memory=True)
+        analyzer.analyze_project(self._make_project(tmp_path))
+
+        with pytest.raises(ValueError, match="low_memory"):
+            analyzer.update_files(changed=["main.tf"])
+
 
 class TestDependencyExtractor:
     def test_extractor_initialization(self):
@@ -103,6 +474,61 @@ class TestDependencyExtractor:
         for input_ref, expected in test_cases:
             assert extractor._normalize_reference(input_ref) == expected
 
+    def test_find_matching_objects_uses_prefix_index(self):
+        """Test partial reference lookups and index maintenance"""
+        names = ["data.aws_ami.ubuntu", "data.aws_ami.windows", "data.aws_vpc.main"]
+        extractor = DependencyExtractor(dict.fromkeys(names))
+
+        assert extractor._find_matching_objects("data.aws_ami") == [
+            "data.aws_ami.ubuntu",
+            "data.aws_ami.windows",
+        ]
+        assert extractor._find_matching_objects("data.aws_subnet") == []
+
+        extractor.add_name("data.aws_ami.amazon")
+        extractor.remove_name("data.aws_ami.windows")
+
+        assert extractor._find_matching_objects("data.aws_ami") == [
+            "data.aws_ami.amazon",
+            "data.aws_ami.ubuntu",
+        ]
+        assert "data.aws_ami.windows" not in extractor.defined_names
+
+    def test_extract_references_from_config_tree(self):
+        """Test that references are found in nested string leaves and keys"""
+        extractor = DependencyExtractor({})
+        config = {
+            "name": "${var.prefix}-${local.suffix}",
+            "count": 2,
+            "tags": {"${module.labels.id}": "static"},
+            "policy": [
+                "${data.aws_iam_policy_document.this.json}",
+                {"subnet": "${aws_subnet.private.id}"},
+                "see docs.example.com",
+            ],
+            "self": "${aws_instance.web.id}",
+        }
+
+        references = extractor._extract_references(config, "aws_instance.web")
+
+        assert list(references) == [
+            "var.prefix",
+            "local.suffix",
+            "module.labels",
+            "data.aws_iam_policy_document.this",
+            "data.aws_iam_policy_document",
+            "aws_subnet.private",
+        ]
+
+    def test_extract_references_after_escaped_characters(self):
+        """Test that references after newlines in heredocs are found intact"""
+        extractor = DependencyExtractor({})
+        config = {"user_data": "#!/bin/bash\naws_s3_bucket.logs.id\tvar.region"}
+
+        references = extractor._extract_references(config, None)
+
+        assert list(references) == ["aws_s3_bucket.logs", "var.region"]
+
 
 def test_debug_is_valid_reference():
     """Debug the reference validation"""
@@ -121,22 +547,6 @@ def test_debug_is_valid_reference():
         print(f"  Parts: {ref.split('.')}")
         print(f"  Length: {len(ref.split('.'))}")
 
-    def test_serialize_config(self):
-        """Test config serialization"""
-        extractor = DependencyExtractor({})
-
-        config_dict = {"key": "value", "nested": {"inner": "var.test"}}
-        result = extractor._serialize_config(config_dict)
-        assert "var.test" in result
-
-        config_list = ["var.test1", "var.test2"]
-        result = extractor._serialize_config(config_list)
-        assert "var.test1" in result
-
-        config_str = "var.test"
-        result = extractor._serialize_config(config_str)
-        assert "var.test" in result
-
 
 class TestObjectFactory:
     def test_factory_initialization(self):
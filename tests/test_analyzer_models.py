@@ -32,6 +32,23 @@ class TestDependencyInfo:
         assert not deps.is_unused
         assert not deps.is_isolated
 
+    def test_all_dependencies_cache_follows_writes(self):
+        """Test that all_dependencies is cached and refreshed after changes."""
+        deps = DependencyInfo(
+            explicit_dependencies=["var.region"],
+            implicit_dependencies=["module.network", "module.network"],
+        )
+
+        first = deps.all_dependencies
+        assert first == ("var.region", "module.network")
+        assert deps.all_dependencies is first
+
+        deps.implicit_dependencies.append("aws_vpc.main")
+        assert deps.all_dependencies == ("var.region", "module.network", "aws_vpc.main")
+
+        deps.explicit_dependencies = []
+        assert deps.all_dependencies == ("module.network", "aws_vpc.main")
+
     def test_leaf_object(self):
         """Test object with no dependencies."""
         deps = DependencyInfo(
@@ -0,0 +1,125 @@
+from tfkit.analyzer.modules import ModuleResolver
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+VPC_MODULE = """
+variable "cidr" {}
+variable "name" {
+  default = "vpc"
+}
+resource "aws_vpc" "this" {
+  cidr_block = var.cidr
+}
+output "vpc_id" {
+  value = aws_vpc.this.id
+}
+"""
+
+APP_MODULE = """
+variable "vpc_id" {}
+module "net" {
+  source = "../vpc"
+  cidr   = "10.1.0.0/16"
+}
+resource "aws_instance" "app" {
+  subnet_id = module.net.vpc_id
+  vpc       = var.vpc_id
+}
+"""
+
+ROOT = """
+variable "cidr" {}
+module "network" {
+  source = "../modules/vpc"
+  cidr   = var.cidr
+  bogus  = 1
+}
+module "network2" {
+  source = "../modules/vpc"
+}
+module "app" {
+  source = "../modules/app"
+  vpc_id = module.network.vpc_id
+}
+module "registry" {
+  source = "terraform-aws-modules/vpc/aws"
+}
+module "gone" {
+  source = "../modules/missing"
+}
+"""
+
+
+def make_tree(tmp_path):
+    for path, text in (
+        ("modules/vpc/main.tf", VPC_MODULE),
+        ("modules/app/main.tf", APP_MODULE),
+        ("live/main.tf", ROOT),
+    ):
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text)
+    return TerraformAnalyzer().analyze_project(str(tmp_path / "live"))
+
+
+class TestModuleResolver:
+    def test_each_module_directory_is_analyzed_once(self, tmp_path):
+        """Test that three calls to one module share a single analysis"""
+        resolver = ModuleResolver()
+        tree = resolver.resolve(make_tree(tmp_path))
+
+        assert resolver.analyzed == 2
+        assert sorted(tree.modules) == [
+            str((tmp_path / "modules/app").resolve()),
+            str((tmp_path / "modules/vpc").resolve()),
+        ]
+        assert list(tree.calls) == [
+            "module.network",
+            "module.network2",
+            "module.app",
+            "module.app.module.net",
+            "module.registry",
+            "module.gone",
+        ]
+
+        # Reuse skips unchanged modules and re-analyzes edited ones
+        resolver.resolve(tree.root)
+        assert resolver.analyzed == 2
+        (tmp_path / "modules/vpc/main.tf").write_text(VPC_MODULE + "\n# edited\n")
+        resolver.resolve(tree.root)
+        assert resolver.analyzed == 3
+
+    def test_call_sites_are_linked(self, tmp_path):
+        """Test that inputs and outputs connect callers and child modules"""
+        tree = ModuleResolver().resolve(make_tree(tmp_path))
+        graph = tree.graph
+
+        assert graph["module.network.var.cidr"] == ["var.cidr"]
+        assert graph["module.network.aws_vpc.this"] == ["module.network.var.cidr"]
+        assert graph["module.app.var.vpc_id"] == [
+            "module.network",
+            "module.network.output.vpc_id",
+        ]
+        assert (
+            "module.app.module.net.output.vpc_id"
+            in graph["module.app.aws_instance.app"]
+        )
+        assert (
+            "module.app.aws_instance.app" in tree.dependents()["module.app.var.vpc_id"]
+        )
+
+        network = tree.calls["module.network"]
+        assert network.unknown_inputs == ["bogus"]
+        assert tree.calls["module.network2"].missing_inputs == ["cidr"]
+        assert not tree.calls["module.registry"].is_local
+        assert "not found" in tree.calls["module.gone"].error
+
+    def test_recursive_module_is_reported(self, tmp_path):
+        """Test that a module calling itself stops with an error"""
+        (tmp_path / "main.tf").write_text('module "again" {\n  source = "./"\n}\n')
+
+        tree = ModuleResolver().resolve(
+            TerraformAnalyzer().analyze_project(str(tmp_path))
+        )
+
+        assert tree.calls["module.again"].error == "Module calls itself recursively"
+        assert tree.modules == {}
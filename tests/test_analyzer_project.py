@@ -0,0 +1,262 @@
+import io
+import json
+
+import pytest
+
+from tfkit.analyzer.models import (
+    LocationInfo,
+    ObjectState,
+    ProviderInfo,
+    ResourceType,
+    TerraformObject,
+)
+from tfkit.analyzer.project import TerraformProject
+
+
+def make_object(resource_type, name, file_path="main.tf"):
+    return TerraformObject(
+        type=resource_type,
+        name=name,
+        full_name=f"{resource_type.value}.{name}",
+        location=LocationInfo(file_path, 1),
+    )
+
+
+class TestTerraformProjectViews:
+    def test_collections_are_live_read_only_views(self):
+        """Test that collection properties follow the project without copying"""
+        project = TerraformProject("/tmp/project")
+        resources = project.resources
+        all_objects = project.all_objects
+
+        project.add_object(make_object(ResourceType.RESOURCE, "web"))
+        project.add_object(make_object(ResourceType.VARIABLE, "region"))
+
+        assert list(resources) == ["resource.web"]
+        assert list(all_objects) == ["resource.web", "variable.region"]
+        assert project.resources is resources
+        with pytest.raises(TypeError):
+            resources["resource.db"] = make_object(ResourceType.RESOURCE, "db")
+
+    def test_views_survive_reordering(self):
+        """Test that reordering by files keeps the handed-out views current"""
+        project = TerraformProject("/tmp/project")
+        project.add_object(make_object(ResourceType.RESOURCE, "b", "b.tf"))
+        project.add_object(make_object(ResourceType.RESOURCE, "a", "a.tf"))
+        resources = project.resources
+
+        project.reorder_by_files(["a.tf", "b.tf"])
+
+        assert list(resources) == ["resource.a", "resource.b"]
+
+    def test_snapshot_is_an_independent_copy(self):
+        """Test that snapshot() copies, optionally filtered by type"""
+        project = TerraformProject("/tmp/project")
+        project.add_object(make_object(ResourceType.RESOURCE, "web"))
+        project.add_object(make_object(ResourceType.VARIABLE, "region"))
+
+        snapshot = project.snapshot()
+        variables = project.snapshot(ResourceType.VARIABLE)
+        project.remove_object("resource.web")
+
+        assert list(snapshot) == ["resource.web", "variable.region"]
+        assert list(variables) == ["variable.region"]
+        assert "resource.web" not in project.all_objects
+
+
+def make_ladder(rungs):
+    """Diamond ladder: every rung doubles the number of chains."""
+    project = TerraformProject("/tmp/project")
+    below = ["local.bottom"]
+    project.add_object(make_object(ResourceType.LOCAL, "bottom"))
+    for rung in range(rungs):
+        level = []
+        for side in ("a", "b"):
+            obj = make_object(ResourceType.LOCAL, f"r{rung}{side}")
+            obj.dependency_info.explicit_dependencies = below
+            project.add_object(obj)
+            level.append(obj.full_name)
+        below = level
+    top = make_object(ResourceType.RESOURCE, "top")
+    top.dependency_info.explicit_dependencies = below + ["data.missing"]
+    project.add_object(top)
+    return project
+
+
+class TestDependencyChains:
+    def test_iter_dependency_chains_limits(self):
+        """Test lazy chain enumeration with chain and depth limits"""
+        project = make_ladder(3)
+
+        chains = project.get_dependency_chain("resource.top")
+        assert len(chains) == 2**3 + 1
+        assert chains[0] == [
+            "resource.top",
+            "local.r2a",
+            "local.r1a",
+            "local.r0a",
+            "local.bottom",
+        ]
+        assert chains[-1] == ["resource.top", "data.missing"]
+
+        limited = list(project.iter_dependency_chains("resource.top", max_chains=3))
+        assert limited == chains[:3]
+        assert list(project.iter_dependency_chains("resource.top", max_depth=1)) == [
+            ["resource.top", "data.missing"]
+        ]
+        assert list(project.iter_dependency_chains("resource.none")) == []
+
+    def test_counts_and_extreme_chains_without_enumeration(self):
+        """Test chain counts and shortest/longest chains on a huge ladder"""
+        project = make_ladder(60)
+
+        counts = project.count_dependency_chains()
+        assert counts["resource.top"] == 2**60 + 1
+        assert counts["local.bottom"] == 1
+
+        assert project.shortest_dependency_chain("resource.top") == [
+            "resource.top",
+            "data.missing",
+        ]
+        longest = project.longest_dependency_chain("resource.top")
+        assert len(longest) == 62
+        assert longest[-1] == "local.bottom"
+
+
+class TestCachedResults:
+    def test_serialization_is_reused_until_the_project_changes(self, monkeypatch):
+        """Test that to_dict and validate do their work once per change"""
+        project = TerraformProject("/tmp/project")
+        web = make_object(ResourceType.RESOURCE, "web")
+        web.dependency_info.explicit_dependencies = ["resource.db"]
+        project.add_object(web)
+
+        calls = []
+        find_cycles = project.find_circular_dependencies
+        monkeypatch.setattr(
+            project,
+            "find_circular_dependencies",
+            lambda: calls.append(1) or find_cycles(),
+        )
+
+        first = project.to_dict()
+        second = project.to_dict()
+        assert second["objects"] is first["objects"]
+        assert second["metadata"] is not first["metadata"]
+        assert project.validate() == first["validation"]
+        assert len(calls) == 1
+
+        project.add_object(make_object(ResourceType.RESOURCE, "db"))
+        third = project.to_dict()
+        assert "resource.db" in third["objects"]["resources"]
+        assert third["validation"] == []
+        assert len(calls) == 2
+
+        project.build_dependency_graph()
+        assert project.to_dict()["objects"] is not third["objects"]
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_write_json_matches_to_dict(self, indent):
+        """Test that the streamed export is the to_dict document"""
+        project = TerraformProject("/tmp/project")
+        web = make_object(ResourceType.RESOURCE, "web")
+        web.attributes = {"tags": {"Name": "web"}, "count": 2}
+        project.add_object(web)
+        project.add_object(make_object(ResourceType.VARIABLE, "region"))
+        project.tfvars_files["prod.tfvars"] = {"region": "eu-west-1"}
+
+        out = io.StringIO()
+        project.write_json(out, indent)
+        separators = (",", ":") if indent is None else None
+
+        assert out.getvalue() == json.dumps(
+            project.to_dict(), indent=indent, separators=separators, default=str
+        )
+
+
+def make_resource(resource_type, name, file_path="main.tf"):
+    return TerraformObject(
+        type=ResourceType.RESOURCE,
+        name=name,
+        full_name=f"{resource_type}.{name}",
+        location=LocationInfo(f"/tmp/project/{file_path}", 1),
+        attributes={"name": name},
+        resource_type=resource_type,
+        provider_info=ProviderInfo(resource_type.split("_", 1)[0]),
+    )
+
+
+class TestQuery:
+    @pytest.fixture
+    def project(self):
+        project = TerraformProject("/tmp/project")
+        project.add_object(make_resource("aws_vpc", "main", "network/vpc.tf"))
+        project.add_object(make_resource("google_compute_network", "main"))
+        project.add_object(make_resource("aws_subnet", "a", "network/subnets.tf"))
+        project.add_object(make_resource("aws_subnet", "b", "network/subnets.tf"))
+        project.add_object(
+            make_object(ResourceType.VARIABLE, "cidr", "/tmp/project/main.tf")
+        )
+        return project
+
+    @staticmethod
+    def names(objects):
+        return [obj.full_name for obj in objects]
+
+    def test_single_criteria(self, project):
+        """Test each index on its own"""
+        assert self.names(project.get_objects_by_provider("aws")) == [
+            "aws_vpc.main",
+            "aws_subnet.a",
+            "aws_subnet.b",
+        ]
+        assert self.names(project.get_objects_by_resource_type("aws_subnet")) == [
+            "aws_subnet.a",
+            "aws_subnet.b",
+        ]
+        assert self.names(project.query(type="variable")) == ["variable.cidr"]
+        assert self.names(project.query(state=ObjectState.ISOLATED)) == [
+            "aws_vpc.main",
+            "google_compute_network.main",
+            "aws_subnet.a",
+            "aws_subnet.b",
+        ]
+        assert len(project.query()) == 5
+
+    def test_criteria_are_intersected_in_project_order(self, project):
+        """Test combined criteria and file patterns"""
+        assert self.names(project.query(provider="aws", file_glob="network/*.tf")) == [
+            "aws_vpc.main",
+            "aws_subnet.a",
+            "aws_subnet.b",
+        ]
+        assert (
+            self.names(project.query(resource_type="aws_subnet", file_glob="*vpc.tf"))
+            == []
+        )
+        assert self.names(project.query(file_glob="/tmp/project/main.tf")) == [
+            "google_compute_network.main",
+            "variable.cidr",
+        ]
+        assert self.names(project.query(file_glob="network/vpc.tf")) == ["aws_vpc.main"]
+        assert project.query(provider="azurerm", type=ResourceType.RESOURCE) == []
+
+    def test_indexes_follow_changes(self, project):
+        """Test removal, redeclaration and state invalidation"""
+        project.remove_object("aws_subnet.a")
+        assert self.names(project.query(resource_type="aws_subnet")) == ["aws_subnet.b"]
+
+        # Redeclaring a name under another provider moves it
+        moved = make_resource("aws_subnet", "b")
+        moved.provider_info = ProviderInfo("awscc")
+        project.add_object(moved)
+        assert self.names(project.get_objects_by_provider("awscc")) == ["aws_subnet.b"]
+        assert "aws_subnet.b" not in self.names(project.get_objects_by_provider("aws"))
+
+        assert project.get_objects_by_state(ObjectState.LEAF) == []
+        vpc = project.get_object("aws_vpc.main")
+        vpc.dependency_info.dependent_objects.add("aws_subnet.b")
+        vpc.invalidate_state()
+        project.invalidate_caches()
+        assert project.get_objects_by_state(ObjectState.LEAF) == [vpc]
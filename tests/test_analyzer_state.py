@@ -0,0 +1,74 @@
+from tfkit.analyzer.models import (
+    LocationInfo,
+    ObjectState,
+    ResourceType,
+    TerraformObject,
+)
+from tfkit.analyzer.state import ProjectStateEngine
+
+
+def make_object(resource_type, name, depends_on=()):
+    obj = TerraformObject(
+        type=resource_type,
+        name=name,
+        full_name=f"{resource_type.value}.{name}",
+        location=LocationInfo("main.tf", 1),
+        attributes={"value": name},
+    )
+    obj.dependency_info.explicit_dependencies = list(depends_on)
+    return obj
+
+
+def link(*objects):
+    all_objects = {obj.full_name: obj for obj in objects}
+    for obj in objects:
+        obj.set_all_objects_cache(all_objects)
+        for dep in obj.dependency_info.all_dependencies:
+            if dep in all_objects:
+                all_objects[dep].dependency_info.dependent_objects.add(obj.full_name)
+    return all_objects
+
+
+class TestProjectStateEngine:
+    def test_matches_lazy_computation(self):
+        """Test that bulk states equal the per-object lazy states"""
+        objects = link(
+            make_object(ResourceType.VARIABLE, "region"),
+            make_object(ResourceType.VARIABLE, "spare"),
+            make_object(ResourceType.LOCAL, "a", ["variable.region", "local.b"]),
+            make_object(ResourceType.LOCAL, "b", ["local.a"]),
+            make_object(ResourceType.LOCAL, "c", ["variable.spare", "local.d"]),
+            make_object(ResourceType.LOCAL, "d", ["local.c"]),
+            make_object(ResourceType.PROVIDER, "aws"),
+            make_object(ResourceType.RESOURCE, "web", ["local.b", "provider.aws"]),
+            make_object(ResourceType.OUTPUT, "ip", ["resource.web"]),
+            make_object(ResourceType.OUTPUT, "name", ["local.b"]),
+        )
+        lazy = {name: obj._compute_state() for name, obj in objects.items()}
+
+        ProjectStateEngine(objects).assign_states()
+
+        assert {
+            name: (obj.state, obj.state_reason) for name, obj in objects.items()
+        } == lazy
+        assert objects["variable.region"].state == ObjectState.INPUT
+        assert objects["variable.spare"].state == ObjectState.UNUSED
+
+    def test_long_chains_and_subsets(self):
+        """Test chains deeper than the recursion limit and partial updates"""
+        chain = [make_object(ResourceType.VARIABLE, "start")]
+        for i in range(5000):
+            chain.append(
+                make_object(ResourceType.LOCAL, f"l{i}", [chain[-1].full_name])
+            )
+        chain.append(make_object(ResourceType.RESOURCE, "end", [chain[-1].full_name]))
+        objects = link(*chain)
+
+        engine = ProjectStateEngine(objects)
+        assert all(engine.reaches_infrastructure(["variable.start"]).values())
+
+        engine.assign_states(["variable.start", "local.l42", "missing.name"])
+
+        assert objects["variable.start"].state == ObjectState.INPUT
+        assert objects["local.l42"].state == ObjectState.ACTIVE
+        assert objects["local.l43"]._state is None
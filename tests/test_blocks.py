@@ -0,0 +1,60 @@
+from tfkit.core.blocks import BlockIndex
+
+SOURCE = """\
+# resource "aws_instance" "commented" {
+resource "aws_instance" "web" {
+  ami = data.aws_ami.ubuntu.id
+
+  lifecycle {
+    create_before_destroy = true
+  }
+}
+
+data "aws_region" "current" {}
+
+locals {
+  region = "eu-west-1"
+  tags = {
+    name = "web"
+  }
+}
+
+terraform {
+  required_version = ">= 1.0"
+}
+
+terraform {
+  backend "s3" {}
+}
+"""
+
+
+class TestBlockIndex:
+    def test_blocks_map_to_start_and_end_lines(self):
+        """Test that top-level blocks are found with their brace-counted span"""
+        index = BlockIndex.from_lines(SOURCE.splitlines(keepends=True))
+
+        assert index.find("resource", "aws_instance", "web") == (2, 8)
+        assert index.find("data", "aws_region", "current") == (10, 10)
+        assert index.find("locals") == (12, 17)
+        assert index.end_of(2) == 8
+
+    def test_commented_and_nested_blocks_are_not_indexed(self):
+        """Test that only live top-level headers are indexed"""
+        index = BlockIndex.from_lines(SOURCE.splitlines(keepends=True))
+
+        assert index.find("resource", "aws_instance", "commented") is None
+        assert index.find("lifecycle") is None
+        assert index.find("backend", "s3") is None
+        assert index.end_of(5) is None
+
+    def test_repeated_blocks_and_local_values(self):
+        """Test repeated block occurrences and local value lines"""
+        index = BlockIndex.from_lines(SOURCE.splitlines(keepends=True))
+
+        assert index.find("terraform") == (19, 21)
+        assert index.find("terraform", occurrence=1) == (23, 25)
+        assert index.find("terraform", occurrence=2) is None
+        assert index.find_local("region") == 13
+        assert index.find_local("tags") == 14
+        assert index.find_local("name") is None
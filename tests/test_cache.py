@@ -0,0 +1,67 @@
+import os
+
+from tfkit.core.cache import MemoryParseCache, ParseCache
+
+
+class TestParseCache:
+    def test_round_trip(self, tmp_path):
+        """Test that stored parse results are returned on a later lookup"""
+        cache = ParseCache(tmp_path)
+        key = cache.key_for('variable "region" {}\n')
+        parsed = {"variable": [{"region": {}}]}
+
+        assert cache.get(key) is None
+        cache.put(key, parsed)
+
+        assert ParseCache(tmp_path).get(key) == parsed
+
+    def test_key_depends_on_content(self, tmp_path):
+        """Test that different file contents never share a key"""
+        cache = ParseCache(tmp_path)
+
+        assert cache.key_for("a = 1") != cache.key_for("a = 2")
+        assert cache.key_for("a = 1") == cache.key_for(b"a = 1")
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that unreadable entries are dropped instead of raising"""
+        cache = ParseCache(tmp_path)
+        key = cache.key_for("a = 1")
+        cache.put(key, {"a": 1})
+        entry = cache._entry_path(key)
+        entry.write_text("{not json")
+
+        assert cache.get(key) is None
+        assert not entry.exists()
+
+    def test_prune_evicts_least_recently_used(self, tmp_path):
+        """Test that eviction keeps the most recently used entries"""
+        cache = ParseCache(tmp_path, max_bytes=10**6)
+        keys = [cache.key_for(str(i)) for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, {"value": "x" * 100})
+            stamp = 1_000_000 + age
+            os.utime(cache._entry_path(key), (stamp, stamp))
+
+        cache.get(keys[0])
+        cache.max_bytes = 200
+
+        assert cache.prune() == 2
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is None
+
+
+class TestMemoryParseCache:
+    def test_falls_through_to_backing_cache(self, tmp_path):
+        """Test that misses consult the persistent cache and writes reach it"""
+        backing = ParseCache(tmp_path)
+        cache = MemoryParseCache(backing)
+        key = cache.key_for("a = 1")
+
+        assert key == backing.key_for("a = 1")
+        assert cache.get(key) is None
+        cache.put(key, {"a": 1})
+
+        assert cache.get(key) is cache.get(key)
+        assert MemoryParseCache(ParseCache(tmp_path)).get(key) == {"a": 1}
+        assert (cache.hits, cache.misses) == (2, 1)
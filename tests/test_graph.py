@@ -0,0 +1,116 @@
+from tfkit.core.graph import (
+    cycle_cover,
+    cyclic_components,
+    find_cycles,
+    strongly_connected_components,
+)
+from tfkit.inspector.analyzer import DependencyAnalyzer
+from tfkit.inspector.models import ReferenceDependencyGraph
+
+GRAPH = {
+    "a": ["b"],
+    "b": ["c", "d"],
+    "c": ["a"],
+    "d": ["e"],
+    "e": ["d", "e"],
+    "f": ["a"],
+}
+
+
+def successors(node):
+    return GRAPH.get(node, [])
+
+
+class TestStronglyConnectedComponents:
+    def test_components_in_reverse_topological_order(self):
+        """Test that components come after the components they point to"""
+        components = strongly_connected_components(GRAPH, successors)
+
+        assert [sorted(c) for c in components] == [
+            ["d", "e"],
+            ["a", "b", "c"],
+            ["f"],
+        ]
+
+    def test_cyclic_components_include_self_loops(self):
+        """Test that single nodes count as cyclic only when they point to themselves"""
+        assert cyclic_components(["x"], lambda node: ["x"]) == [["x"]]
+        assert cyclic_components(["x"], lambda node: []) == []
+
+    def test_deep_chain_does_not_recurse(self):
+        """Test that long reference chains stay within the recursion limit"""
+        depth = 5000
+        chain = {i: [i + 1] for i in range(depth)}
+        chain[depth] = [0]
+
+        components = cyclic_components([0], lambda node: chain.get(node, []))
+
+        assert len(components) == 1
+        assert len(components[0]) == depth + 1
+
+
+class TestCycles:
+    def test_cover_gives_every_member_a_cycle_through_it(self):
+        """Test that each node of a component maps to a closed cycle through it"""
+        component = ["a", "b", "c"]
+        cover = cycle_cover(component, successors)
+
+        assert cover["a"] == ["a", "b", "c", "a"]
+        for node, cycle in cover.items():
+            assert node in cycle
+            assert cycle[0] == cycle[-1]
+
+    def test_cover_of_hub_uses_short_cycles(self):
+        """Test that each spoke of a hub gets its own two-edge cycle"""
+        hub = {"h": [f"s{i}" for i in range(100)]}
+        hub.update({f"s{i}": ["h"] for i in range(100)})
+        (component,) = cyclic_components(hub, hub.__getitem__)
+
+        cover = cycle_cover(component, hub.__getitem__)
+
+        assert len(cover) == 101
+        for node, cycle in cover.items():
+            assert len(cycle) == 3
+            assert node in cycle
+
+    def test_find_cycles_reports_every_component(self):
+        """Test that one cycle is reported per component and none are duplicated"""
+        cycles = find_cycles(GRAPH, successors)
+
+        assert cycles == [["d", "e", "d"], ["a", "b", "c", "a"]]
+
+
+class TestInspectorCycles:
+    EDGES = [("a", "b"), ("b", "c"), ("c", "a"), ("d", "d"), ("e", "a")]
+
+    @staticmethod
+    def _normalized(cycles):
+        for cycle in cycles:
+            assert cycle[0] == cycle[-1]
+        return sorted(sorted(cycle[:-1]) + [len(cycle)] for cycle in cycles)
+
+    def test_reference_graph_returns_closed_paths(self):
+        """Test that detect_cycles reports closed paths, self-loops included"""
+        graph = ReferenceDependencyGraph()
+        for reference, depends_on in self.EDGES:
+            graph.add_dependency(reference, depends_on)
+
+        assert self._normalized(graph.detect_cycles()) == [
+            ["a", "b", "c", 4],
+            ["d", 2],
+        ]
+
+    def test_dependency_analyzer_returns_closed_paths(self):
+        """Test that circular dependencies are closed paths, self-loops included"""
+        analyzer = DependencyAnalyzer(module=None)
+        analysis = analyzer.analysis
+        for node, depends_on in self.EDGES:
+            analysis.nodes.setdefault(node, None)
+            analysis.dependency_graph.setdefault(node, set()).add(depends_on)
+
+        analyzer._detect_circular_dependencies()
+
+        assert self._normalized(analysis.circular_dependencies) == [
+            ["a", "b", "c", 4],
+            ["d", 2],
+        ]
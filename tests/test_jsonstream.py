@@ -0,0 +1,59 @@
+import io
+import json
+
+import pytest
+
+from tfkit.core.jsonstream import JSONStreamWriter
+
+DOCUMENT = {
+    "metadata": {"path": "/tmp/x", "count": 2, "when": None},
+    "objects": {
+        "resources": {
+            "aws_s3_bucket.logs": {"tags": {}, "deps": ["a\nb", 1.5, True]},
+            "aws_iam_role.app": {"deps": []},
+        },
+        "empty": {},
+    },
+    "validation": [],
+}
+
+
+def stream(indent):
+    out = io.StringIO()
+    writer = JSONStreamWriter(out, indent)
+    writer.begin_object()
+    writer.value(DOCUMENT["metadata"], "metadata")
+    writer.begin_object("objects")
+    writer.begin_object("resources")
+    for name, value in DOCUMENT["objects"]["resources"].items():
+        writer.value(value, name)
+    writer.end()
+    writer.begin_object("empty")
+    writer.end()
+    writer.end()
+    writer.begin_array("validation")
+    writer.end()
+    writer.end()
+    return out.getvalue()
+
+
+class TestJSONStreamWriter:
+    @pytest.mark.parametrize("indent", [2, 4, 0])
+    def test_matches_json_dumps(self, indent):
+        """Test that streamed text equals json.dumps with the same indent"""
+        assert stream(indent) == json.dumps(DOCUMENT, indent=indent)
+
+    def test_compact_output(self):
+        """Test that indent=None writes without whitespace"""
+        assert stream(None) == json.dumps(DOCUMENT, separators=(",", ":"))
+
+    def test_arrays_and_unserializable_values(self):
+        """Test array items and the str fallback for other types"""
+        out = io.StringIO()
+        writer = JSONStreamWriter(out)
+        writer.begin_array()
+        writer.value({"name": "web"})
+        writer.value(io)
+        writer.end()
+
+        assert json.loads(out.getvalue()) == [{"name": "web"}, str(io)]
@@ -0,0 +1,30 @@
+from tfkit.core.ordered_set import OrderedSet
+
+
+class TestOrderedSet:
+    def test_keeps_insertion_order_without_duplicates(self):
+        """Test that items stay in first-insertion order and repeats are ignored"""
+        items = OrderedSet(["b", "a"])
+        items.append("c")
+        items.extend(["a", "d"])
+
+        assert list(items) == ["b", "a", "c", "d"]
+        assert items == ["b", "a", "c", "d"]
+        assert items == {"a", "b", "c", "d"}
+        assert items[0] == "b"
+        assert items[-2:] == ["c", "d"]
+
+    def test_version_changes_only_on_mutation(self):
+        """Test that the version counter tracks real changes"""
+        items = OrderedSet(["a"])
+        version = items.version
+
+        items.add("a")
+        items.discard("missing")
+        assert items.version == version
+
+        items.add("b")
+        items.discard("a")
+        items.sort(reverse=True)
+        assert items.version == version + 3
+        assert list(items) == ["b"]
@@ -0,0 +1,97 @@
+import tracemalloc
+
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+from tfkit.core.profiling import Profiler
+
+MAIN_TF = """
+resource "aws_vpc" "main" {
+  cidr_block = "10.0.0.0/16"
+}
+
+output "vpc_id" {
+  value = aws_vpc.main.id
+}
+"""
+
+
+def test_nested_phases_accumulate_per_parent():
+    profiler = Profiler()
+    profiler.start()
+    with profiler.phase("parse") as parse:
+        for _ in range(3):
+            with profiler.phase("file") as phase:
+                phase.count("objects", 2)
+        parse.count("files", 3)
+    with profiler.phase("file"):
+        pass
+    profiler.stop()
+
+    records = profiler.records
+    assert [(r.name, r.depth, r.calls) for r in records] == [
+        ("parse", 0, 1),
+        ("file", 1, 3),
+        ("file", 0, 1),
+    ]
+    assert records[1].counts == {"objects": 6}
+    assert records[0].counts == {"files": 3}
+    assert records[0].wall_time >= records[1].wall_time
+    assert records[0].peak_memory is None
+    assert profiler.to_dict()["phases"][1]["calls"] == 3
+
+
+def test_peak_memory_is_kept_by_enclosing_phases():
+    profiler = Profiler(trace_memory=True)
+    profiler.start()
+    with profiler.phase("outer"):
+        with profiler.phase("allocate"):
+            block = bytearray(4 * 1024 * 1024)
+            del block
+        with profiler.phase("small"):
+            pass
+    profiler.stop()
+
+    outer, allocate, small = profiler.records
+    assert allocate.peak_memory >= 4 * 1024 * 1024
+    assert outer.peak_memory >= allocate.peak_memory
+    assert small.peak_memory < allocate.peak_memory
+    assert profiler.peak_memory >= allocate.peak_memory
+    assert not tracemalloc.is_tracing()
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(enabled=False)
+    profiler.start()
+    with profiler.phase("parse") as phase:
+        phase.count("files", 3)
+    profiler.stop()
+
+    assert profiler.records == []
+    assert phase.counts == {}
+
+
+def test_analyzer_reports_phases_and_progress(tmp_path):
+    (tmp_path / "main.tf").write_text(MAIN_TF)
+    (tmp_path / "outputs.tf").write_text('output "name" {\n  value = "x"\n}\n')
+    profiler = Profiler()
+    updates = []
+
+    TerraformAnalyzer(
+        profiler=profiler, progress=lambda *update: updates.append(update)
+    ).analyze_project(str(tmp_path))
+
+    records = {r.name: r for r in profiler.records}
+    assert [r.name for r in profiler.records if r.depth == 1] == [
+        "discover",
+        "parse",
+        "dependencies",
+        "cycles",
+        "states",
+        "tfvars and backend",
+    ]
+    assert records["parse HCL"].calls == 2
+    assert records["parse"].counts == {"files": 2, "objects": 3}
+    assert records["dependencies"].counts == {"edges": 1}
+
+    completed = [update[1] for update in updates]
+    assert completed == sorted(completed)
+    assert updates[-1][1:] == (6, 6)
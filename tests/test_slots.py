@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+from tfkit.analyzer.models import LocationInfo, ResourceType, TerraformObject
+from tfkit.core.slots import lazy_field, slotted
+
+
+@slotted
+@dataclass
+class Record:
+    name: str
+    count: int = 0
+    labels: List[str] = field(default_factory=list)
+    extras: Dict[str, str] = lazy_field(dict)
+
+
+class TestSlotted:
+    def test_instances_have_no_dict(self):
+        """Test that slotted dataclasses keep their dataclass behaviour"""
+        record = Record("a")
+
+        assert not hasattr(record, "__dict__")
+        assert record == Record("a", 0, [], {})
+        assert repr(record) == "Record(name='a', count=0, labels=[], extras={})"
+        with pytest.raises(AttributeError):
+            record.unknown = 1
+
+    def test_lazy_fields_allocate_on_first_read(self):
+        """Test that lazy fields stay unallocated until read"""
+        record = Record("a")
+        assert record._lazy_extras is None
+
+        record.extras["key"] = "value"
+        assert record._lazy_extras == {"key": "value"}
+
+        record.extras = None
+        assert record.extras == {}
+        assert Record("b", extras={"x": "y"}).extras == {"x": "y"}
+
+    def test_models_are_slotted(self):
+        """Test that analyzer models skip unused collections"""
+        obj = TerraformObject(
+            type=ResourceType.RESOURCE,
+            name="web",
+            full_name="aws_instance.web",
+            location=LocationInfo("main.tf", 1),
+        )
+        data = obj.to_dict()
+
+        assert not hasattr(obj, "__dict__")
+        assert data["tags"] == {}
+        assert data["dependencies"]["missing"] == []
+        assert obj._lazy_tags is None
+        assert obj._lazy_metrics is None
+        assert obj.dependency_info._lazy_missing_dependencies is None
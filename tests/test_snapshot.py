@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+import tfkit
+from tfkit.analyzer.project import TerraformProject
+from tfkit.analyzer.snapshot import SnapshotError
+from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+
+MAIN_TF = """
+variable "cidr" {
+  type    = string
+  default = "10.0.0.0/16"
+}
+
+provider "aws" {
+  region = "eu-west-1"
+  alias  = "eu"
+}
+
+resource "aws_vpc" "main" {
+  cidr_block = var.cidr
+  tags = {
+    Name = "main"
+  }
+}
+
+resource "aws_subnet" "a" {
+  vpc_id = aws_vpc.main.id
+  cidr   = local.missing
+}
+
+output "vpc_id" {
+  value = aws_vpc.main.id
+}
+"""
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "main.tf").write_text(MAIN_TF)
+    (root / "prod.tfvars").write_text('cidr = "10.1.0.0/16"\n')
+    return root
+
+
+class TestSnapshot:
+    def test_round_trip(self, project_dir, tmp_path):
+        """Test that a loaded snapshot serializes like the analyzed project"""
+        project = TerraformAnalyzer().analyze_project(str(project_dir))
+        path = tmp_path / "out.tfks"
+        project.write_snapshot(path)
+
+        loaded = TerraformProject.load_snapshot(path)
+
+        assert json.dumps(loaded.to_dict(), default=str) == json.dumps(
+            project.to_dict(), default=str
+        )
+        assert list(loaded.symbols) == list(project.symbols)
+        assert loaded.source_files == project.source_files
+
+        vpc = loaded.get_object("aws_vpc.main")
+        assert vpc.tags is vpc.attributes["tags"]
+        assert vpc.dependency_info.dependent_objects == [
+            "aws_subnet.a",
+            "output.vpc_id",
+        ]
+        assert loaded.providers["provider.aws"].provider_info.provider_alias == "eu"
+
+    def test_loaded_states_match_recomputation(self, project_dir, tmp_path):
+        """Test that restored states are what the graph would give again"""
+        TerraformAnalyzer().analyze_project(str(project_dir)).write_snapshot(
+            tmp_path / "out.tfks"
+        )
+        loaded = TerraformProject.load_snapshot(tmp_path / "out.tfks")
+
+        for obj in loaded.all_objects.values():
+            assert obj._compute_state() == (obj.state, obj.state_reason)
+
+    def test_changed_sources_are_rejected(self, project_dir, tmp_path):
+        """Test that edited, added and removed files make a snapshot stale"""
+        path = tmp_path / "out.tfks"
+        TerraformAnalyzer().analyze_project(str(project_dir)).write_snapshot(path)
+
+        (project_dir / "main.tf").write_text(MAIN_TF + "\n# edited\n")
+        with pytest.raises(SnapshotError, match="main.tf has changed"):
+            TerraformProject.load_snapshot(path)
+        assert TerraformProject.load_snapshot(path, verify=False).get_object(
+            "aws_vpc.main"
+        )
+
+        (project_dir / "main.tf").write_text(MAIN_TF)
+        (project_dir / "extra.tf").write_text('variable "x" {}\n')
+        with pytest.raises(SnapshotError, match=r"\+extra.tf"):
+            TerraformProject.load_snapshot(path)
+
+    def test_other_version_is_rejected(self, project_dir, tmp_path, monkeypatch):
+        """Test the tfkit version check"""
+        path = tmp_path / "out.tfks"
+        TerraformAnalyzer().analyze_project(str(project_dir)).write_snapshot(path)
+
+        monkeypatch.setattr(tfkit, "__version__", "0.0.1")
+        with pytest.raises(SnapshotError, match="written by tfkit"):
+            TerraformProject.load_snapshot(path)
+
+    def test_invalid_files_are_rejected(self, project_dir, tmp_path):
+        """Test that foreign and truncated files raise SnapshotError"""
+        path = tmp_path / "out.tfks"
+        TerraformAnalyzer().analyze_project(str(project_dir)).write_snapshot(path)
+        content = path.read_bytes()
+
+        path.write_bytes(b"{}")
+        with pytest.raises(SnapshotError, match="too short"):
+            TerraformProject.load_snapshot(path)
+
+        path.write_bytes(b"PK\x03\x04" + content[4:])
+        with pytest.raises(SnapshotError, match="Not a tfkit snapshot"):
+            TerraformProject.load_snapshot(path)
+
+        path.write_bytes(content[: len(content) // 2])
+        with pytest.raises(SnapshotError, match="truncated"):
+            TerraformProject.load_snapshot(path)
@@ -0,0 +1,43 @@
+import pytest
+
+from tfkit.core.source import SourceReader
+
+
+class TestSourceReader:
+    def test_file_is_read_once(self, tmp_path):
+        """Test that repeated reads are served from memory and counted once"""
+        path = tmp_path / "main.tf"
+        path.write_text('variable "region" {}\n')
+        reader = SourceReader()
+
+        first = reader.read(str(path))
+        second = reader.read(str(path))
+
+        assert first is second
+        assert first.lines == ['variable "region" {}\n']
+        assert reader.files_opened == 1
+        assert reader.bytes_read == path.stat().st_size
+
+        reader.forget(str(path))
+        reader.read(str(path))
+        assert reader.files_opened == 2
+
+    def test_mmap_and_newlines_match_text_mode(self, tmp_path):
+        """Test that mmap reads and CRLF files match open(..., encoding="utf-8")"""
+        path = tmp_path / "main.tf"
+        path.write_bytes(b'locals {\r\n  name = "caf\xc3\xa9"\r\n}\r\n')
+
+        source = SourceReader(mmap_threshold=1).read(str(path))
+
+        with open(path, encoding="utf-8") as f:
+            assert source.text == f.read()
+        with open(path, encoding="utf-8") as f:
+            assert source.lines == f.readlines()
+
+    def test_unreadable_file_raises(self, tmp_path):
+        """Test that read errors reach the caller and nothing is counted"""
+        reader = SourceReader()
+
+        with pytest.raises(OSError):
+            reader.read(str(tmp_path / "missing.tf"))
+        assert reader.files_opened == 0
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import pytest
+
+import tfkit
+
+# Packages that make startup slow; none may be imported before a command
+# actually needs them
+HEAVY_MODULES = ("hcl2", "lark", "jinja2", "rich", "tfkit.validator", "yaml")
+
+
+def imported_modules(*args):
+    """Modules ``python -X importtime`` reports for ``args``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def heavy(modules):
+    return sorted(
+        module
+        for module in modules
+        if any(
+            module == name or module.startswith(name + ".") for name in HEAVY_MODULES
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import tfkit"),
+        ("-c", "import tfkit.cli"),
+        ("-m", "tfkit.cli", "--version"),
+        ("-m", "tfkit.cli", "validate", "--help"),
+        ("-m", "tfkit.cli", "scan", "--help"),
+    ],
+)
+def test_startup_does_not_import_heavy_modules(args):
+    modules = imported_modules(*args)
+
+    assert "tfkit" in modules
+    assert heavy(modules) == []
+
+
+def test_package_attributes_are_imported_on_access():
+    from tfkit.analyzer.terraform_analyzer import TerraformAnalyzer
+    from tfkit.visualizer.generator import ReportGenerator
+
+    assert tfkit.TerraformAnalyzer is TerraformAnalyzer
+    assert tfkit.ReportGenerator is ReportGenerator
+    assert "TerraformValidator" in dir(tfkit)
+    with pytest.raises(AttributeError):
+        tfkit.NotAnAttribute  # noqa: B018
@@ -0,0 +1,21 @@
+from tfkit.core.symbols import SymbolTable
+
+
+class TestSymbolTable:
+    def test_intern_returns_one_copy(self):
+        """Test that equal strings map to the first copy and a stable ID"""
+        symbols = SymbolTable(["var.region"])
+        first = "".join(["local.", "tags"])
+        second = "".join(["local.", "tags"])
+
+        assert symbols.intern(first) is first
+        assert symbols.intern(second) is first
+        assert symbols.lookup("local.tags") is first
+        assert symbols.lookup("local.other") is None
+        assert "local.other" not in symbols
+
+        assert symbols.id_of("var.region") == 0
+        assert symbols.id_of("local.tags") == 1
+        assert symbols.name_of(1) is first
+        assert list(symbols) == ["var.region", "local.tags"]
+        assert len(symbols) == 2
@@ -0,0 +1,91 @@
+from tfkit.core.walker import FileWalker, parse_ignore_file
+
+
+def touch(root, *paths):
+    for path in paths:
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("")
+
+
+class TestFileWalker:
+    def test_collects_files_and_prunes_directories(self, tmp_path):
+        """Test one walk finds both file kinds and skips cache directories"""
+        touch(
+            tmp_path,
+            "main.tf",
+            "stack.tf.json",
+            "prod.tfvars",
+            "auto.tfvars.json",
+            "modules/vpc/main.tf",
+            "README.md",
+            ".terraform/modules/vpc/main.tf",
+            "node_modules/pkg/main.tf",
+            ".hidden.tf",
+        )
+
+        found = FileWalker().walk(str(tmp_path))
+        top_only = FileWalker().walk(str(tmp_path), recursive=False)
+        custom = FileWalker(ignore_dirs=["modules"]).walk(str(tmp_path))
+
+        assert found.terraform == [
+            str(tmp_path / "main.tf"),
+            str(tmp_path / "modules/vpc/main.tf"),
+            str(tmp_path / "stack.tf.json"),
+        ]
+        assert found.tfvars == [
+            str(tmp_path / "auto.tfvars.json"),
+            str(tmp_path / "prod.tfvars"),
+        ]
+        assert top_only.terraform == [
+            str(tmp_path / "main.tf"),
+            str(tmp_path / "stack.tf.json"),
+        ]
+        assert str(tmp_path / "node_modules/pkg/main.tf") in custom.terraform
+        assert str(tmp_path / "modules/vpc/main.tf") not in custom.terraform
+
+    def test_ignore_files(self, tmp_path):
+        """Test .tfkitignore rules and opt-in .gitignore support"""
+        touch(
+            tmp_path,
+            "main.tf",
+            "generated/a.tf",
+            "generated/keep.tf",
+            "envs/dev/dev.tfvars",
+            "envs/dev/scratch/main.tf",
+            "legacy.tf",
+        )
+        (tmp_path / ".tfkitignore").write_text(
+            "# generated code\ngenerated/\n!generated/keep.tf\n/legacy.tf\n"
+        )
+        (tmp_path / "envs" / ".tfkitignore").write_text("scratch/\n")
+        (tmp_path / ".gitignore").write_text("*.tfvars\n")
+
+        default = FileWalker()
+        with_git = FileWalker(ignore_files=[".gitignore", ".tfkitignore"])
+
+        assert default.walk(str(tmp_path)).terraform == [str(tmp_path / "main.tf")]
+        assert default.walk(str(tmp_path)).tfvars == [
+            str(tmp_path / "envs/dev/dev.tfvars")
+        ]
+        assert with_git.walk(str(tmp_path)).tfvars == []
+
+        assert default.includes(str(tmp_path), str(tmp_path / "main.tf"))
+        assert not default.includes(str(tmp_path), str(tmp_path / "legacy.tf"))
+        assert not default.includes(
+            str(tmp_path), str(tmp_path / "envs/dev/scratch/new.tf")
+        )
+        assert not default.includes(str(tmp_path), str(tmp_path / ".terraform/x.tf"))
+
+    def test_pattern_translation(self):
+        """Test gitignore wildcards, anchoring and directory-only rules"""
+        rules = parse_ignore_file("**/tmp/**\nbuild\ndocs/*.tf\nout/\n[ab].tf\n")
+        tmp, build, docs, out, chars = rules
+
+        assert tmp.matches("x/tmp/y/z.tf", False)
+        assert build.matches("a/b/build", True)
+        assert docs.matches("docs/x.tf", False)
+        assert not docs.matches("a/docs/x.tf", False)
+        assert not docs.matches("docs/a/x.tf", False)
+        assert out.matches("out", True) and not out.matches("out", False)
+        assert chars.matches("a.tf", False) and not chars.matches("c.tf", False)